@@ -0,0 +1,94 @@
+"""
+Compare the memory retained by the assets of a crawl as a list of Asset objects, against
+the same assets added to an AssetTable page by page, and time the filters of the table
+against list comprehensions over the objects.
+
+Run with: python -m benchmarks.bench_asset_table [--assets 200000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from benchmarks.bench_interning_memory import pages
+from benchmarks.bench_json_decoding import best_of
+from benchmarks.generator import CatalogGenerator
+from data360.model import Asset, Page
+from data360.table import AssetTable, parse_date
+
+ASSETS = 200_000
+
+
+def retained(build: Callable[[], object]) -> tuple[object, int]:
+    """Build a collection, returning it with the memory it retains."""
+    gc.collect()
+    tracemalloc.start()
+    collection = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return collection, size
+
+
+def run(assets: int = ASSETS) -> dict[str, float]:
+    contents = list(pages(CatalogGenerator().asset_payloads(assets)))
+
+    def items() -> list[Asset]:
+        return [
+            asset
+            for content in contents
+            for asset in Page[Asset].model_validate_json(content).items
+        ]
+
+    def table() -> AssetTable:
+        return AssetTable.from_objects(
+            asset
+            for content in contents
+            for asset in Page[Asset].model_validate_json(content).items
+        )
+
+    asset_list, list_bytes = retained(items)
+    asset_table, table_bytes = retained(table)
+    assert isinstance(asset_list, list) and isinstance(asset_table, AssetTable)
+    uids = {f"asset-type-{index:06d}" for index in range(0, 100, 10)}
+    start = datetime(2025, 2, 1, tzinfo=UTC)
+    return {
+        "assets": assets,
+        "list_megabytes": list_bytes / 1024 / 1024,
+        "table_megabytes": table_bytes / 1024 / 1024,
+        # timed without tracemalloc, which slows down the allocations
+        "list_build_seconds": best_of(items),
+        "table_build_seconds": best_of(table),
+        "list_filter_seconds": best_of(
+            lambda: [
+                asset
+                for asset in asset_list
+                if asset.asset_type_uid in uids
+                and (date := parse_date(asset.created_on)) is not None
+                and date >= start
+            ]
+        ),
+        "table_filter_seconds": best_of(
+            lambda: asset_table.filter_asset_types(*uids).filter_dates(start)
+        ),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--assets", type=int, default=ASSETS)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    result = run(parse_args().assets)
+    print(
+        f"{result['assets']} assets: list {result['list_megabytes']:.1f} MB "
+        f"built in {result['list_build_seconds']:.2f}s, table "
+        f"{result['table_megabytes']:.1f} MB built in "
+        f"{result['table_build_seconds']:.2f}s; filter by asset types and date: "
+        f"list {result['list_filter_seconds'] * 1000:.1f}ms, "
+        f"table {result['table_filter_seconds'] * 1000:.1f}ms"
+    )
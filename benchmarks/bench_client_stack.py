@@ -0,0 +1,63 @@
+"""
+Crawl the fields of many asset types through the full client stack, served in memory
+with a simulated latency, sequentially then with parallel workers.
+
+Run with: python -m benchmarks.bench_client_stack
+"""
+
+import time
+
+from benchmarks.synthetic import field_payload, page_payload
+from data360.client import Data360Instance
+from data360.model import AssetClass, AssetType
+from data360.transport import InMemoryTransport
+
+ASSET_TYPES = 40
+FIELDS_PER_TYPE = 50
+LATENCY = 0.02
+GENERIC = AssetClass(
+    id=0,
+    value="Generic",
+    name="Generic",
+    description="Generic",
+    allow_comments_on_asset=True,
+)
+
+
+def crawl(api: InMemoryTransport, asset_types: list[AssetType], workers: int) -> float:
+    with Data360Instance(
+        "https://bench.local", "key", "secret", max_workers=workers, transport=api
+    ) as client:
+        client.asset_types = asset_types
+        start = time.perf_counter()
+        fields = client.fields
+        elapsed = time.perf_counter() - start
+    assert len(fields) == len(asset_types) * FIELDS_PER_TYPE
+    return elapsed
+
+
+def run(
+    asset_types: int = ASSET_TYPES,
+    latency: float = LATENCY,
+    workers: tuple[int, ...] = (1, 8),
+) -> dict[int, float]:
+    def fields(params: dict) -> dict:
+        uid = params["AssetTypeUid"]
+        return page_payload([field_payload(i, uid) for i in range(FIELDS_PER_TYPE)])
+
+    api = InMemoryTransport({"/fields": fields}, latency=latency)
+    types = [
+        AssetType.model_construct(
+            uid=f"asset-type-{i}", name=f"Type {i}", asset_class=GENERIC, description=""
+        )
+        for i in range(asset_types)
+    ]
+    return {count: crawl(api, types, count) for count in workers}
+
+
+if __name__ == "__main__":
+    for workers, seconds in run().items():
+        print(
+            f"{workers:>2} workers: {ASSET_TYPES} asset types in {seconds:.3f}s "
+            f"({ASSET_TYPES / seconds:.0f} asset types/s)"
+        )
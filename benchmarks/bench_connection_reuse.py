@@ -0,0 +1,41 @@
+"""
+Compare the pooled keep-alive session of Data360Instance with one connection per request.
+
+Run with: python -m benchmarks.bench_connection_reuse
+"""
+
+import time
+
+from benchmarks.fake_server import FakeData360Server
+from data360.client import Data360Instance
+
+REQUESTS = 500
+
+
+def run(requests_count: int = REQUESTS) -> dict[str, dict[str, float]]:
+    results = {}
+    for label, keep_alive in [("keep_alive", True), ("connection_close", False)]:
+        with FakeData360Server() as server:
+            with Data360Instance(
+                server.url, "key", "secret", keep_alive=keep_alive
+            ) as d360:
+                start = time.perf_counter()
+                for _ in range(requests_count):
+                    d360.http_request("/assets/types")
+                elapsed = time.perf_counter() - start
+            results[label] = {
+                "requests": requests_count,
+                "connections": server.connections,
+                "seconds": elapsed,
+                "requests_per_second": requests_count / elapsed,
+            }
+    return results
+
+
+if __name__ == "__main__":
+    for label, result in run().items():
+        print(
+            f"{label:>16}: {result['requests']} requests over {result['connections']} "
+            f"connection(s) in {result['seconds']:.3f}s "
+            f"({result['requests_per_second']:.0f} req/s)"
+        )
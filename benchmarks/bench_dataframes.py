@@ -0,0 +1,62 @@
+"""
+Compare building a pandas DataFrame of the assets of a crawl from a dict per Asset object,
+against building it from the columns of an AssetTable, in time and in peak memory.
+
+Run with: python -m benchmarks.bench_dataframes [--assets 200000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+import pandas as pd
+
+from benchmarks.bench_json_decoding import best_of
+from benchmarks.generator import CatalogGenerator
+from data360.table import AssetTable
+
+ASSETS = 200_000
+
+
+def peak_bytes(build: Callable[[], object]) -> int:
+    """The peak memory allocated while building an object."""
+    gc.collect()
+    tracemalloc.start()
+    built = build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return peak
+
+
+def run(assets: int = ASSETS) -> dict[str, float]:
+    objects = list(CatalogGenerator().assets(assets))
+    table = AssetTable.from_objects(objects)
+
+    def from_dicts() -> pd.DataFrame:
+        return pd.DataFrame([asset.model_dump() for asset in objects])
+
+    return {
+        "assets": assets,
+        # timed without tracemalloc, which slows down the allocations
+        "dicts_seconds": best_of(from_dicts, rounds=3),
+        "dicts_megabytes": peak_bytes(from_dicts) / 1024 / 1024,
+        "table_seconds": best_of(table.to_pandas, rounds=3),
+        "table_megabytes": peak_bytes(table.to_pandas) / 1024 / 1024,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--assets", type=int, default=ASSETS)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    result = run(parse_args().assets)
+    print(
+        f"{result['assets']} assets: from dicts {result['dicts_seconds']:.2f}s, "
+        f"peak {result['dicts_megabytes']:.1f} MB; from the table "
+        f"{result['table_seconds']:.2f}s, peak {result['table_megabytes']:.1f} MB"
+    )
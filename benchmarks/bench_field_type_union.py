@@ -0,0 +1,55 @@
+"""
+Compare validating a /fields page with the FieldAsset.type union discriminated on its
+type key, against the plain union pydantic tries member by member in smart mode.
+
+Run with: python -m benchmarks.bench_field_type_union
+"""
+
+import json
+from typing import Union
+
+from benchmarks.bench_json_decoding import best_of
+from benchmarks.generator import FIELD_TYPE_VARIANTS, CatalogGenerator
+from benchmarks.synthetic import page_payload
+from data360.model import FieldAsset, Page
+
+FIELDS = 20_000
+
+PlainFieldType = Union[tuple(FIELD_TYPE_VARIANTS)]  # type: ignore[valid-type]  # noqa: UP007
+
+
+class PlainUnionFieldAsset(FieldAsset):
+    """FieldAsset with the plain union of the field types it had before."""
+
+    type: PlainFieldType | None  # type: ignore[assignment,valid-type]
+
+
+def run(fields: int = FIELDS) -> dict[str, float]:
+    content = json.dumps(
+        page_payload(list(CatalogGenerator().field_payloads(fields)))
+    ).encode()
+    discriminated = Page[FieldAsset]
+    plain = Page[PlainUnionFieldAsset]
+    assert [
+        field.model_dump() for field in plain.model_validate_json(content).items
+    ] == [
+        field.model_dump() for field in discriminated.model_validate_json(content).items
+    ]
+    return {
+        "fields": fields,
+        "megabytes": len(content) / 1024 / 1024,
+        "plain_union_seconds": best_of(lambda: plain.model_validate_json(content)),
+        "discriminated_seconds": best_of(
+            lambda: discriminated.model_validate_json(content)
+        ),
+    }
+
+
+if __name__ == "__main__":
+    result = run()
+    print(
+        f"{result['fields']} fields, {result['megabytes']:.1f} MB, "
+        f"plain union {result['plain_union_seconds']:.3f}s, "
+        f"discriminated {result['discriminated_seconds']:.3f}s "
+        f"(x{result['plain_union_seconds'] / result['discriminated_seconds']:.2f})"
+    )
@@ -0,0 +1,135 @@
+"""
+Compare the memory retained by the objects of a crawl, validated page by page, with the
+interning of the models against the same models validated without it: their
+low-cardinality strings interned, their fields sets and asset classes shared.
+
+The fields types nested in the fields share their fields sets in both cases, only the
+fields themselves are validated without interning.
+
+Run with: python -m benchmarks.bench_interning_memory [--objects 200000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Self
+
+from pydantic import BaseModel, Field, model_validator
+
+from benchmarks.generator import CatalogGenerator
+from benchmarks.synthetic import page_payload
+from data360.model import Asset, AssetClass, AssetType, FieldAsset, Page
+
+OBJECTS = 200_000
+PAGE_SIZE = 1000
+
+
+class PlainAsset(Asset):
+    """Asset validated without interning."""
+
+    asset_type_uid: str
+    color: str | None = None
+    data_privacy_type: str | None = None
+    integrity: str | None = None
+    confidentiality: str | None = None
+    qlty_score: str | None = None
+    critical: str | None = None
+    governance_score: str | None = None
+    suggested_critical: str | None = None
+    data_classified_by: str | None = None
+
+    @model_validator(mode="after")
+    def _share_fields_set(self) -> Self:
+        return self
+
+
+class PlainAssetClass(AssetClass):
+    """AssetClass validated without interning."""
+
+    @model_validator(mode="after")
+    def _share_fields_set(self) -> Self:
+        return self
+
+
+class PlainAssetType(AssetType):
+    """AssetType validated without interning, each with its own asset class."""
+
+    asset_class: PlainAssetClass = Field(alias="Class")  # type: ignore[assignment]
+
+    @model_validator(mode="after")
+    def _share_fields_set(self) -> Self:
+        return self
+
+
+class PlainFieldAsset(FieldAsset):
+    """FieldAsset validated without interning."""
+
+    category: str
+    action_type_uid: str | None = None
+    asset_type_uid: str
+    relationship_type_uid: str | None = None
+
+    @model_validator(mode="after")
+    def _share_fields_set(self) -> Self:
+        return self
+
+
+def pages(payloads: Iterable[dict]) -> Iterator[bytes]:
+    payloads = iter(payloads)
+    while items := list(islice(payloads, PAGE_SIZE)):
+        yield json.dumps(page_payload(items)).encode()
+
+
+def retained_bytes(model: type[BaseModel], contents: list[bytes]) -> int:
+    """The memory retained by the objects of the pages once validated."""
+    page_model = Page[model]  # type: ignore[valid-type]
+    gc.collect()
+    tracemalloc.start()
+    objects = [
+        item
+        for content in contents
+        for item in page_model.model_validate_json(content).items
+    ]
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return retained
+
+
+def run(objects: int = OBJECTS) -> dict[str, dict[str, float]]:
+    generator = CatalogGenerator(asset_types=objects)
+    cases: list[tuple[str, type[BaseModel], type[BaseModel], Iterable[dict]]] = [
+        ("asset_types", AssetType, PlainAssetType, generator.asset_type_payloads()),
+        ("assets", Asset, PlainAsset, generator.asset_payloads(objects)),
+        ("fields", FieldAsset, PlainFieldAsset, generator.field_payloads(objects)),
+    ]
+    results = {}
+    for name, model, plain, payloads in cases:
+        contents = list(pages(payloads))
+        results[name] = {
+            "objects": objects,
+            "plain_megabytes": retained_bytes(plain, contents) / 1024 / 1024,
+            "interned_megabytes": retained_bytes(model, contents) / 1024 / 1024,
+        }
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objects", type=int, default=OBJECTS)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    for name, result in run(parse_args().objects).items():
+        plain, interned = result["plain_megabytes"], result["interned_megabytes"]
+        print(
+            f"{name:>11}: {result['objects']} objects, without interning {plain:.1f} MB "
+            f"({plain * 1024 * 1024 / result['objects']:.0f} B each), interned "
+            f"{interned:.1f} MB ({interned * 1024 * 1024 / result['objects']:.0f} B each, "
+            f"-{1 - interned / plain:.0%})"
+        )
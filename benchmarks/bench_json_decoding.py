@@ -0,0 +1,65 @@
+"""
+Compare decoding a page with response.json() then model_validate per item, against
+validating the raw bytes with Page[...].model_validate_json in one pass.
+
+Run with: python -m benchmarks.bench_json_decoding
+"""
+
+import json
+import time
+from collections.abc import Callable
+
+from benchmarks.synthetic import asset_payload, field_payload, page_payload
+from data360.model import Asset, FieldAsset, Page
+
+ASSETS = 20_000
+FIELDS = 5_000
+ROUNDS = 3
+
+
+def best_of(function: Callable[[], object], rounds: int = ROUNDS) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def compare(model: type, content: bytes) -> dict[str, float]:
+    page_model = Page[model]  # type: ignore[valid-type]
+
+    def json_then_validate():
+        return [model.model_validate(item) for item in json.loads(content)["items"]]
+
+    def validate_json():
+        return page_model.model_validate_json(content).items
+
+    assert json_then_validate() == validate_json()
+    return {
+        "megabytes": len(content) / 1024 / 1024,
+        "json_then_validate_seconds": best_of(json_then_validate),
+        "validate_json_seconds": best_of(validate_json),
+    }
+
+
+def run(assets: int = ASSETS, fields: int = FIELDS) -> dict[str, dict[str, float]]:
+    results = {}
+    cases: list[tuple[str, type, Callable[[int], dict], int]] = [
+        ("assets", Asset, asset_payload, assets),
+        ("fields", FieldAsset, field_payload, fields),
+    ]
+    for label, model, build, count in cases:
+        content = json.dumps(page_payload([build(i) for i in range(count)])).encode()
+        results[label] = {"items": count, **compare(model, content)}
+    return results
+
+
+if __name__ == "__main__":
+    for label, result in run().items():
+        print(
+            f"{label:>6}: {result['items']} items, {result['megabytes']:.1f} MB, "
+            f"json+validate {result['json_then_validate_seconds']:.3f}s, "
+            f"validate_json {result['validate_json_seconds']:.3f}s "
+            f"(x{result['json_then_validate_seconds'] / result['validate_json_seconds']:.2f})"
+        )
@@ -0,0 +1,118 @@
+"""
+Crawl a synthetic catalog served by the local fake server, with injected latency, 429s
+and 5xx, and report the throughput and latency percentiles for several worker counts.
+
+Run with: python -m benchmarks.bench_load [--asset-types 40 --workers 1 4 16 ...]
+"""
+
+import argparse
+import math
+import threading
+import time
+from typing import Any
+
+from benchmarks.fake_server import FakeData360Server, Faults
+from benchmarks.synthetic import SyntheticCatalog
+from data360.client import Data360Instance
+from data360.hooks import Hooks
+from data360.retry import RetryPolicy
+
+FAULTS = Faults(latency=0.005, jitter=0.005, rate_429=0.02, rate_5xx=0.02)
+# Short waits, so that the injected failures measure the retries rather than the backoff
+RETRY_POLICY = RetryPolicy(backoff_factor=0.01, max_backoff=0.1)
+
+
+class LatencyHooks(Hooks):
+    """Collects the latency of every request attempt."""
+
+    def __init__(self):
+        self.latencies: list[float] = []
+        self._lock = threading.Lock()
+
+    def on_response(self, request, response, seconds) -> None:
+        with self._lock:
+            self.latencies.append(seconds)
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of the values, 0 when there is none."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def crawl(
+    catalog: SyntheticCatalog, workers: int, faults: Faults, seed: int
+) -> dict[str, Any]:
+    hooks = LatencyHooks()
+    with FakeData360Server(catalog=catalog, faults=faults, seed=seed) as server:
+        with Data360Instance(
+            server.url,
+            "key",
+            "secret",
+            pool_maxsize=max(10, workers),
+            max_workers=workers,
+            retry_policy=RETRY_POLICY,
+            hooks=[hooks],
+        ) as client:
+            start = time.perf_counter()
+            items = len(client.assets) + len(client.fields)
+            elapsed = time.perf_counter() - start
+            retries = client.retry_stats.retries
+        statuses = dict(server.statuses)
+    requests_count = len(hooks.latencies)
+    return {
+        "workers": workers,
+        "requests": requests_count,
+        "retries": retries,
+        "items": items,
+        "seconds": elapsed,
+        "requests_per_second": requests_count / elapsed,
+        "items_per_second": items / elapsed,
+        "p50_ms": percentile(hooks.latencies, 0.50) * 1000,
+        "p99_ms": percentile(hooks.latencies, 0.99) * 1000,
+        "statuses": statuses,
+    }
+
+
+def run(
+    catalog: SyntheticCatalog | None = None,
+    workers: tuple[int, ...] = (1, 4, 16),
+    faults: Faults = FAULTS,
+    seed: int = 0,
+) -> list[dict[str, Any]]:
+    catalog = catalog if catalog is not None else SyntheticCatalog(40, 200, 20)
+    return [crawl(catalog, count, faults, seed) for count in workers]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--asset-types", type=int, default=40)
+    parser.add_argument("--assets-per-type", type=int, default=200)
+    parser.add_argument("--fields-per-type", type=int, default=20)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--latency", type=float, default=FAULTS.latency)
+    parser.add_argument("--jitter", type=float, default=FAULTS.jitter)
+    parser.add_argument("--rate-429", type=float, default=FAULTS.rate_429)
+    parser.add_argument("--rate-5xx", type=float, default=FAULTS.rate_5xx)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    results = run(
+        SyntheticCatalog(args.asset_types, args.assets_per_type, args.fields_per_type),
+        tuple(args.workers),
+        Faults(args.latency, args.jitter, args.rate_429, args.rate_5xx),
+        args.seed,
+    )
+    for result in results:
+        print(
+            f"{result['workers']:>3} workers: {result['requests']} requests "
+            f"({result['retries']} retries), {result['items']} items in "
+            f"{result['seconds']:.2f}s, {result['requests_per_second']:.0f} req/s, "
+            f"{result['items_per_second']:.0f} items/s, "
+            f"p50 {result['p50_ms']:.1f}ms, p99 {result['p99_ms']:.1f}ms"
+        )
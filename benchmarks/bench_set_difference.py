@@ -0,0 +1,100 @@
+"""
+Time set differences of large collections of models, as done by main.py and
+calculate_meta_model_difference, with the key-based equality of the models against
+pydantic's equality comparing every field, nested models included.
+
+The two collections are built by distinct generators, so that their equal objects are
+distinct instances, as when two crawls are compared.
+
+Run with: python -m benchmarks.bench_set_difference [--objects 1000000 --models assets]
+"""
+
+import argparse
+import time
+from collections.abc import Callable, Iterator
+
+from pydantic import BaseModel
+
+from benchmarks.generator import CatalogGenerator
+from data360.model import Asset, FieldAsset, RelationshipType
+
+OBJECTS = 1_000_000
+
+
+class FullEqualityAsset(Asset):
+    __eq__ = BaseModel.__eq__
+    __hash__ = Asset.__hash__
+
+
+class FullEqualityFieldAsset(FieldAsset):
+    __eq__ = BaseModel.__eq__
+    __hash__ = FieldAsset.__hash__
+
+
+class FullEqualityRelationshipType(RelationshipType):
+    __eq__ = BaseModel.__eq__
+    __hash__ = RelationshipType.__hash__
+
+
+def as_full_equality(objects: list, model: type[BaseModel]) -> list:
+    """Swap the class of the objects, the same attributes compared with pydantic's __eq__."""
+    for instance in objects:
+        object.__setattr__(instance, "__class__", model)
+    return objects
+
+
+def set_difference(current: list, target: list) -> tuple[float, int]:
+    start = time.perf_counter()
+    difference = set(current) - set(target)
+    return time.perf_counter() - start, len(difference)
+
+
+CASES: dict[str, tuple[Callable[..., Iterator[BaseModel]], type[BaseModel]]] = {
+    "assets": (CatalogGenerator.assets, FullEqualityAsset),
+    "fields": (CatalogGenerator.fields, FullEqualityFieldAsset),
+    "relationship_types": (
+        CatalogGenerator.relationship_types,
+        FullEqualityRelationshipType,
+    ),
+}
+
+
+def run(
+    objects: int = OBJECTS, models: tuple[str, ...] = tuple(CASES)
+) -> dict[str, dict[str, float]]:
+    results = {}
+    for name in models:
+        build, full_equality = CASES[name]
+        # a tenth of the current objects are not in the target
+        current = list(build(CatalogGenerator(seed=0), objects))
+        target = list(build(CatalogGenerator(seed=0), objects))[objects // 10 :]
+        key_seconds, difference = set_difference(current, target)
+        full_seconds, full_difference = set_difference(
+            as_full_equality(current, full_equality),
+            as_full_equality(target, full_equality),
+        )
+        assert difference == full_difference == objects // 10
+        results[name] = {
+            "objects": objects,
+            "key_equality_seconds": key_seconds,
+            "full_equality_seconds": full_seconds,
+        }
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objects", type=int, default=OBJECTS)
+    parser.add_argument("--models", nargs="+", choices=list(CASES), default=list(CASES))
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    for name, result in run(args.objects, tuple(args.models)).items():
+        print(
+            f"{name:>18}: {result['objects']} objects, key equality "
+            f"{result['key_equality_seconds']:.2f}s, full equality "
+            f"{result['full_equality_seconds']:.2f}s "
+            f"(x{result['full_equality_seconds'] / result['key_equality_seconds']:.2f})"
+        )
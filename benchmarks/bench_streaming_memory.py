@@ -0,0 +1,59 @@
+"""
+Compare the peak memory of decoding a large page at once against streaming its items.
+
+Run with: python -m benchmarks.bench_streaming_memory
+"""
+
+import json
+import tracemalloc
+from collections.abc import Callable, Iterator
+
+from benchmarks.synthetic import asset_payload, page_payload
+from data360.model import Asset, Page
+from data360.streaming import StreamedJsonArray
+
+ASSETS = 50_000
+CHUNK_SIZE = 64 * 1024
+
+
+def peak_memory(function: Callable[[], object]) -> int:
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run(assets: int = ASSETS) -> dict[str, float]:
+    content = json.dumps(
+        page_payload([asset_payload(i) for i in range(assets)])
+    ).encode()
+
+    def chunks() -> Iterator[bytes]:
+        # stands for response.iter_content, the body is not held by the reader
+        for start in range(0, len(content), CHUNK_SIZE):
+            yield content[start : start + CHUNK_SIZE]
+
+    def whole_page():
+        for _ in Page[Asset].model_validate_json(content).items:
+            pass
+
+    def streamed_items():
+        for item in StreamedJsonArray(chunks()):
+            Asset.model_validate_json(item)
+
+    return {
+        "assets": assets,
+        "payload_megabytes": len(content) / 1024 / 1024,
+        "whole_page_peak_megabytes": peak_memory(whole_page) / 1024 / 1024,
+        "streamed_peak_megabytes": peak_memory(streamed_items) / 1024 / 1024,
+    }
+
+
+if __name__ == "__main__":
+    result = run()
+    print(
+        f"{result['assets']} assets ({result['payload_megabytes']:.1f} MB payload): "
+        f"whole page peak {result['whole_page_peak_megabytes']:.1f} MB, "
+        f"streamed peak {result['streamed_peak_megabytes']:.2f} MB"
+    )
@@ -0,0 +1,145 @@
+"""
+Compare validating pages with pydantic against building the same models without any
+validation, as a "trusted" mode would: json.loads, then a builder resolving the aliases,
+nested models and enums of each class once, which either calls model_construct or sets
+the attributes of the instances directly.
+
+pydantic-core validates straight from the JSON bytes in Rust, so the constructions
+written in Python are not faster, which is why the client has no trusted mode.
+
+Run with: python -m benchmarks.bench_trusted_construction
+"""
+
+import json
+from collections.abc import Callable, Iterable
+from enum import Enum
+from functools import cache
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticUndefined
+
+from benchmarks.bench_json_decoding import best_of
+from benchmarks.generator import CatalogGenerator, union_members
+from benchmarks.synthetic import asset_payload, asset_type_payload
+from data360.model import Asset, AssetType, FieldAsset, RelationshipType, field_type_tag
+
+ITEMS = 20_000
+
+
+class Builder:
+    """
+    Builds a model from trusted payloads, its aliases and converters resolved once.
+    """
+
+    def __init__(self, model: type[BaseModel], direct: bool):
+        """
+        :param model: The model built.
+        :param direct: Whether the attributes are set directly, rather than with model_construct.
+        """
+        self.model = model
+        self.direct = direct
+        fields = model.model_fields
+        self.names = {field.alias or name: name for name, field in fields.items()}
+        self.defaults = {
+            name: field.default
+            for name, field in fields.items()
+            if field.default is not PydanticUndefined
+        }
+        # resolved on first use, the builders of the nested models may not exist yet
+        self.converters: dict[str, Callable | None] = {}
+
+    def converter(self, annotation) -> Callable | None:
+        """Resolve how a JSON value becomes its nested model or enum, None to keep it."""
+        members = union_members(annotation)
+        models = [
+            m for m in members if isinstance(m, type) and issubclass(m, BaseModel)
+        ]
+        enums = [m for m in members if isinstance(m, type) and issubclass(m, Enum)]
+        if len(models) > 1:
+            # the only union of models is the one of the field types, keyed by their type
+            by_tag: dict[str | None, Builder] = {
+                field.alias or name: builder(model, self.direct)
+                for model in models
+                for name, field in model.model_fields.items()
+            }
+            search = builder(models[0], self.direct)
+            return lambda value: by_tag.get(field_type_tag(value), search)(value)
+        if models:
+            return builder(models[0], self.direct)
+        return enums[0] if enums else None
+
+    def __call__(self, payload: dict) -> BaseModel:
+        converters = self.converters
+        if not converters:
+            converters.update(
+                (name, self.converter(field.annotation))
+                for name, field in self.model.model_fields.items()
+            )
+        values = {}
+        for key, value in payload.items():
+            name = self.names.get(key)
+            if name is not None:
+                convert = converters[name]
+                values[name] = (
+                    value if convert is None or value is None else convert(value)
+                )
+        if not self.direct:
+            return self.model.model_construct(**values)
+        fields_set = set(values)
+        instance = self.model.__new__(self.model)
+        object.__setattr__(instance, "__dict__", {**self.defaults, **values})
+        object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
+
+@cache
+def builder(model: type[BaseModel], direct: bool) -> Builder:
+    return Builder(model, direct)
+
+
+def compare(model: type[BaseModel], payloads: list[dict]) -> dict[str, float]:
+    content = json.dumps(payloads).encode()
+    adapter: TypeAdapter[list[BaseModel]] = TypeAdapter(list[model])  # type: ignore[valid-type]
+    validated = adapter.validate_json(content)
+    construct, direct = builder(model, False), builder(model, True)
+    assert [construct(payload) for payload in payloads] == validated
+    assert [direct(payload) for payload in payloads] == validated
+    return {
+        "items": len(payloads),
+        "validate_json_seconds": best_of(lambda: adapter.validate_json(content)),
+        "json_loads_seconds": best_of(lambda: json.loads(content)),
+        "model_construct_seconds": best_of(
+            lambda: [construct(payload) for payload in json.loads(content)]
+        ),
+        "direct_seconds": best_of(
+            lambda: [direct(payload) for payload in json.loads(content)]
+        ),
+    }
+
+
+def run(items: int = ITEMS) -> dict[str, dict[str, float]]:
+    generator = CatalogGenerator()
+    cases: list[tuple[type[BaseModel], Iterable[dict]]] = [
+        (Asset, (asset_payload(index) for index in range(items))),
+        (AssetType, (asset_type_payload(index) for index in range(items))),
+        (FieldAsset, generator.field_payloads(items)),
+        (RelationshipType, generator.relationship_type_payloads(items)),
+    ]
+    return {model.__name__: compare(model, list(payloads)) for model, payloads in cases}
+
+
+if __name__ == "__main__":
+    for name, result in run().items():
+        per_item = {
+            key.removesuffix("_seconds"): value / result["items"] * 1e6
+            for key, value in result.items()
+            if key.endswith("_seconds")
+        }
+        print(
+            f"{name:>16}: validate_json {per_item['validate_json']:.1f}us, "
+            f"json.loads alone {per_item['json_loads']:.1f}us, then "
+            f"model_construct {per_item['model_construct']:.1f}us, "
+            f"direct {per_item['direct']:.1f}us per item"
+        )
@@ -0,0 +1,158 @@
+"""
+Local stand-in for the Data360 API, used by the benchmarks.
+"""
+
+import json
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Self
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.synthetic import SyntheticCatalog
+
+API_PATH = "/api/v2"
+DEFAULT_PAGE_SIZE = 200
+
+
+@dataclass(frozen=True)
+class Faults:
+    """
+    Latency and errors injected in the responses of the fake server.
+    """
+
+    latency: float = 0.0  # Seconds added to every response
+    jitter: float = 0.0  # Up to this many seconds added at random
+    rate_429: float = 0.0  # Fraction of the requests answered 429
+    rate_5xx: float = 0.0  # Fraction of the requests answered 503
+    retry_after: float | None = 0.0  # Retry-After of the 429, None to leave it out
+
+
+class FakeData360Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 is required for the connections to be kept alive between requests
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, avoid the delayed ACK stall on reused connections
+    disable_nagle_algorithm = True
+
+    server: "FakeData360Server"
+
+    def do_GET(self) -> None:
+        status, delay = self.server.draw_fault()
+        if delay:
+            time.sleep(delay)
+        if status is not None:
+            headers = {}
+            if status == 429 and self.server.faults.retry_after is not None:
+                headers["Retry-After"] = str(self.server.faults.retry_after)
+            self.send_json(status, {"message": "Injected failure"}, headers)
+            return
+        if self.server.catalog is None:
+            self.send_json(200, self.server.payload)
+            return
+        url = urlsplit(self.path)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        payload = self.route(url.path.removeprefix(API_PATH), query)
+        if payload is None:
+            self.send_json(404, {"message": "Not Found"})
+        else:
+            self.send_json(200, payload)
+
+    def route(self, path: str, query: dict[str, str]) -> dict | list | None:
+        """Build the payload of an API path from the catalog, None when unknown."""
+        catalog = self.server.catalog
+        assert catalog is not None
+        page_size = int(query.get("pageSize", DEFAULT_PAGE_SIZE))
+        page_num = int(query.get("pageNum", 1))
+        if path == "/assets/classes":
+            return catalog.asset_classes_payload()
+        if path == "/assets/types":
+            return catalog.asset_types_payload()
+        if path == "/fields":
+            return catalog.fields_page(
+                query.get("AssetTypeUid", ""), page_size, page_num
+            )
+        uid = path.removeprefix("/assets/")
+        if uid != path and "/" not in uid:
+            return catalog.assets_page(uid, page_size, page_num)
+        return None
+
+    def send_json(
+        self, status: int, payload: dict | list, headers: dict | None = None
+    ) -> None:
+        body = json.dumps(payload).encode()
+        self.server.record_status(status)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        """Silence the default access log written on stderr."""
+
+
+class FakeData360Server(ThreadingHTTPServer):
+    """
+    Serves a synthetic catalog on the Data360 API paths, or a canned payload on every GET
+    when no catalog is given, and counts the TCP connections it accepts.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        payload: dict | list | None = None,
+        port: int = 0,
+        catalog: SyntheticCatalog | None = None,
+        faults: Faults | None = None,
+        seed: int | None = None,
+    ):
+        super().__init__(("127.0.0.1", port), FakeData360Handler)
+        self.payload = payload if payload is not None else {"items": []}
+        self.catalog = catalog
+        self.faults = faults if faults is not None else Faults()
+        self.connections = 0
+        self.statuses: Counter = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+
+    def get_request(self):
+        request = super().get_request()
+        with self._lock:
+            self.connections += 1
+        return request
+
+    def draw_fault(self) -> tuple[int | None, float]:
+        """Draw the injected status (None for none) and delay of a request."""
+        faults = self.faults
+        with self._lock:
+            draw = self._random.random()
+            delay = faults.latency + self._random.uniform(0, faults.jitter)
+        if draw < faults.rate_429:
+            return 429, delay
+        if draw < faults.rate_429 + faults.rate_5xx:
+            return 503, delay
+        return None, delay
+
+    def record_status(self, status: int) -> None:
+        with self._lock:
+            self.statuses[status] += 1
+
+    def __enter__(self) -> Self:
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,327 @@
+"""
+Bulk generator of synthetic Data360 catalogs, for scale and memory tests.
+
+Unlike the factories of tests/model_factory.py, the objects are derived from templates
+built and validated once, so that hundreds of thousands of payloads and models are
+produced per second. The output only depends on the seed. The payloads can be streamed
+to disk as NDJSON.
+
+Run with: python -m benchmarks.generator --assets 1000000 --output catalog/
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import types
+import typing
+from collections.abc import Iterable, Iterator
+from enum import Enum
+from functools import cache
+
+from pydantic import BaseModel
+
+from benchmarks.synthetic import (
+    ASSET_KEYS,
+    asset_class_payload,
+    asset_payload,
+    asset_type_payload,
+    asset_type_uid,
+    asset_values,
+)
+from data360.model import (
+    Asset,
+    AssetClass,
+    AssetType,
+    Cardinality,
+    FieldAsset,
+    RelationshipType,
+)
+
+BaseModelT = typing.TypeVar("BaseModelT", bound=BaseModel)
+
+CATEGORIES = ["Custom", "System", "Governance", "Technical", "Business"]
+STATES = ["Active", "Inactive"]
+
+
+def union_members(annotation) -> list:
+    """Flatten an annotation into the members of its unions, Annotated and None removed."""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Annotated:
+        return union_members(typing.get_args(annotation)[0])
+    if origin in (typing.Union, types.UnionType):
+        return [
+            member
+            for argument in typing.get_args(annotation)
+            for member in union_members(argument)
+        ]
+    return [] if annotation is type(None) else [annotation]
+
+
+def sample_value(annotation) -> object:
+    """Build a JSON value accepted by an annotation, nested models included."""
+    members = union_members(annotation)
+    annotation = members[0] if members else None
+    origin = typing.get_origin(annotation) or annotation
+    if isinstance(origin, type) and issubclass(origin, BaseModel):
+        return sample_payload(origin)
+    if isinstance(origin, type) and issubclass(origin, Enum):
+        return next(iter(origin)).value
+    return {bool: True, int: 1, float: 1.5, str: "string", dict: {}, list: []}.get(
+        origin
+    )
+
+
+@cache
+def sample_payload(model: type[BaseModel]) -> dict:
+    """Build a payload of a model, keyed by the aliases of its fields, once per model."""
+    return {
+        field.alias or name: sample_value(field.annotation)
+        for name, field in model.model_fields.items()
+    }
+
+
+def from_template(template: BaseModelT, values: dict) -> BaseModelT:
+    """
+    Build a copy of a validated model with some of its field values replaced, without
+    validation nor the alias and default handling of model_construct.
+    :param template: The validated model copied.
+    :param values: The values replaced, keyed by field name, trusted to be valid.
+    :return: The new model.
+    """
+    model = object.__new__(type(template))
+    fields = template.__dict__.copy()
+    fields.update(values)
+    object.__setattr__(model, "__dict__", fields)
+    object.__setattr__(
+        model, "__pydantic_fields_set__", template.__pydantic_fields_set__.copy()
+    )
+    object.__setattr__(model, "__pydantic_extra__", template.__pydantic_extra__)
+    object.__setattr__(model, "__pydantic_private__", template.__pydantic_private__)
+    return model
+
+
+# Every variant of FieldAsset.type
+FIELD_TYPE_VARIANTS: list[type[BaseModel]] = union_members(
+    FieldAsset.model_fields["type"].annotation
+)
+
+
+class CatalogGenerator:
+    """
+    Deterministic generator of Data360 payloads and models.
+    The asset types are the ones of benchmarks.synthetic, the assets and fields are
+    spread over the first `asset_types` of them, and the fields cycle over every
+    variant of FieldAsset.type.
+    """
+
+    def __init__(self, seed: int = 0, asset_types: int = 100):
+        self.seed = seed
+        self.asset_types_count = asset_types
+        rng = random.Random(seed)
+        self._variants = list(FIELD_TYPE_VARIANTS)
+        rng.shuffle(self._variants)
+        self._variant_payloads = [sample_payload(model) for model in self._variants]
+        self._asset_classes = [
+            AssetClass.model_validate(asset_class_payload(index)) for index in range(6)
+        ]
+        # interned like the validation of the models does
+        self._asset_type_uids = [
+            sys.intern(asset_type_uid(index)) for index in range(asset_types)
+        ]
+
+    def _random(self, stream: str) -> random.Random:
+        """Random generator of an object stream, independent of the other streams."""
+        return random.Random(f"{self.seed}-{stream}")
+
+    # Payloads, shaped like the API responses
+
+    def asset_type_payloads(self, count: int | None = None) -> Iterator[dict]:
+        for index in range(self.asset_types_count if count is None else count):
+            yield asset_type_payload(index)
+
+    def asset_payloads(self, count: int) -> Iterator[dict]:
+        rng = self._random("assets")
+        for index in range(count):
+            yield asset_payload(index, index % self.asset_types_count, rng)
+
+    def field_payloads(self, count: int) -> Iterator[dict]:
+        """The payloads of the fields. Their "Type" is shared, do not modify it."""
+        rng = self._random("fields")
+        variants = len(self._variants)
+        for index in range(count):
+            yield {
+                "Name": f"field_{index}",
+                "FriendlyName": f"Field {index}",
+                "Category": CATEGORIES[rng.randrange(len(CATEGORIES))],
+                "ActionTypeUid": None,
+                "AssetTypeUid": asset_type_uid(index % self.asset_types_count),
+                "RelationshipTypeUid": None,
+                "Id": index,
+                "Type": self._variant_payloads[index % variants],
+            }
+
+    def relationship_type_payloads(self, count: int) -> Iterator[dict]:
+        rng = self._random("relationship_types")
+        for index in range(count):
+            subject = rng.randrange(self.asset_types_count)
+            object_ = rng.randrange(self.asset_types_count)
+            yield {
+                "Id": index,
+                "Uid": f"relationship-type-{index:06d}",
+                "State": STATES[index % len(STATES)],
+                "IsSystem": False,
+                "Predicate": {
+                    "Uid": f"predicate-{index:06d}",
+                    "Name": f"relates to {index}",
+                    "Inverse": f"is related by {index}",
+                    "Type": {
+                        "Type": "Custom",
+                        "Name": "Custom",
+                        "Description": "Custom predicate.",
+                    },
+                    "IsSystem": False,
+                    "IsInUse": True,
+                },
+                "Subject": asset_type_payload(subject),
+                "SubjectCardinality": rng.choice(list(Cardinality)).value,
+                "Object": asset_type_payload(object_),
+                "ObjectCardinality": rng.choice(list(Cardinality)).value,
+            }
+
+    # Models, copied from templates validated once, then patched without validation
+
+    def asset_types(self, count: int | None = None) -> Iterator[AssetType]:
+        template = AssetType.model_validate(asset_type_payload(0))
+        for index in range(self.asset_types_count if count is None else count):
+            yield from_template(
+                template,
+                {
+                    "id": index,
+                    "uid": asset_type_uid(index),
+                    "name": f"Asset Type {index}",
+                    "asset_class": self._asset_classes[
+                        index % len(self._asset_classes)
+                    ],
+                    "description": f"Synthetic asset type {index}.",
+                    "path": f"Asset Type {index}",
+                },
+            )
+
+    def assets(self, count: int) -> Iterator[Asset]:
+        """The assets of asset_payloads."""
+        template = Asset.model_validate(asset_payload(0))
+        aliases = {field.alias: name for name, field in Asset.model_fields.items()}
+        names = [aliases[key] for key in ASSET_KEYS]
+        asset_type_uids = self._asset_type_uids
+        rng = self._random("assets")
+        for index in range(count):
+            asset_type = index % self.asset_types_count
+            values = dict(zip(names, asset_values(index, asset_type, rng)))
+            values["asset_type_uid"] = asset_type_uids[asset_type]
+            yield from_template(template, values)
+
+    def fields(self, count: int) -> Iterator[FieldAsset]:
+        """The fields of field_payloads, sharing the models of their types."""
+        payload = next(self.field_payloads(1))
+        templates = [
+            FieldAsset.model_validate({**payload, "Type": variant})
+            for variant in self._variant_payloads
+        ]
+        asset_type_uids = self._asset_type_uids
+        rng = self._random("fields")
+        variants = len(templates)
+        for index in range(count):
+            yield from_template(
+                templates[index % variants],
+                {
+                    "name": f"field_{index}",
+                    "friendly_name": f"Field {index}",
+                    "category": CATEGORIES[rng.randrange(len(CATEGORIES))],
+                    "asset_type_uid": asset_type_uids[index % self.asset_types_count],
+                    "id": index,
+                },
+            )
+
+    def relationship_types(self, count: int) -> Iterator[RelationshipType]:
+        """The relationship types of relationship_type_payloads, sharing their asset types."""
+        asset_types = list(self.asset_types())
+        template = RelationshipType.model_validate(
+            next(self.relationship_type_payloads(1))
+        )
+        predicate = template.predicate
+        cardinalities = list(Cardinality)
+        rng = self._random("relationship_types")
+        for index in range(count):
+            subject = asset_types[rng.randrange(self.asset_types_count)]
+            object_ = asset_types[rng.randrange(self.asset_types_count)]
+            yield from_template(
+                template,
+                {
+                    "id": index,
+                    "uid": f"relationship-type-{index:06d}",
+                    "state": STATES[index % len(STATES)],
+                    "predicate": from_template(
+                        predicate,
+                        {
+                            "uid": f"predicate-{index:06d}",
+                            "name": f"relates to {index}",
+                            "inverse": f"is related by {index}",
+                        },
+                    ),
+                    "subject": subject,
+                    "subject_cardinality": rng.choice(cardinalities),
+                    "object": object_,
+                    "object_cardinality": rng.choice(cardinalities),
+                },
+            )
+
+
+def write_ndjson(path: str, payloads: Iterable[dict]) -> int:
+    """
+    Stream payloads to a file, one JSON document per line.
+    :param path: The file to write.
+    :param payloads: The payloads, consumed one at a time.
+    :return: The number of payloads written.
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as file:
+        for payload in payloads:
+            file.write(json.dumps(payload, separators=(",", ":")))
+            file.write("\n")
+            count += 1
+    return count
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default="synthetic_catalog")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--asset-types", type=int, default=1_000)
+    parser.add_argument("--assets", type=int, default=1_000_000)
+    parser.add_argument("--fields", type=int, default=100_000)
+    parser.add_argument("--relationship-types", type=int, default=10_000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    os.makedirs(args.output, exist_ok=True)
+    generator = CatalogGenerator(args.seed, args.asset_types)
+    for name, payloads in [
+        ("asset_types", generator.asset_type_payloads()),
+        ("assets", generator.asset_payloads(args.assets)),
+        ("fields", generator.field_payloads(args.fields)),
+        (
+            "relationship_types",
+            generator.relationship_type_payloads(args.relationship_types),
+        ),
+    ]:
+        start = time.perf_counter()
+        count = write_ndjson(os.path.join(args.output, f"{name}.ndjson"), payloads)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:>18}: {count} written in {elapsed:.2f}s ({count / elapsed:.0f}/s)"
+        )
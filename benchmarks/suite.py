@@ -0,0 +1,262 @@
+"""
+Benchmark suite of the client: model validation, crawl aggregation over an in-memory
+transport, meta-model diffs, synthetic catalog generation and import time. The results are written as JSON and checked
+against regression thresholds, and optionally against the results of a previous run.
+
+Run with: python -m benchmarks.suite [--quick] [--output results.json] [--baseline previous.json]
+The exit code is 1 when a case regressed.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from benchmarks.bench_json_decoding import best_of
+from benchmarks.generator import CatalogGenerator
+from benchmarks.synthetic import (
+    SyntheticCatalog,
+    asset_payload,
+    asset_type_payload,
+    field_payload,
+    page_payload,
+)
+from data360.client import ASSET_TYPES_ADAPTER, Data360Instance
+from data360.meta_model import MetaModel
+from data360.model import Asset, FieldAsset, LazyFieldAsset, Page
+from data360.operations import calculate_meta_model_difference
+from data360.transport import InMemoryTransport
+
+THRESHOLDS_PATH = os.path.join(os.path.dirname(__file__), "thresholds.json")
+# A case regresses when it is this much slower per item than in the baseline
+DEFAULT_TOLERANCE = 1.25
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    Represents a benchmark case: a function timed over a number of items.
+    """
+
+    name: str
+    items: int
+    function: Callable[[], object]
+    rounds: int = 3
+
+
+def validation_case(name: str, parse: Callable[[bytes], list], payload) -> Case:
+    content = json.dumps(payload).encode()
+    items = len(payload["items"]) if isinstance(payload, dict) else len(payload)
+    return Case(name, items, lambda: parse(content))
+
+
+def crawl_case(name: str, catalog: SyntheticCatalog, aggregation: str) -> Case:
+    def asset_types(params: dict) -> list[dict]:
+        return catalog.asset_types_payload()
+
+    def assets(params: dict, uid: str) -> dict:
+        return catalog.assets_page(uid, params["pageSize"], params["pageNum"])
+
+    def fields(params: dict) -> dict:
+        return catalog.fields_page(
+            params["AssetTypeUid"], params["pageSize"], params["pageNum"]
+        )
+
+    api = InMemoryTransport(
+        {"/assets/types": asset_types, "/fields": fields, "/assets/{uid}": assets}
+    )
+
+    def crawl() -> int:
+        with Data360Instance(
+            "https://bench.local", "key", "secret", max_workers=8, transport=api
+        ) as client:
+            return len(getattr(client, aggregation))
+
+    items = crawl()
+    return Case(name, items, crawl)
+
+
+def meta_model_diff_case(asset_types: int) -> Case:
+    # the target renames a tenth of the asset types of the current meta model
+    current = ASSET_TYPES_ADAPTER.validate_python(
+        [asset_type_payload(index) for index in range(asset_types)]
+    )
+    renamed = [
+        asset_type_payload(index + asset_types) for index in range(0, asset_types, 10)
+    ]
+    target = [
+        asset_type for index, asset_type in enumerate(current) if index % 10
+    ] + ASSET_TYPES_ADAPTER.validate_python(renamed)
+    return Case(
+        f"meta_model_diff_{asset_types // 1000}k",
+        asset_types,
+        lambda: calculate_meta_model_difference(
+            MetaModel(asset_types=target), MetaModel(asset_types=current)
+        ),
+    )
+
+
+def generation_case(name: str, generate: Callable[[int], Iterable], items: int) -> Case:
+    # the models are dropped as soon as they are built, only their generation is timed
+    return Case(name, items, lambda: deque(generate(items), maxlen=0))
+
+
+def import_time() -> float:
+    """Import data360.model in a fresh interpreter and return the time it took."""
+    code = (
+        "import time; start = time.perf_counter(); import data360.model; "
+        "print(time.perf_counter() - start)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+    return float(output)
+
+
+def cases(quick: bool = False) -> list[Case]:
+    scale = 10 if quick else 1
+    meta_model_sizes = [1_000, 10_000] if quick else [1_000, 10_000, 100_000]
+    assets = [asset_payload(index) for index in range(20_000 // scale)]
+    fields = [field_payload(index) for index in range(5_000 // scale)]
+    asset_types = [asset_type_payload(index) for index in range(5_000 // scale)]
+    generator = CatalogGenerator()
+    return [
+        validation_case(
+            "validate_assets_json",
+            lambda content: Page[Asset].model_validate_json(content).items,
+            page_payload(assets),
+        ),
+        validation_case(
+            "validate_asset_types_json",
+            ASSET_TYPES_ADAPTER.validate_json,
+            asset_types,
+        ),
+        validation_case(
+            "validate_fields_json",
+            lambda content: Page[FieldAsset].model_validate_json(content).items,
+            page_payload(fields),
+        ),
+        validation_case(
+            "validate_lazy_fields_json",
+            lambda content: Page[LazyFieldAsset].model_validate_json(content).items,
+            page_payload(fields),
+        ),
+        crawl_case(
+            "crawl_assets_in_memory",
+            SyntheticCatalog(asset_types=100 // scale, assets_per_type=500),
+            "assets",
+        ),
+        crawl_case(
+            "crawl_fields_in_memory",
+            SyntheticCatalog(asset_types=100 // scale, fields_per_type=100),
+            "fields",
+        ),
+        *(meta_model_diff_case(size) for size in meta_model_sizes),
+        generation_case("generate_assets", generator.assets, 100_000 // scale),
+        generation_case("generate_fields", generator.fields, 100_000 // scale),
+        generation_case(
+            "generate_relationship_types",
+            generator.relationship_types,
+            20_000 // scale,
+        ),
+    ]
+
+
+def run(quick: bool = False) -> dict:
+    results = {}
+    for case in cases(quick):
+        seconds = best_of(case.function, case.rounds)
+        results[case.name] = {
+            "items": case.items,
+            "seconds": seconds,
+            "us_per_item": seconds / case.items * 1e6,
+        }
+    seconds = min(import_time() for _ in range(3))
+    results["import_data360_model"] = {
+        "items": 1,
+        "seconds": seconds,
+        "us_per_item": seconds * 1e6,
+    }
+    return {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def regressions(
+    report: dict,
+    thresholds: dict[str, float],
+    baseline: dict | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """
+    List the cases slower than their threshold, or than the baseline beyond the tolerance.
+    :param report: The report of the run.
+    :param thresholds: The maximum microseconds per item of each case.
+    :param baseline: The report of a previous run to compare with.
+    :param tolerance: The slowdown allowed against the baseline, as a ratio.
+    :return: A description of each regression.
+    :raise ValueError: When the baseline was run at other sizes.
+    """
+    if baseline is not None and baseline.get("quick") != report.get("quick"):
+        raise ValueError("The baseline was run at other sizes, see --quick")
+    found = []
+    for name, result in report["results"].items():
+        maximum = thresholds.get(name)
+        if maximum is not None and result["us_per_item"] > maximum:
+            found.append(
+                f"{name}: {result['us_per_item']:.2f}us per item, above the "
+                f"{maximum:.2f}us threshold"
+            )
+        previous = (baseline or {}).get("results", {}).get(name)
+        if previous is not None and result["us_per_item"] > (
+            previous["us_per_item"] * tolerance
+        ):
+            found.append(
+                f"{name}: {result['us_per_item']:.2f}us per item, "
+                f"x{result['us_per_item'] / previous['us_per_item']:.2f} the baseline"
+            )
+    return found
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="smaller sizes")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="results of a previous run to compare with")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--thresholds", default=THRESHOLDS_PATH)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = run(args.quick)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    with open(args.thresholds, encoding="utf-8") as file:
+        thresholds = json.load(file)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    for name, result in report["results"].items():
+        print(
+            f"{name:>26}: {result['items']:>7} items in {result['seconds']:.4f}s "
+            f"({result['us_per_item']:.2f}us per item)"
+        )
+    found = regressions(report, thresholds, baseline, args.tolerance)
+    for regression in found:
+        print(f"REGRESSION {regression}")
+    print(f"Results written to {args.output}")
+    sys.exit(1 if found else 0)
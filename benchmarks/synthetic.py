@@ -0,0 +1,225 @@
+"""
+Synthetic Data360 API payloads, shaped like the ones of tests/conftest.py.
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+# The assets are created, then updated, between these dates
+FIRST_DATE = datetime(2022, 1, 1)
+LAST_DATE = datetime(2025, 2, 6, 16, 25, 44, 717000)
+# The span of the dates, in milliseconds, and their days formatted once
+DATES_SPAN = (LAST_DATE - FIRST_DATE) // timedelta(milliseconds=1)
+DAYS = [
+    (FIRST_DATE + timedelta(days=day)).date().isoformat()
+    for day in range((LAST_DATE - FIRST_DATE).days + 1)
+]
+# The "HH:MM" of every minute of a day, and the "SS.fff" of every millisecond of a minute
+MINUTES = [f"{minute // 60:02d}:{minute % 60:02d}" for minute in range(24 * 60)]
+SECONDS = [f"{second // 1000:02d}.{second % 1000:03d}" for second in range(60_000)]
+LEVELS = ["Low", "Medium", "High"]
+CRITICAL = ["Yes", "No"]
+SCORES = [str(score) for score in range(101)]
+
+# (ID, Value, Name) of the asset classes, as served by /assets/classes
+ASSET_CLASSES = [
+    (1, "BusinessAsset", "Business Asset"),
+    (8, "TechnicalAsset", "TechnicalAsset"),
+    (6, "Reference", "Reference"),
+    (7, "Rule", "Rule"),
+    (0, "Generic", "Generic"),
+    (11, "User", "User"),
+]
+
+
+def asset_class_payload(index: int) -> dict:
+    class_id, value, name = ASSET_CLASSES[index % len(ASSET_CLASSES)]
+    return {
+        "ID": class_id,
+        "Value": value,
+        "Name": name,
+        "Description": f"{name} asset.",
+        "AllowCommentsOnAsset": True,
+    }
+
+
+def asset_type_uid(index: int) -> str:
+    return f"asset-type-{index:06d}"
+
+
+def asset_type_payload(index: int) -> dict:
+    return {
+        "uid": asset_type_uid(index),
+        "ID": index,
+        "Name": f"Asset Type {index}",
+        "Class": asset_class_payload(index),
+        "Description": f"Synthetic asset type {index}.",
+        "Hierarchical": False,
+        "Path": f"Asset Type {index}",
+        "IconStyle": {"ForeColor": "#000000", "BackColor": "#ffffff", "Icon": "box"},
+    }
+
+
+def iso_date(milliseconds: int) -> str:
+    """Format a date, in milliseconds since FIRST_DATE, like the API."""
+    day, milliseconds = divmod(milliseconds, 86_400_000)
+    minute, milliseconds = divmod(milliseconds, 60_000)
+    return f"{DAYS[day]}T{MINUTES[minute]}:{SECONDS[milliseconds]}Z"
+
+
+# The keys of asset_payload, in the order of the values of asset_values
+ASSET_KEYS = (
+    "AssetId",
+    "AssetUid",
+    "XrefId",
+    "AssetTypeId",
+    "AssetTypeUid",
+    "UpdatedOn",
+    "CreatedOn",
+    "Color",
+    "Path",
+    "DisplayPath",
+    "Name",
+    "Key",
+    "Integrity",
+    "Confidentiality",
+    "QltyScore",
+    "Critical",
+    "GovernanceScore",
+    "SuggestedCritical",
+)
+
+
+def asset_values(
+    index: int, asset_type: int = 0, rng: random.Random | None = None
+) -> tuple:
+    """
+    Build the values of the payload of an asset, in the order of ASSET_KEYS. Its dates and
+    scores are drawn from rng, by default a generator seeded with the index of the asset.
+    """
+    rng = rng if rng is not None else random.Random(index)
+    # random() is drawn directly, randrange and choice being several times slower
+    draw = rng.random
+    created_on = int(draw() * DATES_SPAN)
+    updated_on = created_on + int(draw() * (DATES_SPAN - created_on))
+    key = f"APP-{index}"
+    return (
+        index,
+        f"asset-{index:08d}",
+        None,
+        asset_type,
+        asset_type_uid(asset_type),
+        iso_date(updated_on),
+        iso_date(created_on),
+        None,
+        f"[{key}].[Application]",
+        f"{key} / Application",
+        f"Application {index}",
+        key,
+        LEVELS[int(draw() * len(LEVELS))],
+        LEVELS[int(draw() * len(LEVELS))],
+        SCORES[int(draw() * len(SCORES))],
+        CRITICAL[int(draw() * len(CRITICAL))],
+        SCORES[int(draw() * len(SCORES))],
+        CRITICAL[int(draw() * len(CRITICAL))],
+    )
+
+
+def asset_payload(
+    index: int, asset_type: int = 0, rng: random.Random | None = None
+) -> dict:
+    """Build the payload of an asset of the asset type of an index, see asset_values."""
+    return dict(zip(ASSET_KEYS, asset_values(index, asset_type, rng)))
+
+
+def field_payload(index: int, asset_type_uid: str = "asset-type-0") -> dict:
+    return {
+        "Name": f"field_{index}",
+        "FriendlyName": f"Field {index}",
+        "Category": "Custom",
+        "ActionTypeUid": None,
+        "AssetTypeUid": asset_type_uid,
+        "RelationshipTypeUid": None,
+        "Id": index,
+        "Type": {
+            "Text": {
+                "DefaultValue": "",
+                "Description": {"Form": "string", "Display": "string"},
+                "Validation": {"IsRequired": False, "MaximumLength": 255},
+                "Search": {"AddToResult": True, "DisplayOrder": 0},
+                "DisplayInColumn": True,
+                "ColumnOrder": index,
+                "ColumnWidth": 100,
+                "SortOrder": 0,
+                "SortByAscending": True,
+                "IsDisplayable": True,
+                "IsEditable": True,
+                "IsListable": True,
+                "IsPartOfKey": False,
+                "IsPrimaryFilter": False,
+                "ShowIfEmpty": True,
+            }
+        },
+    }
+
+
+def page_payload(
+    items: list[dict], page_num: int = 1, total: int | None = None
+) -> dict:
+    return {
+        "items": items,
+        "pageSize": len(items),
+        "pageNum": page_num,
+        "total": len(items) if total is None else total,
+    }
+
+
+@dataclass(frozen=True)
+class SyntheticCatalog:
+    """
+    Data360 catalog generated on demand, the items of a page being built only when served.
+    The asset types cycle over ASSET_CLASSES, so some of them are User ones without assets.
+    """
+
+    asset_types: int = 20
+    assets_per_type: int = 100
+    fields_per_type: int = 20
+
+    def asset_classes_payload(self) -> list[dict]:
+        return [asset_class_payload(index) for index in range(len(ASSET_CLASSES))]
+
+    def asset_types_payload(self) -> list[dict]:
+        return [asset_type_payload(index) for index in range(self.asset_types)]
+
+    def type_index(self, uid: str) -> int | None:
+        """Return the index of an asset type from its uid, None when unknown."""
+        prefix, _, number = uid.rpartition("-")
+        if prefix != "asset-type" or not number.isdigit():
+            return None
+        index = int(number)
+        return index if index < self.asset_types else None
+
+    def assets_page(self, uid: str, page_size: int, page_num: int) -> dict:
+        index = self.type_index(uid)
+        if index is None:
+            return {**page_payload([], page_num, 0), "pageSize": page_size}
+        start = (page_num - 1) * page_size
+        items = [
+            asset_payload(index * self.assets_per_type + offset, index)
+            for offset in range(start, min(start + page_size, self.assets_per_type))
+        ]
+        return {
+            **page_payload(items, page_num, self.assets_per_type),
+            "pageSize": page_size,
+        }
+
+    def fields_page(self, uid: str, page_size: int, page_num: int) -> dict:
+        index = self.type_index(uid)
+        count = self.fields_per_type if index is not None else 0
+        start = (page_num - 1) * page_size
+        items = [
+            field_payload(offset, uid)
+            for offset in range(start, min(start + page_size, count))
+        ]
+        return {**page_payload(items, page_num, count), "pageSize": page_size}
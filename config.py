@@ -1,6 +1,9 @@
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings
 
+from data360.cache import ResponseCache
+from data360.retry import RetryPolicy
+
 
 class AppConfig(BaseSettings):
     """
@@ -19,5 +22,54 @@ class AppConfig(BaseSettings):
     DESTINATION_API_KEY: SecretStr = SecretStr("default-secret-key")
     DESTINATION_API_SECRET: SecretStr = SecretStr("default-secret")
 
+    # HTTP connection pool settings
+    HTTP_POOL_CONNECTIONS: int = 10  # Number of host connection pools to cache
+    HTTP_POOL_MAXSIZE: int = 10  # Maximum number of connections kept per host
+    HTTP_KEEP_ALIVE: bool = True
+    HTTP_TIMEOUT: float = 30.0  # Default timeout of each request, in seconds
+    HTTP_MAX_WORKERS: int = 8  # Asset types fetched in parallel by the crawls
+
+    # Retries of the failed GET requests
+    HTTP_RETRY_MAX_ATTEMPTS: int = 5  # 1 disables the retries
+    HTTP_RETRY_BACKOFF_FACTOR: float = 0.5  # Seconds, doubled after each attempt
+    HTTP_RETRY_MAX_BACKOFF: float = 30.0  # Upper bound of a single wait, in seconds
+    HTTP_RETRY_BUDGET: float = 120.0  # Total time budget of the retries, in seconds
+
+    # Client-side rate limit, shared by the instances pointing at the same URL
+    HTTP_RATE_LIMIT: float | None = None  # Requests per second, None disables it
+    HTTP_RATE_LIMIT_BURST: float | None = None  # Defaults to the rate limit, at least 1
+
+    # Persistent cache of the GET responses
+    CACHE_DIR: str | None = None  # None disables the cache
+    CACHE_TTL: float = 3600.0  # Default time to live of the entries, in seconds
+    CACHE_TTLS: dict[str, float] = {}  # Per endpoint, ex: {"/assets/{uid}": 600}
+    CACHE_MAX_SIZE_MB: int = 512
+
+    # Logging, written from a background thread
+    LOG_FILE: str | None = "log.txt"  # None logs to the standard error
+    LOG_LEVEL: str = "INFO"
+    LOG_REQUEST_SAMPLE_RATE: float = 1.0  # Fraction of the per-request messages kept
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Build the retry policy of the Data360 instances from the settings."""
+        return RetryPolicy(
+            max_attempts=self.HTTP_RETRY_MAX_ATTEMPTS,
+            backoff_factor=self.HTTP_RETRY_BACKOFF_FACTOR,
+            max_backoff=self.HTTP_RETRY_MAX_BACKOFF,
+            max_retry_time=self.HTTP_RETRY_BUDGET,
+        )
+
+    def build_response_cache(self) -> ResponseCache | None:
+        """Build the response cache of the Data360 instances, None when disabled."""
+        if self.CACHE_DIR is None:
+            return None
+        return ResponseCache(
+            self.CACHE_DIR,
+            default_ttl=self.CACHE_TTL,
+            ttls=self.CACHE_TTLS,
+            max_size=self.CACHE_MAX_SIZE_MB * 1024 * 1024,
+        )
+
     class Config:
         env_file = ".env"  # Load local environment variables from a .env file (for development)
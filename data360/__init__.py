@@ -0,0 +1,4 @@
+import logging
+
+# The applications choose where the messages go, see data360.log.configure_logging
+logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -0,0 +1,186 @@
+import sys
+from array import array
+from types import ModuleType
+from typing import TYPE_CHECKING, TypeVar
+
+from data360.columns import (
+    BooleanColumn,
+    Column,
+    DictionaryColumn,
+    FloatColumn,
+    StringColumn,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    # only for the annotations, the tables depending on this module
+    from data360.table import ColumnarTable
+
+TableT = TypeVar("TableT", bound="ColumnarTable")
+
+
+def import_pyarrow() -> ModuleType:
+    """Import pyarrow, with its compute and parquet modules."""
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError(
+            "Arrow arrays and Parquet snapshots require the pyarrow package"
+        ) from error
+    return pyarrow
+
+
+def arrow_type(column: Column) -> "pa.DataType":
+    """Return the Arrow type of a column."""
+    pa = import_pyarrow()
+    if isinstance(column, DictionaryColumn):
+        return pa.dictionary(pa.int32(), pa.string())
+    if isinstance(column, StringColumn):
+        return pa.large_string()
+    if isinstance(column, BooleanColumn):
+        return pa.bool_()
+    if isinstance(column, FloatColumn):
+        return pa.float64()
+    return pa.int64()
+
+
+def null_bitmap(validity: bytearray | None, length: int) -> "pa.Buffer | None":
+    """Pack a validity mask of bytes into the validity bitmap of an Arrow array."""
+    if validity is None:
+        return None
+    pa = import_pyarrow()
+    mask = pa.Array.from_buffers(pa.uint8(), length, [None, pa.py_buffer(validity)])
+    return pa.compute.cast(mask, pa.bool_()).buffers()[1]
+
+
+def to_arrow(column: Column) -> "pa.Array":
+    """
+    Convert a column into an Arrow array. The integers, floats, strings and codes share
+    the buffers of the column, only the validity masks and the booleans are packed into
+    bitmaps, and the column cannot grow while the array is alive.
+    :param column: The column, of a table that is not a view.
+    :return: The array, of the Arrow type of the column.
+    """
+    pa = import_pyarrow()
+    length = len(column)
+    if isinstance(column, DictionaryColumn):
+        codes = pa.Array.from_buffers(
+            pa.int32(), length, [None, pa.py_buffer(column.codes)]
+        )
+        # the codes are their own validity mask, -1 for the nulls
+        bitmap = (
+            pa.compute.greater_equal(codes, 0).buffers()[1] if column.nullable else None
+        )
+        indices = pa.Array.from_buffers(
+            pa.int32(), length, [bitmap, codes.buffers()[1]]
+        )
+        return pa.DictionaryArray.from_arrays(
+            indices, pa.array(column.values, pa.string())
+        )
+    bitmap = null_bitmap(column.validity, length)
+    if isinstance(column, StringColumn):
+        return pa.Array.from_buffers(
+            pa.large_string(),
+            length,
+            [bitmap, pa.py_buffer(column.offsets), pa.py_buffer(column.data)],
+        )
+    if isinstance(column, BooleanColumn):
+        values = pa.Array.from_buffers(
+            pa.uint8(), length, [bitmap, pa.py_buffer(column.values)]
+        )
+        return pa.compute.cast(values, pa.bool_())
+    return pa.Array.from_buffers(
+        arrow_type(column), length, [bitmap, pa.py_buffer(column.values)]
+    )
+
+
+def to_record_batch(table: "ColumnarTable") -> "pa.RecordBatch":
+    """
+    Convert a table into an Arrow record batch, a column per column of the table.
+    :param table: The table, compacted first when it is a view.
+    :return: The record batch.
+    """
+    pa = import_pyarrow()
+    columns = table.compact().columns
+    return pa.RecordBatch.from_arrays(
+        [to_arrow(column) for column in columns.values()], names=list(columns)
+    )
+
+
+def arrow_schema(table_class: "type[ColumnarTable]") -> "pa.Schema":
+    """Return the Arrow schema of the record batches of a kind of table."""
+    return to_record_batch(table_class()).schema
+
+
+def buffer_bytes(values: "pa.Array", index: int, width: int, length: int) -> memoryview:
+    """Return the bytes of the rows of an array, in one of its buffers of fixed width values."""
+    start = values.offset * width
+    return memoryview(values.buffers()[index])[start : start + length * width]
+
+
+def validity_mask(values: "pa.Array") -> bytearray:
+    """Unpack the validity bitmap of an Arrow array into a mask of bytes."""
+    pa = import_pyarrow()
+    valid = pa.compute.cast(values.is_valid(), pa.uint8())
+    return bytearray(buffer_bytes(valid, 1, 1, len(values)))
+
+
+def from_arrow(values: "pa.Array", column: Column) -> None:
+    """
+    Fill an empty column with the values of an Arrow array, copying each of its buffers
+    at once rather than converting the rows one by one.
+    :param values: The array, of the Arrow type of the column or of one cast into it.
+    :param column: The empty column.
+    """
+    pa = import_pyarrow()
+    length = len(values)
+    if isinstance(column, DictionaryColumn):
+        if not pa.types.is_dictionary(values.type):
+            values = pa.compute.dictionary_encode(values)
+        column.values = list(map(sys.intern, values.dictionary.to_pylist()))
+        column.index = {value: code for code, value in enumerate(column.values)}
+        codes = pa.compute.fill_null(values.indices.cast(pa.int32()), -1)
+        column.codes.frombytes(buffer_bytes(codes, 1, 4, length))
+        return
+    if isinstance(column, StringColumn):
+        values = values.cast(pa.large_string())
+        column.offsets = array("q")
+        column.offsets.frombytes(buffer_bytes(values, 1, 8, length + 1))
+        first, last = column.offsets[0], column.offsets[-1]
+        if first:
+            column.offsets = array("q", map(first.__rsub__, column.offsets))
+        data = values.buffers()[2]
+        column.data = bytearray(
+            memoryview(data)[first:last] if data is not None else b""
+        )
+    else:
+        values = values.cast(
+            pa.uint8() if isinstance(column, BooleanColumn) else arrow_type(column)
+        )
+        column.values.frombytes(buffer_bytes(values, 1, column.values.itemsize, length))
+    if column.validity is not None:
+        column.validity = validity_mask(values)
+
+
+def from_record_batch(
+    table_class: type[TableT], batch: "pa.RecordBatch | pa.Table"
+) -> TableT:
+    """
+    Build a table from an Arrow record batch, or a table whose chunks are combined first.
+    :param table_class: The kind of table, ex: AssetTable.
+    :param batch: The record batch, with a column per column of the table.
+    :return: The table, holding a copy of the buffers of the batch.
+    """
+    pa = import_pyarrow()
+    if isinstance(batch, pa.Table):
+        batch = batch.unify_dictionaries()
+    table = table_class()
+    for name, column in table.columns.items():
+        values = batch.column(name)
+        if isinstance(values, pa.ChunkedArray):
+            values = values.combine_chunks()
+        from_arrow(values, column)
+    return table
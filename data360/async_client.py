@@ -0,0 +1,253 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Self, TypeVar
+
+import httpx
+
+from data360.client import (
+    ASSET_CLASSES_ADAPTER,
+    ASSET_TYPES_ADAPTER,
+    DEFAULT_PAGE_SIZE,
+    PAGE_NUMBER_PARAM,
+    PAGE_SIZE_PARAM,
+    filter_asset_types_with_assets,
+    is_last_page,
+)
+from data360.log import request_logger
+from data360.model import Asset, AssetClass, AssetType, FieldAsset, Page
+
+T = TypeVar("T")
+
+
+class AsyncData360Instance:
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        api_secret: str,
+        max_concurrency: int = 50,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout: float | None = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Initialize an asyncio Data360 instance with the given URL and API key.
+        :param url: The base URL of the Data360 instance.
+        :param api_key: The API key for authentication.
+        :param api_secret: The API secret for authentication.
+        :param max_concurrency: The maximum number of requests in flight at the same time.
+        :param max_connections: The maximum number of open connections.
+        :param max_keepalive_connections: The maximum number of idle connections kept alive.
+        :param timeout: The default timeout of each request, in seconds.
+        :param transport: The httpx transport to send the requests with, defaults to the network one.
+        """
+        self.auth_key = api_key + ";" + api_secret
+        self.url = url + "/api/v2"
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=timeout,
+            transport=transport,
+        )
+        self._asset_types: list[AssetType] | None = None
+        self._assets: list[Asset] | None = None
+        self._fields: list[FieldAsset] | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled connections of the instance."""
+        await self.client.aclose()
+
+    async def asset_types(self) -> list[AssetType]:
+        """Return the list of the asset types, fetched once per instance
+
+        Returns:
+            list[AssetType]: List of asset types
+        """
+        if self._asset_types is None:
+            self._asset_types = await self.get_asset_types()
+        return self._asset_types
+
+    async def assets(self) -> list[Asset]:
+        """Returns the list of Assets, fetched once per instance
+
+        Returns:
+            list[Asset]: List of assets
+        """
+        if self._assets is None:
+            filtered_asset_types = filter_asset_types_with_assets(
+                await self.asset_types()
+            )
+            self._assets = [
+                asset
+                for assets_by_type in await self.gather_asset_types(
+                    self.get_asset_by_types, filtered_asset_types
+                )
+                for asset in assets_by_type
+            ]
+        return self._assets
+
+    async def fields(self) -> list[FieldAsset]:
+        """Returns the list of Fields, fetched once per instance
+
+        Returns:
+            list[FieldAsset]: List of fields
+        """
+        if self._fields is None:
+            self._fields = [
+                field
+                for fields_by_type in await self.gather_asset_types(
+                    self.get_fields_by_asset_type, await self.asset_types()
+                )
+                for field in fields_by_type
+            ]
+        return self._fields
+
+    async def gather_asset_types(
+        self,
+        function: Callable[[AssetType], Awaitable[T]],
+        asset_types: Iterable[AssetType],
+    ) -> list[T]:
+        """
+        Await a coroutine function for each asset type concurrently.
+        The number of requests in flight is bounded by the instance semaphore.
+        :param function: The coroutine function to call for each asset type.
+        :param asset_types: The asset types to process.
+        :return: The results, in the same order as the asset types.
+        """
+        return list(
+            await asyncio.gather(*(function(asset_type) for asset_type in asset_types))
+        )
+
+    async def http_request(
+        self, method_url: str, headers: dict | None = None, params: dict | None = None
+    ) -> httpx.Response:
+        """
+        Make a GET request to the Data360 API.
+        :param method_url: The URL of the API method.
+        :param headers: The headers for the request.
+        :param params: The parameters for the request.
+        :return: The response from the API.
+        """
+        if headers is None:
+            headers = {}
+        if params is None:
+            params = {}
+        # Set default headers
+        headers["Authorization"] = self.auth_key
+        headers["Accept"] = "application/json"
+        headers["Content-Type"] = "application/json"
+
+        async with self.semaphore:
+            request_logger.info("Make HTTP Call: GET %s", method_url)
+            response = await self.client.get(
+                self.url + method_url, headers=headers, params=params
+            )
+        response.raise_for_status()
+        return response
+
+    async def get_paged_items(
+        self,
+        method_url: str,
+        item_model: type[T],
+        params: dict | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> list[T]:
+        """
+        Get the items of a list API method, requesting its pages one after the other.
+        :param method_url: The URL of the API method.
+        :param item_model: The model the items of the pages are validated with.
+        :param params: The parameters for the request, the paging ones excluded.
+        :param page_size: The number of items requested per page.
+        :return: The items of all the pages.
+        """
+        page_model = Page[item_model]  # type: ignore[valid-type]
+        items: list[T] = []
+        page_number = 1
+        while True:
+            page_params = dict(params or {})
+            page_params[PAGE_SIZE_PARAM] = page_size
+            page_params[PAGE_NUMBER_PARAM] = page_number
+            response = await self.http_request(method_url, params=page_params)
+            page = page_model.model_validate_json(response.content)
+            items.extend(page.items)
+            if is_last_page(
+                len(page.items), len(items), page_size, page.page_size, page.total
+            ):
+                return items
+            page_number += 1
+
+    async def get_asset_class(self) -> list[AssetClass]:
+        """
+        Get the asset classes from the Data360 instance.
+        :return: A list of AssetClass objects.
+        """
+        method_url = "/assets/classes"
+        response = await self.http_request(method_url)
+        asset_classes = ASSET_CLASSES_ADAPTER.validate_json(response.content)[:1]
+        return asset_classes
+
+    async def get_asset_types(self, params: dict | None = None) -> list[AssetType]:
+        """
+        Get the asset types from the Data360 instance.
+        :param params: The parameters for the request.
+        :return: A list of AssetType objects.
+        """
+        method_url = "/assets/types"
+        response = await self.http_request(method_url, params=params)
+        asset_types = ASSET_TYPES_ADAPTER.validate_json(response.content)
+        return asset_types
+
+    async def get_asset_by_types(self, asset_type: AssetType) -> list[Asset]:
+        """
+        Get the assets of an asset type from the Data360 instance.
+        :param asset_type: The asset type to get assets for.
+        :return: A list of Asset objects.
+        """
+        return await self.get_asset_by_types_uid(asset_type.uid)
+
+    async def get_asset_by_types_uid(
+        self, asset_type_uid: str, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> list[Asset]:
+        """
+        Get the assets of an asset type from the Data360 instance, all pages included.
+        :param asset_type_uid: The uid of the asset type to get assets for.
+        :param page_size: The number of assets requested per page.
+        :return: A list of Asset objects.
+        """
+        return await self.get_paged_items(
+            "/assets/" + asset_type_uid, Asset, page_size=page_size
+        )
+
+    async def get_fields_by_asset_type(self, asset_type: AssetType) -> list[FieldAsset]:
+        """
+        Get the fields for a specific asset type from the Data360 instance.
+        :param asset_type: The asset type to get fields for.
+        :return: A list of Field objects.
+        """
+        return await self.get_fields_by_asset_type_uid(asset_type.uid)
+
+    async def get_fields_by_asset_type_uid(
+        self, asset_type_uid: str, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> list[FieldAsset]:
+        """
+        Get the fields for a specific asset type from the Data360 instance, all pages included.
+        :param asset_type_uid: The asset type to get fields for.
+        :param page_size: The number of fields requested per page.
+        :return: A list of Field objects.
+        """
+        return await self.get_paged_items(
+            "/fields",
+            FieldAsset,
+            params={"AssetTypeUid": asset_type_uid},
+            page_size=page_size,
+        )
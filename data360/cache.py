@@ -0,0 +1,311 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple, TypeVar
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from data360.model import Page
+
+T = TypeVar("T")
+
+# The number of parsed items kept by the memo of an instance, about 50 pages of 200 items
+PARSED_ITEMS_MAX = 10_000
+
+# Headers kept alongside the cached bodies
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class CachedResponse(NamedTuple):
+    response: requests.Response
+    expired: bool
+
+
+class ResponseCache:
+    """
+    Persistent cache of the Data360 GET responses, stored in a SQLite database.
+    Entries expire after the TTL of their endpoint, and the least recently used
+    ones are evicted once the cached bodies exceed the maximum size.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        default_ttl: float = 3600.0,
+        ttls: dict[str, float] | None = None,
+        max_size: int = 512 * 1024 * 1024,
+        clock=time.time,
+    ):
+        """
+        Initialize the cache, creating its database if needed.
+        :param directory: The directory of the cache database.
+        :param default_ttl: The time to live of the entries, in seconds.
+        :param ttls: The time to live of the entries per endpoint template (ex: "/assets/{uid}").
+        :param max_size: The maximum total size of the cached bodies, in bytes.
+        :param clock: The function giving the current time, in seconds.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "data360_cache.sqlite")
+        self.default_ttl = default_ttl
+        self.ttls = ttls or {}
+        self.max_size = max_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    status_code INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    content BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def key(base_url: str, method_url: str, params: dict | None = None) -> str:
+        """
+        Build the cache key of a request.
+        :param base_url: The base URL of the Data360 instance.
+        :param method_url: The URL of the API method.
+        :param params: The parameters of the request.
+        :return: The cache key.
+        """
+        request = json.dumps(
+            [base_url, method_url, params or {}], sort_keys=True, default=str
+        )
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    def ttl(self, endpoint: str) -> float:
+        """
+        Get the time to live of the entries of an endpoint.
+        :param endpoint: The endpoint template.
+        :return: The time to live, in seconds.
+        """
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, key: str, endpoint: str) -> requests.Response | None:
+        """
+        Get a cached response, unless it expired.
+        :param key: The cache key of the request.
+        :param endpoint: The endpoint template of the request.
+        :return: The cached response, None when missing or expired.
+        """
+        cached = self.lookup(key, endpoint)
+        if cached is None or cached.expired:
+            return None
+        return cached.response
+
+    def lookup(self, key: str, endpoint: str) -> CachedResponse | None:
+        """
+        Get a cached response, expired or not, so that it can be revalidated.
+        :param key: The cache key of the request.
+        :param endpoint: The endpoint template of the request.
+        :return: The cached response and whether it expired, None when missing.
+        """
+        now = self._clock()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT url, status_code, headers, content, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        url, status_code, headers, content, stored_at = row
+        return CachedResponse(
+            response=build_response(url, status_code, json.loads(headers), content),
+            expired=now - stored_at > self.ttl(endpoint),
+        )
+
+    def renew(self, key: str) -> None:
+        """
+        Restart the time to live of an entry, once the server confirmed it is unchanged.
+        :param key: The cache key of the request.
+        """
+        now = self._clock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key),
+            )
+
+    def set(self, key: str, endpoint: str, response: requests.Response) -> None:
+        """
+        Store a response, then evict the least recently used entries above the maximum size.
+        :param key: The cache key of the request.
+        :param endpoint: The endpoint template of the request.
+        :param response: The response to store.
+        """
+        now = self._clock()
+        headers = {
+            name: response.headers[name]
+            for name in CACHED_HEADERS
+            if name in response.headers
+        }
+        content = response.content
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    endpoint,
+                    response.url,
+                    response.status_code,
+                    json.dumps(headers),
+                    content,
+                    len(content),
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until the size fits, the lock being held."""
+        (total_size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total_size <= self.max_size:
+            return
+        rows = self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if total_size <= self.max_size:
+                break
+            evicted.append((key,))
+            total_size -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def clear(self) -> None:
+        """Delete every entry of the cache."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+
+def conditional_headers(response: requests.Response) -> dict[str, str]:
+    """
+    Build the headers asking the server to answer 304 if a cached response is unchanged.
+    :param response: The cached response.
+    :return: The If-None-Match and If-Modified-Since headers of its validators.
+    """
+    headers = {}
+    if "ETag" in response.headers:
+        headers["If-None-Match"] = response.headers["ETag"]
+    if "Last-Modified" in response.headers:
+        headers["If-Modified-Since"] = response.headers["Last-Modified"]
+    return headers
+
+
+def count_items(parsed: object) -> int:
+    """Return the number of items parsed from a response, as a list or a page."""
+    if isinstance(parsed, Page):
+        return len(parsed.items)
+    return len(parsed) if isinstance(parsed, list) else 1
+
+
+def fresh_copy(parsed: T) -> T:
+    """Return a copy of the list of items parsed from a response, the items being shared."""
+    if isinstance(parsed, Page):
+        return parsed.model_copy(update={"items": list(parsed.items)})  # type: ignore[return-value]
+    if isinstance(parsed, list):
+        return list(parsed)  # type: ignore[return-value]
+    return parsed
+
+
+class ParsedResponseMemo:
+    """
+    In-memory LRU of the objects parsed from responses, keyed by URL and validator.
+    A response carrying the same ETag (or Last-Modified) as a parsed one has the same
+    content, so its already validated models are reused instead of parsing it again.
+    The memo is bounded by the number of items it holds, so that iterating over the
+    pages of a large list method keeps a bounded memory, and each caller gets its own
+    list of the (frozen) items.
+    """
+
+    def __init__(self, max_items: int = PARSED_ITEMS_MAX):
+        """
+        Initialize an empty memo.
+        :param max_items: The maximum number of parsed items kept, over all the responses.
+        """
+        self.max_items = max_items
+        self.items = 0
+        self._entries: OrderedDict[tuple, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(
+        self, response: requests.Response, parser: Callable[[requests.Response], T]
+    ) -> T:
+        """
+        Parse a response, or reuse the result of a previous parsing of the same content.
+        :param response: The response to parse.
+        :param parser: The function parsing the response.
+        :return: The parsed objects, a copy of the list of items when it is kept.
+        """
+        validator = response.headers.get("ETag") or response.headers.get(
+            "Last-Modified"
+        )
+        if validator is None:
+            return parser(response)
+        key = (parser, response.url, validator)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return fresh_copy(self._entries[key][0])
+        parsed = parser(response)
+        items = count_items(parsed)
+        if items > self.max_items:
+            return parsed
+        with self._lock:
+            if key in self._entries:
+                self.items -= self._entries.pop(key)[1]
+            self._entries[key] = (parsed, items)
+            self.items += items
+            while self.items > self.max_items:
+                self.items -= self._entries.popitem(last=False)[1][1]
+        return fresh_copy(parsed)
+
+
+def build_response(
+    url: str, status_code: int, headers: dict, content: bytes
+) -> requests.Response:
+    """
+    Build a requests.Response from stored parts.
+    :param url: The URL of the response.
+    :param status_code: The status code of the response.
+    :param headers: The headers of the response.
+    :param content: The body of the response.
+    :return: The response.
+    """
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    # the body is already read, iter_content serves it from memory
+    response._content_consumed = True
+    response.encoding = "utf-8"
+    return response
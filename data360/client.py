@@ -1,24 +1,216 @@
 import logging
-from functools import cached_property
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from functools import cache, cached_property
+from typing import Self, TypeVar
 
 import requests
+from pydantic import BaseModel, TypeAdapter
 
-from data360.model import Asset, AssetClass, AssetClassName, AssetType, FieldAsset
+from data360.cache import (
+    ParsedResponseMemo,
+    ResponseCache,
+    conditional_headers,
+    count_items,
+)
+from data360.hooks import CompositeHooks, Hooks, RequestInfo
+from data360.log import request_logger
+from data360.metrics import MetricsRegistry
+from data360.model import (
+    Asset,
+    AssetClass,
+    AssetClassName,
+    AssetType,
+    FieldAsset,
+    LazyFieldAsset,
+    Page,
+)
+from data360.rate_limit import TokenBucket, shared_token_bucket
+from data360.retry import RetryPolicy, RetryStats
+from data360.streaming import StreamedJsonArray
+from data360.table import AssetTable, FieldTable
+from data360.transport import HTTPTransport, Transport
 
-logger = logging
-logging.getLogger(__name__)
-logging.basicConfig(filename="log.txt", encoding="utf-8", level=logging.DEBUG)
+T = TypeVar("T")
+BaseModelT = TypeVar("BaseModelT", bound=BaseModel)
+
+# Paging of the list API methods, pages are numbered from 1
+DEFAULT_PAGE_SIZE = 200
+PAGE_SIZE_PARAM = "pageSize"
+PAGE_NUMBER_PARAM = "pageNum"
+# Size of the chunks read from the streamed responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+def is_last_page(
+    page_items: int,
+    fetched_items: int,
+    page_size: int,
+    served_page_size: int | None = None,
+    total: int | None = None,
+) -> bool:
+    """
+    Tell whether a page of a list API method is the last one.
+    :param page_items: The number of items of the page.
+    :param fetched_items: The number of items fetched so far, this page included.
+    :param page_size: The page size requested.
+    :param served_page_size: The page size in the envelope of the page, if any.
+    :param total: The total number of items in the envelope of the page, if any.
+    :return: True when no other page needs to be requested.
+    """
+    # the server may cap the page size below the requested one
+    return page_items < (served_page_size or page_size) or (
+        total is not None and fetched_items >= total
+    )
+
+
+# The responses are validated straight from their bytes: pydantic-core parses the JSON
+# and builds the models in one pass, without intermediate Python dicts.
+ASSET_CLASSES_ADAPTER: TypeAdapter[list[AssetClass]] = TypeAdapter(list[AssetClass])
+ASSET_TYPES_ADAPTER: TypeAdapter[list[AssetType]] = TypeAdapter(list[AssetType])
+
+
+def parse_asset_classes(response: requests.Response) -> list[AssetClass]:
+    """Parse the response of the asset classes API method."""
+    return ASSET_CLASSES_ADAPTER.validate_json(response.content)[:1]
+
+
+def parse_asset_types(response: requests.Response) -> list[AssetType]:
+    """Parse the response of the asset types API method."""
+    return ASSET_TYPES_ADAPTER.validate_json(response.content)
+
+
+@cache
+def page_parser(item_model: type[T]) -> Callable[[requests.Response], Page[T]]:
+    """
+    Get the function parsing the pages of a list API method, one per item model.
+    :param item_model: The model of the items of the pages.
+    :return: The function parsing a response into a page.
+    """
+    page_model = Page[item_model]  # type: ignore[valid-type]
+
+    def parse_page(response: requests.Response) -> Page[T]:
+        return page_model.model_validate_json(response.content)
+
+    return parse_page
+
+
+def filter_asset_types_with_assets(asset_types: Iterable[AssetType]) -> list[AssetType]:
+    """
+    Keep the asset types whose assets can be listed with the assets API method.
+    :param asset_types: The asset types to filter.
+    :return: The asset types, without the USER and GROUP ones.
+    """
+    # need to filter USERS and GROUPS asset types as their kind of assets actually need another api method to work
+    return [
+        asset_type
+        for asset_type in asset_types
+        if asset_type.asset_class.name
+        not in [AssetClassName.GROUP.value, AssetClassName.USER.value]
+    ]
+
+
+def raise_for_status(response: requests.Response) -> None:
+    """
+    Raise the HTTPError of an error response, closing it first so that a streamed
+    response releases its pooled connection.
+    :param response: The response from the API.
+    """
+    try:
+        response.raise_for_status()
+    except requests.HTTPError:
+        response.close()
+        raise
 
 
 class Data360Instance:
-    def __init__(self, url: str, api_key: str, api_secret: str):
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        api_secret: str,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        timeout: float | tuple[float, float] | None = 30.0,
+        max_workers: int = 1,
+        retry_policy: RetryPolicy | None = None,
+        rate_limit: float | None = None,
+        rate_limit_burst: float | None = None,
+        cache: ResponseCache | None = None,
+        metrics: MetricsRegistry | None = None,
+        hooks: Iterable[Hooks] = (),
+        transport: Transport | None = None,
+        lazy_fields: bool = False,
+    ):
         """
         Initialize a Data360 instance with the given URL and API key.
         :param url: The base URL of the Data360 instance.
         :param api_key: The API key for authentication.
+        :param api_secret: The API secret for authentication.
+        :param pool_connections: The number of host connection pools to cache, for the default transport.
+        :param pool_maxsize: The maximum number of connections kept per host, for the default transport.
+        :param keep_alive: Whether connections are kept open between requests, for the default transport.
+        :param timeout: The default timeout (seconds, or a (connect, read) tuple) of each request.
+        :param max_workers: The number of asset types fetched in parallel by the aggregations, 1 fetches them sequentially.
+        :param retry_policy: How failed requests are retried, defaults to RetryPolicy().
+        :param rate_limit: The number of requests allowed per second, shared by every instance on the same URL. None disables the limit.
+        :param rate_limit_burst: The number of requests allowed in a burst, defaults to the rate limit, at least 1.
+        :param cache: The persistent cache of the GET responses, None disables the caching.
+        :param metrics: The registry the per-endpoint metrics are recorded in, defaults to a new one.
+        :param hooks: The hooks called around the API calls, in turn (ex: OpenTelemetryHooks()).
+        :param transport: The transport sending the requests, defaults to an HTTPTransport.
+        :param lazy_fields: Whether the fields keep the payload of their type, validated on first access only (see LazyFieldAsset).
         """
         self.auth_key = api_key + ";" + api_secret
         self.url = url + "/api/v2"
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.retry_stats = RetryStats()
+        self.rate_limiter: TokenBucket | None = (
+            shared_token_bucket(self.url, rate_limit, rate_limit_burst)
+            if rate_limit is not None
+            else None
+        )
+        self.cache = cache
+        # models parsed from the cached responses, reused while their ETag is unchanged
+        self.parsed_responses = ParsedResponseMemo() if cache is not None else None
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self.hooks = CompositeHooks(hooks)
+        self.transport = (
+            transport
+            if transport is not None
+            else HTTPTransport(pool_connections, pool_maxsize, keep_alive)
+        )
+        self.lazy_fields = lazy_fields
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the transport of the instance, and its pooled connections."""
+        self.transport.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """The HTTP session of the default transport."""
+        return self.transport.session  # type: ignore[attr-defined]
+
+    def stats(self) -> dict[str, dict]:
+        """
+        Take a snapshot of the metrics of the requests made by the instance.
+        :return: The request counts, status codes, latencies, bytes received, items and
+            validation times of each endpoint template.
+        """
+        return self.metrics.stats()
 
     @cached_property
     def asset_types(self) -> list[AssetType]:
@@ -27,7 +219,8 @@ class Data360Instance:
         Returns:
             list[AssetType]: List of asset types
         """
-        return self.get_asset_types()
+        with self.hooks.span("data360.asset_types"):
+            return self.get_asset_types()
 
     @cached_property
     def assets(self) -> list[Asset]:
@@ -36,37 +229,113 @@ class Data360Instance:
         Returns:
             list[Asset]: List of assets
         """
-        # need to filter USERS and GROUPS asset types as their kind of assets actually need another api method to work
-        filtered_asset_types = [
-            asset_type
-            for asset_type in self.asset_types
-            if asset_type.asset_class.name
-            not in [AssetClassName.GROUP.value, AssetClassName.USER.value]
-        ]
-        assets = [
-            asset
-            for asset_type in filtered_asset_types
-            for asset in self.get_asset_by_types(asset_type)
-        ]
+        filtered_asset_types = filter_asset_types_with_assets(self.asset_types)
+        with self.hooks.span("data360.assets"):
+            assets = [
+                asset
+                for assets_by_type in self.map_asset_types(
+                    self.get_asset_by_types, filtered_asset_types
+                )
+                for asset in assets_by_type
+            ]
         return assets
 
+    @cached_property
+    def asset_table(self) -> AssetTable:
+        """
+        Return the assets as a columnar AssetTable, a fraction of the memory of the list of
+        assets. The assets of each asset type are added to the table as their pages come,
+        so only a batch of Asset objects is held at a time per worker.
+        """
+        filtered_asset_types = filter_asset_types_with_assets(self.asset_types)
+        with self.hooks.span("data360.assets"):
+            return AssetTable.concat(
+                self.map_asset_types(
+                    lambda asset_type: AssetTable.from_objects(
+                        self.iter_assets_by_type_uid(asset_type.uid)
+                    ),
+                    filtered_asset_types,
+                )
+            )
+
     @cached_property
     def fields(self) -> list[FieldAsset]:
-        fields_assets = [
-            field
-            for asset_type in self.asset_types
-            for field in self.get_fields_by_asset_type(asset_type)
-        ]
+        asset_types = self.asset_types
+        with self.hooks.span("data360.fields"):
+            fields_assets = [
+                field
+                for fields_by_type in self.map_asset_types(
+                    self.get_fields_by_asset_type, asset_types
+                )
+                for field in fields_by_type
+            ]
         return fields_assets
 
+    @cached_property
+    def field_table(self) -> FieldTable:
+        """
+        Return the fields as a columnar FieldTable, their types flattened into columns. The
+        fields of each asset type are added to the table as their pages come.
+        """
+        asset_types = self.asset_types
+        with self.hooks.span("data360.fields"):
+            return FieldTable.concat(
+                self.map_asset_types(
+                    lambda asset_type: FieldTable.from_objects(
+                        self.iter_fields(asset_type.uid)
+                    ),
+                    asset_types,
+                )
+            )
+
+    def map_asset_types(
+        self, function: Callable[[AssetType], T], asset_types: Iterable[AssetType]
+    ) -> list[T]:
+        """
+        Apply a function to each asset type, in parallel when max_workers is greater than 1.
+        Each call runs in a span of its asset type, nested under the span open by the caller.
+        :param function: The function to call for each asset type.
+        :param asset_types: The asset types to process.
+        :return: The results, in the same order as the asset types.
+        """
+
+        def call(asset_type: AssetType) -> T:
+            attributes = {
+                "data360.asset_type.uid": asset_type.uid,
+                "data360.asset_type.name": asset_type.name,
+            }
+            with self.hooks.span("data360.asset_type", attributes):
+                return function(asset_type)
+
+        if self.max_workers <= 1:
+            return [call(asset_type) for asset_type in asset_types]
+        # the workers run in copies of the caller context, where its span is the current one
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda asset_type, context: context.run(call, asset_type),
+                    asset_types,
+                    iter(copy_context, None),
+                )
+            )
+
     def http_request(
-        self, method_url: str, headers: dict | None = None, params: dict | None = None
+        self,
+        method_url: str,
+        headers: dict | None = None,
+        params: dict | None = None,
+        endpoint: str | None = None,
+        refresh: bool = False,
+        stream: bool = False,
     ) -> requests.Response:
         """
-        Make a GET request to the Data360 API.
+        Make a GET request to the Data360 API, served from the cache when enabled.
         :param method_url: The URL of the API method.
         :param headers: The headers for the request.
         :param params: The parameters for the request.
+        :param endpoint: The endpoint template of the API method (ex: "/assets/{uid}"), defaults to its URL.
+        :param refresh: Whether to bypass the cached response and store a fresh one.
+        :param stream: Whether to read the body lazily, the streamed responses are never cached.
         :return: The response from the API.
         """
         if headers is None:
@@ -78,91 +347,432 @@ class Data360Instance:
         headers["Accept"] = "application/json"
         headers["Content-Type"] = "application/json"
 
-        logging.info(
-            "Make HTTP Call",
-        )
-        response = requests.get(self.url + method_url, headers=headers, params=params)
-        response.raise_for_status()
+        if endpoint is None:
+            endpoint = method_url
+        if self.cache is None or stream:
+            return self._send(method_url, headers, params, endpoint, stream)
+        cache_key = ResponseCache.key(self.url, method_url, params)
+        cached = None if refresh else self.cache.lookup(cache_key, endpoint)
+        if cached is not None:
+            if not cached.expired:
+                self.metrics.record_cache_hit(endpoint)
+                return cached.response
+            # revalidate the expired response instead of downloading it again
+            headers.update(conditional_headers(cached.response))
+        response = self._send(method_url, headers, params, endpoint)
+        if response.status_code == 304 and cached is not None:
+            self.cache.renew(cache_key)
+            return cached.response
+        if response.status_code == 200:
+            self.cache.set(cache_key, endpoint, response)
         return response
 
-    def get_asset_class(self) -> list[AssetClass]:
+    def parse_response(
+        self,
+        response: requests.Response,
+        parser: Callable[[requests.Response], T],
+        endpoint: str,
+    ) -> T:
+        """
+        Parse a response into models, reusing the ones parsed from an unchanged response when caching.
+        :param response: The response from the API.
+        :param parser: The function parsing the response.
+        :param endpoint: The endpoint template of the request, the validation time is recorded for.
+        :return: The parsed models.
+        """
+        start = time.perf_counter()
+        if self.parsed_responses is None:
+            parsed = parser(response)
+        else:
+            parsed = self.parsed_responses.parse(response, parser)
+        items = count_items(parsed)
+        seconds = time.perf_counter() - start
+        self.metrics.record_validation(endpoint, items, seconds)
+        self.hooks.on_validate(endpoint, items, seconds)
+        return parsed
+
+    def _send(
+        self,
+        method_url: str,
+        headers: dict,
+        params: dict,
+        endpoint: str,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Send a GET request, retrying it according to the retry policy.
+        :param method_url: The URL of the API method.
+        :param headers: The headers for the request.
+        :param params: The parameters for the request.
+        :param endpoint: The endpoint template of the request, the metrics are recorded for.
+        :param stream: Whether to read the body lazily.
+        :return: The response from the API.
+        """
+        policy = self.retry_policy
+        deadline = time.monotonic() + policy.max_retry_time
+        attempt = 1
+        span_attributes = {
+            "http.request.method": "GET",
+            "url.full": self.url + method_url,
+        }
+        with self.hooks.span("GET " + endpoint, span_attributes):
+            while True:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                request_logger.info("Make HTTP Call: GET %s", method_url)
+                request = RequestInfo(
+                    "GET", self.url + method_url, endpoint, params, attempt
+                )
+                self.hooks.on_request(request)
+                start = time.perf_counter()
+                try:
+                    response = self.transport.send(
+                        self.url + method_url, headers, params, self.timeout, stream
+                    )
+                except (requests.ConnectionError, requests.Timeout) as error:
+                    seconds = time.perf_counter() - start
+                    self.metrics.record_request(endpoint, type(error).__name__, seconds)
+                    self.hooks.on_error(request, error, seconds)
+                    self.retry_stats.record_attempt(type(error).__name__)
+                    wait = policy.delay(attempt)
+                    if not policy.is_retryable("GET") or self._retries_exhausted(
+                        attempt, wait, deadline
+                    ):
+                        raise
+                    outcome: int | str = type(error).__name__
+                else:
+                    seconds = time.perf_counter() - start
+                    self.metrics.record_request(
+                        endpoint,
+                        response.status_code,
+                        seconds,
+                        0 if stream else len(response.content),
+                    )
+                    self.hooks.on_response(request, response, seconds)
+                    self.retry_stats.record_attempt(response.status_code)
+                    if not policy.is_retryable("GET", response.status_code):
+                        raise_for_status(response)
+                        return response
+                    wait = policy.delay(attempt, response)
+                    if self._retries_exhausted(attempt, wait, deadline):
+                        raise_for_status(response)
+                        return response
+                    outcome = response.status_code
+                    # release the connection of the response before waiting to retry
+                    response.close()
+
+                logger.warning(
+                    "Attempt %s of GET %s failed (%s), retrying in %.2fs",
+                    attempt,
+                    method_url,
+                    outcome,
+                    wait,
+                )
+                self.retry_stats.record_retry(wait)
+                time.sleep(wait)
+                attempt += 1
+
+    def _retries_exhausted(self, attempt: int, wait: float, deadline: float) -> bool:
+        """
+        Tell whether a failed request must be given up.
+        :param attempt: The number of the attempt that failed, starting at 1.
+        :param wait: The wait before the next attempt, in seconds.
+        :param deadline: The monotonic time after which no attempt can be made.
+        :return: True when the attempts or the time budget are exhausted.
+        """
+        exhausted = (
+            attempt >= self.retry_policy.max_attempts
+            or time.monotonic() + wait > deadline
+        )
+        if exhausted:
+            self.retry_stats.record_exhausted()
+        return exhausted
+
+    def get_asset_class(self, refresh: bool = False) -> list[AssetClass]:
         """
         Get the asset classes from the Data360 instance.
         :param data360_instance: The Data360 instance.
+        :param refresh: Whether to bypass the cached response.
         :return: A list of AssetClass objects.
         """
         # Placeholder for actual API call
         method_url = "/assets/classes"
-        response = self.http_request(method_url)
-        json_response = response.json()
-        asset_classes = [AssetClass.model_validate(json_response[0])]
+        response = self.http_request(method_url, refresh=refresh)
+        asset_classes = self.parse_response(response, parse_asset_classes, method_url)
         return asset_classes
 
-    def get_asset_types(self, params={}) -> list[AssetType]:
+    def get_asset_types(self, params={}, refresh: bool = False) -> list[AssetType]:
         """
         Get the asset types from the Data360 instance.
         :param data360_instance: The Data360 instance.
+        :param refresh: Whether to bypass the cached response.
         :return: A list of AssetType objects.
         """
         # Placeholder for actual API call
         method_url = "/assets/types"
-        response = self.http_request(method_url, params=params)
-        asset_types = [AssetType.model_validate(item) for item in response.json()]
+        response = self.http_request(method_url, params=params, refresh=refresh)
+        asset_types = self.parse_response(response, parse_asset_types, method_url)
         return asset_types
 
-    def get_asset_types_by_class(self, asset_class: AssetClassName) -> list[AssetType]:
+    def get_asset_types_by_class(
+        self, asset_class: AssetClassName, refresh: bool = False
+    ) -> list[AssetType]:
         """
         Get the asset types for a specific asset class from the Data360 instance.
         :param data360_instance: The Data360 instance.
         :param asset_class: The asset class to get asset types for.
+        :param refresh: Whether to bypass the cached response.
         :return: A list of AssetType objects.
         """
-        return self.get_asset_types({"Class": asset_class.value})
+        return self.get_asset_types({"Class": asset_class.value}, refresh=refresh)
 
-    def get_asset_by_types(self, asset_type: AssetType) -> list[Asset]:
+    def get_asset_by_types(
+        self, asset_type: AssetType, refresh: bool = False
+    ) -> list[Asset]:
         """
         Get the asset types from the Data360 instance.
         :param data360_instance: The Data360 instance.
+        :param refresh: Whether to bypass the cached responses.
         :return: A list of AssetType objects.
         """
-        return self.get_asset_by_types_uid(asset_type.uid)
+        return self.get_asset_by_types_uid(asset_type.uid, refresh=refresh)
 
-    def get_asset_by_types_uid(self, asset_type_uid: str) -> list[Asset]:
+    def get_asset_by_types_uid(
+        self, asset_type_uid: str, refresh: bool = False
+    ) -> list[Asset]:
         """
-        Get the asset types from the Data360 instance.
-        :param data360_instance: The Data360 instance.
-        :return: A list of AssetType objects.
+        Get the assets of an asset type from the Data360 instance, all pages included.
+        :param asset_type_uid: The uid of the asset type to get assets for.
+        :param refresh: Whether to bypass the cached responses.
+        :return: A list of Asset objects.
+        """
+        return list(self.iter_assets_by_type_uid(asset_type_uid, refresh=refresh))
+
+    def iter_assets_by_type_uid(
+        self,
+        asset_type_uid: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        refresh: bool = False,
+        stream: bool = False,
+    ) -> Iterator[Asset]:
+        """
+        Iterate over the assets of an asset type, requesting them page by page.
+        :param asset_type_uid: The uid of the asset type to get assets for.
+        :param page_size: The number of assets requested per page.
+        :param prefetch: Whether to request the next page while the current one is consumed.
+        :param refresh: Whether to bypass the cached responses.
+        :param stream: Whether to decode each page incrementally, one asset at a time. Streamed pages are neither prefetched nor cached.
+        :return: An iterator of Asset objects.
         """
-        # Placeholder for actual API call
         method_url = "/assets/" + asset_type_uid
-        response = self.http_request(method_url)
-        assets = [Asset.model_validate(item) for item in response.json()["items"]]
-        return assets
+        if stream:
+            yield from self.iter_streamed_items(
+                method_url, Asset, page_size=page_size, endpoint="/assets/{uid}"
+            )
+            return
+        for page in self.iter_pages(
+            method_url,
+            Asset,
+            page_size=page_size,
+            prefetch=prefetch,
+            endpoint="/assets/{uid}",
+            refresh=refresh,
+        ):
+            yield from page.items
 
-    def get_fields_by_asset_type(self, asset_type: AssetType) -> list[FieldAsset]:
+    def get_fields_by_asset_type(
+        self, asset_type: AssetType, refresh: bool = False, lazy: bool | None = None
+    ) -> list[FieldAsset]:
         """
         Get the fields for a specific asset type from the Data360 instance.
         :param data360_instance: The Data360 instance.
         :param asset_type: The asset type to get fields for.
+        :param refresh: Whether to bypass the cached responses.
+        :param lazy: Whether the types of the fields are validated on first access only, defaults to lazy_fields.
         :return: A list of Field objects.
         """
-        return self.get_fields_by_asset_type_uid(asset_type.uid)
+        return self.get_fields_by_asset_type_uid(
+            asset_type.uid, refresh=refresh, lazy=lazy
+        )
 
-    def get_fields_by_asset_type_uid(self, asset_type_uid: str) -> list[FieldAsset]:
+    def get_fields_by_asset_type_uid(
+        self, asset_type_uid: str, refresh: bool = False, lazy: bool | None = None
+    ) -> list[FieldAsset]:
         """
-        Get the fields for a specific asset type from the Data360 instance.
-        :param data360_instance: The Data360 instance.
+        Get the fields for a specific asset type from the Data360 instance, all pages included.
         :param asset_type_uid: The asset type to get fields for.
+        :param refresh: Whether to bypass the cached responses.
+        :param lazy: Whether the types of the fields are validated on first access only, defaults to lazy_fields.
         :return: A list of Field objects.
         """
+        return list(self.iter_fields(asset_type_uid, refresh=refresh, lazy=lazy))
+
+    def iter_fields(
+        self,
+        asset_type_uid: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        refresh: bool = False,
+        stream: bool = False,
+        lazy: bool | None = None,
+    ) -> Iterator[FieldAsset]:
+        """
+        Iterate over the fields of an asset type, requesting them page by page.
+        :param asset_type_uid: The asset type to get fields for.
+        :param page_size: The number of fields requested per page.
+        :param prefetch: Whether to request the next page while the current one is consumed.
+        :param refresh: Whether to bypass the cached responses.
+        :param stream: Whether to decode each page incrementally, one field at a time. Streamed pages are neither prefetched nor cached.
+        :param lazy: Whether the types of the fields are validated on first access only, defaults to lazy_fields.
+        :return: An iterator of Field objects.
+        """
         method_url = "/fields"
-        response = self.http_request(
-            method_url, params={"AssetTypeUid": asset_type_uid}
-        )
-        if "items" in response.json():
-            fields = [
-                FieldAsset.model_validate(item) for item in response.json()["items"]
-            ]
-        else:
-            return []
-        return fields
+        params = {"AssetTypeUid": asset_type_uid}
+        if lazy is None:
+            lazy = self.lazy_fields
+        item_model = LazyFieldAsset if lazy else FieldAsset
+        if stream:
+            yield from self.iter_streamed_items(
+                method_url, item_model, params=params, page_size=page_size
+            )
+            return
+        for page in self.iter_pages(
+            method_url,
+            item_model,
+            params=params,
+            page_size=page_size,
+            prefetch=prefetch,
+            refresh=refresh,
+        ):
+            yield from page.items
+
+    def iter_pages(
+        self,
+        method_url: str,
+        item_model: type[T],
+        params: dict | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        endpoint: str | None = None,
+        refresh: bool = False,
+    ) -> Iterator[Page[T]]:
+        """
+        Iterate over the pages of a list API method, following its page number.
+        :param method_url: The URL of the API method.
+        :param item_model: The model the items of the pages are validated with.
+        :param params: The parameters for the request, the paging ones excluded.
+        :param page_size: The number of items requested per page.
+        :param prefetch: Whether to request the next page while the current one is consumed.
+        :param endpoint: The endpoint template of the API method, defaults to its URL.
+        :param refresh: Whether to bypass the cached responses.
+        :return: An iterator of the pages, with their validated items.
+        """
+        # the model classes are hashable, mypy only lacks a Hashable bound on type[T]
+        parse_page = page_parser(item_model)  # type: ignore[arg-type]
+        if endpoint is None:
+            endpoint = method_url
+
+        def request_page(page_number: int) -> Page[T]:
+            page_params = dict(params or {})
+            page_params[PAGE_SIZE_PARAM] = page_size
+            page_params[PAGE_NUMBER_PARAM] = page_number
+            response = self.http_request(
+                method_url, params=page_params, endpoint=endpoint, refresh=refresh
+            )
+            return self.parse_response(response, parse_page, endpoint)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page_number = 1
+            next_page: Future[Page[T]] | None = None
+            fetched_items = 0
+            while True:
+                page = (
+                    next_page.result()
+                    if next_page is not None
+                    else request_page(page_number)
+                )
+                next_page = None
+                fetched_items += len(page.items)
+                last_page = is_last_page(
+                    len(page.items),
+                    fetched_items,
+                    page_size,
+                    page.page_size,
+                    page.total,
+                )
+                page_number += 1
+                if prefetch and not last_page:
+                    next_page = executor.submit(
+                        copy_context().run, request_page, page_number
+                    )
+                yield page
+                if last_page:
+                    return
+
+    def iter_streamed_items(
+        self,
+        method_url: str,
+        item_model: type[BaseModelT],
+        params: dict | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        endpoint: str | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[BaseModelT]:
+        """
+        Iterate over the items of a list API method, decoding each page incrementally.
+        The body is read by chunks and each item is validated as soon as it is complete,
+        so the memory used is bounded by one item rather than by the page.
+        :param method_url: The URL of the API method.
+        :param item_model: The model the items are validated with.
+        :param params: The parameters for the request, the paging ones excluded.
+        :param page_size: The number of items requested per page.
+        :param endpoint: The endpoint template of the API method, defaults to its URL.
+        :param chunk_size: The number of bytes read at a time.
+        :return: An iterator of the validated items.
+        """
+        if endpoint is None:
+            endpoint = method_url
+        page_number = 1
+        fetched_items = 0
+        while True:
+            page_params = dict(params or {})
+            page_params[PAGE_SIZE_PARAM] = page_size
+            page_params[PAGE_NUMBER_PARAM] = page_number
+            response = self.http_request(
+                method_url, params=page_params, endpoint=endpoint, stream=True
+            )
+            with response:
+                chunks = self._count_bytes(response.iter_content(chunk_size), endpoint)
+                page = StreamedJsonArray(chunks)
+                page_items = 0
+                validation_time = 0.0
+                for item in page:
+                    page_items += 1
+                    start = time.perf_counter()
+                    validated = item_model.model_validate_json(item)
+                    validation_time += time.perf_counter() - start
+                    yield validated
+            self.metrics.record_validation(endpoint, page_items, validation_time)
+            self.hooks.on_validate(endpoint, page_items, validation_time)
+            fetched_items += page_items
+            if is_last_page(
+                page_items,
+                fetched_items,
+                page_size,
+                page.metadata.get("pageSize"),
+                page.metadata.get("total"),
+            ):
+                return
+            page_number += 1
+
+    def _count_bytes(self, chunks: Iterable[bytes], endpoint: str) -> Iterator[bytes]:
+        """
+        Record the size of the chunks of a streamed body as they are read.
+        :param chunks: The chunks of the body.
+        :param endpoint: The endpoint template of the request.
+        :return: The same chunks.
+        """
+        for chunk in chunks:
+            self.metrics.record_bytes(endpoint, len(chunk))
+            yield chunk
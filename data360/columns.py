@@ -0,0 +1,302 @@
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from itertools import accumulate, compress, islice, pairwise, repeat
+from operator import add
+from typing import Any, ClassVar, Self
+
+from pydantic import TypeAdapter
+
+
+def with_validity(values: list, validity: Iterable[int] | None) -> list:
+    """Replace the values of the null rows by None, when the column has a validity mask."""
+    if validity is None:
+        return values
+    return [
+        value if valid else None for value, valid in zip(values, validity, strict=True)
+    ]
+
+
+class NumericColumn:
+    """
+    A column of numbers, stored in an array of the type code of the column, with a
+    validity mask (1 for a value, 0 for a null) when the column is nullable.
+    """
+
+    typecode: ClassVar[str]
+
+    def __init__(self, nullable: bool = False):
+        self.values = array(self.typecode)
+        self.validity: bytearray | None = bytearray() if nullable else None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, row: int) -> Any:
+        if self.validity is not None and not self.validity[row]:
+            return None
+        return self.values[row]
+
+    def slice(self, start: int, stop: int) -> list:
+        validity = self.validity[start:stop] if self.validity is not None else None
+        return with_validity(self.values[start:stop].tolist(), validity)
+
+    def gather(self, rows: Sequence[int]) -> list:
+        validity = self.validity
+        return with_validity(
+            list(map(self.values.__getitem__, rows)),
+            map(validity.__getitem__, rows) if validity is not None else None,
+        )
+
+    def extend(self, values: list) -> None:
+        if self.validity is None:
+            self.values.extend(values)
+            return
+        self.values.extend([0 if value is None else value for value in values])
+        self.validity.extend([value is not None for value in values])
+
+    def extend_column(self, other: Self) -> None:
+        self.values.extend(other.values)
+        if self.validity is not None and other.validity is not None:
+            self.validity.extend(other.validity)
+
+    def take(self, rows: Sequence[int]) -> Self:
+        column = type(self)(self.validity is not None)
+        column.values = array(self.typecode, map(self.values.__getitem__, rows))
+        if self.validity is not None:
+            column.validity = bytearray(map(self.validity.__getitem__, rows))
+        return column
+
+
+class IntegerColumn(NumericColumn):
+    """A column of integers, stored in an array of 64-bit integers."""
+
+    typecode = "q"
+
+
+class FloatColumn(NumericColumn):
+    """A column of floats, stored in an array of doubles."""
+
+    typecode = "d"
+
+
+class BooleanColumn(NumericColumn):
+    """A column of booleans, stored in an array of bytes, 1 for True and 0 for False."""
+
+    typecode = "B"
+
+    def __getitem__(self, row: int) -> bool | None:
+        value = super().__getitem__(row)
+        return None if value is None else bool(value)
+
+    def slice(self, start: int, stop: int) -> list[bool | None]:
+        return [
+            None if value is None else bool(value)
+            for value in super().slice(start, stop)
+        ]
+
+    def gather(self, rows: Sequence[int]) -> list[bool | None]:
+        return [
+            None if value is None else bool(value) for value in super().gather(rows)
+        ]
+
+
+class StringColumn:
+    """
+    A column of strings of many distinct values (uids, paths, names), their UTF-8 bytes
+    concatenated in one buffer and delimited by offsets, with a validity mask when the
+    column is nullable. The row i is data[offsets[i]:offsets[i + 1]].
+    """
+
+    def __init__(self, nullable: bool = False):
+        self.data = bytearray()
+        self.offsets = array("q", [0])
+        self.validity: bytearray | None = bytearray() if nullable else None
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int) -> str | None:
+        if self.validity is not None and not self.validity[row]:
+            return None
+        return self.data[self.offsets[row] : self.offsets[row + 1]].decode()
+
+    def slice(self, start: int, stop: int) -> list[str | None]:
+        offsets = self.offsets[start : stop + 1]
+        first = offsets[0]
+        chunk = self.data[first : offsets[-1]]
+        bounds = [(begin - first, end - first) for begin, end in pairwise(offsets)]
+        if chunk.isascii():
+            # the offsets in bytes are offsets in characters: decode the rows at once
+            text = chunk.decode()
+            values = [text[begin:end] for begin, end in bounds]
+        else:
+            values = [chunk[begin:end].decode() for begin, end in bounds]
+        validity = self.validity[start:stop] if self.validity is not None else None
+        return with_validity(values, validity)
+
+    def chunks(self, rows: Sequence[int]) -> list[bytearray]:
+        """Return the bytes of the rows."""
+        offsets = self.offsets
+        return list(
+            map(
+                self.data.__getitem__,
+                map(
+                    slice,
+                    map(offsets.__getitem__, rows),
+                    map(offsets.__getitem__, map(add, rows, repeat(1))),
+                ),
+            )
+        )
+
+    def gather(self, rows: Sequence[int]) -> list[str | None]:
+        validity = self.validity
+        return with_validity(
+            [chunk.decode() for chunk in self.chunks(rows)],
+            map(validity.__getitem__, rows) if validity is not None else None,
+        )
+
+    def extend(self, values: list[str | None]) -> None:
+        encoded = [b"" if value is None else value.encode() for value in values]
+        self.data += b"".join(encoded)
+        self.offsets.extend(
+            islice(accumulate(map(len, encoded), initial=self.offsets[-1]), 1, None)
+        )
+        if self.validity is not None:
+            self.validity.extend([value is not None for value in values])
+
+    def extend_column(self, other: Self) -> None:
+        base = len(self.data)
+        self.data += other.data
+        self.offsets.extend(map(base.__add__, other.offsets[1:]))
+        if self.validity is not None and other.validity is not None:
+            self.validity.extend(other.validity)
+
+    def empty(self) -> Self:
+        """Return an empty column of the same kind."""
+        return type(self)(self.validity is not None)
+
+    def take(self, rows: Sequence[int]) -> Self:
+        column = self.empty()
+        chunks = self.chunks(rows)
+        column.data = bytearray().join(chunks)
+        column.offsets = array("q", accumulate(map(len, chunks), initial=0))
+        if self.validity is not None:
+            column.validity = bytearray(map(self.validity.__getitem__, rows))
+        return column
+
+
+class JsonColumn(StringColumn):
+    """
+    A column of nested values (models, dicts, values of several types), stored as their
+    JSON text in a string column, and validated back with the type adapter of the column
+    when read.
+    """
+
+    def __init__(self, nullable: bool = False, adapter: TypeAdapter | None = None):
+        super().__init__(nullable)
+        self.adapter = adapter if adapter is not None else TypeAdapter(Any)
+
+    def __getitem__(self, row: int) -> Any:
+        return self.load(super().__getitem__(row))
+
+    def load(self, text: str | None) -> Any:
+        return None if text is None else self.adapter.validate_json(text)
+
+    def slice(self, start: int, stop: int) -> list:
+        return list(map(self.load, super().slice(start, stop)))
+
+    def gather(self, rows: Sequence[int]) -> list:
+        return list(map(self.load, super().gather(rows)))
+
+    def extend(self, values: list) -> None:
+        dump = self.adapter.dump_json
+        super().extend(
+            [
+                None if value is None else dump(value, by_alias=True).decode()
+                for value in values
+            ]
+        )
+
+    def empty(self) -> Self:
+        return type(self)(self.validity is not None, self.adapter)
+
+
+class DictionaryColumn:
+    """
+    A column of strings of few distinct values (asset type uids, categories, scores), each
+    value stored once in a dictionary and the rows holding its code. The nulls have
+    the code -1, as in a pandas Categorical, which makes the codes their validity mask.
+    """
+
+    def __init__(self, nullable: bool = False):
+        self.nullable = nullable
+        self.codes = array("i")
+        self.values: list[str] = []
+        self.index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> str | None:
+        code = self.codes[row]
+        return None if code < 0 else self.values[code]
+
+    def decode(self, codes: Iterable[int]) -> list[str | None]:
+        values = self.values
+        return [values[code] if code >= 0 else None for code in codes]
+
+    def slice(self, start: int, stop: int) -> list[str | None]:
+        return self.decode(self.codes[start:stop])
+
+    def gather(self, rows: Sequence[int]) -> list[str | None]:
+        return self.decode(map(self.codes.__getitem__, rows))
+
+    def code(self, value: str) -> int:
+        """Return the code of a value, adding it to the dictionary if needed."""
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def extend(self, values: list[str | None]) -> None:
+        code, index = self.code, self.index
+        self.codes.extend(
+            [
+                -1 if value is None else index[value] if value in index else code(value)
+                for value in values
+            ]
+        )
+
+    def extend_column(self, other: Self) -> None:
+        # the codes of the other dictionary in this one, -1 (the last item) staying -1
+        codes = [self.code(value) for value in other.values] + [-1]
+        self.codes.extend(map(codes.__getitem__, other.codes))
+
+    def take(self, rows: Sequence[int]) -> Self:
+        column = type(self)(self.nullable)
+        column.values, column.index = list(self.values), dict(self.index)
+        column.codes = array("i", map(self.codes.__getitem__, rows))
+        return column
+
+    def select(
+        self, predicate: Callable[[str | None], bool], rows: Sequence[int] | None = None
+    ) -> array:
+        """
+        Select the rows whose value satisfies a predicate, evaluated once per distinct
+        value rather than once per row.
+        :param predicate: The predicate, called with None for the nulls.
+        :param rows: The rows the selection is made from, all the rows when None.
+        :return: The selected rows, in order.
+        """
+        selected = {code for code, value in enumerate(self.values) if predicate(value)}
+        if predicate(None):
+            selected.add(-1)
+        if rows is None:
+            matches = map(selected.__contains__, self.codes)
+            return array("q", compress(range(len(self.codes)), matches))
+        matches = map(selected.__contains__, map(self.codes.__getitem__, rows))
+        return array("q", compress(rows, matches))
+
+
+Column = NumericColumn | StringColumn | DictionaryColumn
@@ -0,0 +1,153 @@
+import contextlib
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+
+import requests
+
+
+@dataclass(frozen=True)
+class RequestInfo:
+    """
+    Represents one attempt of a request to the Data360 API, as seen by the hooks.
+    The headers are left out, as they carry the API secret.
+    """
+
+    method: str
+    url: str
+    endpoint: str  # The endpoint template, ex: "/assets/{uid}"
+    params: dict
+    attempt: int = 1  # Starting at 1, increased by the retries
+
+
+class Hooks:
+    """
+    Callbacks around the API calls of a Data360 instance, to attach profilers or tracing.
+    Every method does nothing by default, subclasses override the ones they need.
+    The hooks are called from the threads making the requests, possibly concurrently.
+    """
+
+    def on_request(self, request: RequestInfo) -> None:
+        """
+        Called before each attempt of a request is sent.
+        :param request: The request about to be sent.
+        """
+
+    def on_response(
+        self, request: RequestInfo, response: requests.Response, seconds: float
+    ) -> None:
+        """
+        Called when a response is received, whatever its status code.
+        :param request: The request sent.
+        :param response: The response received.
+        :param seconds: The time until the response.
+        """
+
+    def on_error(
+        self, request: RequestInfo, error: BaseException, seconds: float
+    ) -> None:
+        """
+        Called when an attempt fails without response (connection error, timeout).
+        :param request: The request sent.
+        :param error: The exception raised.
+        :param seconds: The time until the failure.
+        """
+
+    def on_validate(self, endpoint: str, items: int, seconds: float) -> None:
+        """
+        Called when a response was parsed into models.
+        :param endpoint: The endpoint template of the request.
+        :param items: The number of models parsed.
+        :param seconds: The time spent decoding and validating them.
+        """
+
+    def span(self, name: str, attributes: dict | None = None) -> AbstractContextManager:
+        """
+        Open a span around an aggregation, an asset type or a request.
+        The spans opened while another one is open are nested under it.
+        :param name: The name of the span (ex: "data360.assets").
+        :param attributes: The attributes of the span.
+        :return: A context manager closing the span.
+        """
+        return contextlib.nullcontext()
+
+
+class CompositeHooks(Hooks):
+    """
+    Calls several hooks in turn, in the order they were given.
+    """
+
+    def __init__(self, hooks: Iterable[Hooks] = ()):
+        """
+        Initialize the composite.
+        :param hooks: The hooks to call.
+        """
+        self.hooks = list(hooks)
+
+    def on_request(self, request: RequestInfo) -> None:
+        for hooks in self.hooks:
+            hooks.on_request(request)
+
+    def on_response(
+        self, request: RequestInfo, response: requests.Response, seconds: float
+    ) -> None:
+        for hooks in self.hooks:
+            hooks.on_response(request, response, seconds)
+
+    def on_error(
+        self, request: RequestInfo, error: BaseException, seconds: float
+    ) -> None:
+        for hooks in self.hooks:
+            hooks.on_error(request, error, seconds)
+
+    def on_validate(self, endpoint: str, items: int, seconds: float) -> None:
+        for hooks in self.hooks:
+            hooks.on_validate(endpoint, items, seconds)
+
+    @contextlib.contextmanager
+    def span(self, name: str, attributes: dict | None = None) -> Iterator[None]:
+        with contextlib.ExitStack() as stack:
+            for hooks in self.hooks:
+                stack.enter_context(hooks.span(name, attributes))
+            yield
+
+
+class OpenTelemetryHooks(Hooks):
+    """
+    Hooks opening OpenTelemetry spans, the requests being nested under their aggregation.
+    Requires the optional opentelemetry-api package.
+    """
+
+    def __init__(self, tracer=None):
+        """
+        Initialize the hooks.
+        :param tracer: The OpenTelemetry tracer of the spans, defaults to the "data360" one.
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError as error:
+            raise ImportError(
+                "OpenTelemetryHooks requires the opentelemetry-api package"
+            ) from error
+        self._trace = trace
+        self.tracer = tracer if tracer is not None else trace.get_tracer("data360")
+
+    def span(self, name: str, attributes: dict | None = None) -> AbstractContextManager:
+        return self.tracer.start_as_current_span(name, attributes=attributes)
+
+    def on_response(
+        self, request: RequestInfo, response: requests.Response, seconds: float
+    ) -> None:
+        span = self._trace.get_current_span()
+        span.set_attribute("http.response.status_code", response.status_code)
+        span.set_attribute("http.request.resend_count", request.attempt - 1)
+
+    def on_error(
+        self, request: RequestInfo, error: BaseException, seconds: float
+    ) -> None:
+        self._trace.get_current_span().record_exception(error)
+
+    def on_validate(self, endpoint: str, items: int, seconds: float) -> None:
+        self._trace.get_current_span().add_event(
+            "validate", {"items": items, "seconds": seconds}
+        )
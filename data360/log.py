@@ -0,0 +1,125 @@
+import logging
+import queue
+import random
+from collections.abc import Callable
+from logging.handlers import QueueHandler, QueueListener
+from typing import Self
+
+# Logger of the messages logged for every HTTP request, the ones that can be sampled
+REQUEST_LOGGER_NAME = "data360.requests"
+DEFAULT_FORMAT = "%(asctime)s %(levelname)s %(name)s [%(threadName)s] %(message)s"
+
+request_logger = logging.getLogger(REQUEST_LOGGER_NAME)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a fraction of the records of a logger and of its children.
+    Warnings and errors are always kept, so that sampling never hides a failure.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        name: str = REQUEST_LOGGER_NAME,
+        random: Callable[[], float] = random.random,
+    ):
+        """
+        Initialize the filter.
+        :param rate: The fraction of the records kept, between 0 and 1.
+        :param name: The name of the sampled logger.
+        :param random: The function drawing a number in [0, 1) for each record.
+        """
+        if not 0 <= rate <= 1:
+            raise ValueError("The sample rate must be between 0 and 1")
+        super().__init__()
+        self.rate = rate
+        self.sampled_name = name
+        self._random = random
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        if record.name != self.sampled_name and not record.name.startswith(
+            self.sampled_name + "."
+        ):
+            return True
+        return self._random() < self.rate
+
+
+class BackgroundLogging:
+    """
+    Queue-backed logging of the data360 loggers.
+    The request threads only put the records in a queue, the formatting and the
+    file or console I/O are done by a background thread.
+    """
+
+    def __init__(
+        self,
+        handler: logging.Handler,
+        level: int | str = logging.INFO,
+        request_sample_rate: float = 1.0,
+        logger_name: str = "data360",
+    ):
+        """
+        Initialize the logging, without starting it.
+        :param handler: The handler writing the records, called from the background thread.
+        :param level: The level of the data360 loggers.
+        :param request_sample_rate: The fraction of the per-request messages kept.
+        :param logger_name: The name of the logger the queue is attached to.
+        """
+        self.handler = handler
+        self.level = level
+        self.logger = logging.getLogger(logger_name)
+        self.queue_handler = QueueHandler(queue.SimpleQueue())
+        if request_sample_rate < 1:
+            self.queue_handler.addFilter(SamplingFilter(request_sample_rate))
+        self.listener = QueueListener(
+            self.queue_handler.queue, handler, respect_handler_level=True
+        )
+        self._previous_level = logging.NOTSET
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> Self:
+        """Attach the queue to the data360 loggers and start the background thread."""
+        self._previous_level = self.logger.level
+        self.logger.setLevel(self.level)
+        self.logger.addHandler(self.queue_handler)
+        self.listener.start()
+        return self
+
+    def stop(self) -> None:
+        """Detach the queue, write the pending records and stop the background thread."""
+        self.logger.removeHandler(self.queue_handler)
+        self.logger.setLevel(self._previous_level)
+        self.listener.stop()
+        self.handler.close()
+
+
+def configure_logging(
+    filename: str | None = None,
+    level: int | str = logging.INFO,
+    request_sample_rate: float = 1.0,
+    fmt: str = DEFAULT_FORMAT,
+) -> BackgroundLogging:
+    """
+    Start logging the data360 messages from a background thread.
+    Meant to be called once by the applications, the library configures nothing by itself.
+    :param filename: The file the messages are appended to, None for the standard error.
+    :param level: The level of the data360 loggers.
+    :param request_sample_rate: The fraction of the per-request messages kept.
+    :param fmt: The format of the messages.
+    :return: The started logging, to stop once the application is done.
+    """
+    handler: logging.Handler
+    if filename is None:
+        handler = logging.StreamHandler()
+    else:
+        handler = logging.FileHandler(filename, encoding="utf-8")
+    handler.setFormatter(logging.Formatter(fmt))
+    return BackgroundLogging(handler, level, request_sample_rate).start()
@@ -0,0 +1,212 @@
+import bisect
+import math
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+
+# Upper bounds of the duration buckets, in seconds
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class Histogram:
+    """
+    Distribution of observed values, counted in fixed buckets.
+    """
+
+    bounds: tuple[float, ...] = DURATION_BUCKETS
+    counts: list[int] = field(default_factory=list)  # per bucket, +Inf last
+    count: int = 0
+    sum: float = 0.0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        """
+        Count a value in its bucket.
+        :param value: The observed value.
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> dict:
+        """Return the count, sum, mean and cumulative bucket counts of the values."""
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip((*self.bounds, math.inf), self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "buckets": buckets,
+        }
+
+
+@dataclass
+class EndpointMetrics:
+    """
+    Counters of the requests made to an endpoint template (ex: "/assets/{uid}").
+    """
+
+    requests: int = 0
+    statuses: Counter = field(default_factory=Counter)
+    latency: Histogram = field(default_factory=Histogram)
+    bytes_received: int = 0
+    cache_hits: int = 0
+    items: int = 0
+    validation: Histogram = field(default_factory=Histogram)
+
+    def snapshot(self) -> dict:
+        """Return a copy of the counters, as plain values."""
+        return {
+            "requests": self.requests,
+            "statuses": dict(self.statuses),
+            "latency": self.latency.snapshot(),
+            "bytes_received": self.bytes_received,
+            "cache_hits": self.cache_hits,
+            "items": self.items,
+            "validation": self.validation.snapshot(),
+        }
+
+
+class MetricsRegistry:
+    """
+    Per-endpoint metrics of a Data360 instance, shared by its threads.
+    """
+
+    def __init__(self):
+        self._endpoints: dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, endpoint: str) -> EndpointMetrics:
+        """Get the metrics of an endpoint, creating them, the lock being held."""
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    def record_request(
+        self, endpoint: str, outcome: int | str, seconds: float, size: int = 0
+    ) -> None:
+        """
+        Record one HTTP request sent.
+        :param endpoint: The endpoint template of the request.
+        :param outcome: The status code received, or the name of the exception raised.
+        :param seconds: The time until the response (its body included unless streamed).
+        :param size: The number of bytes of the body received.
+        """
+        with self._lock:
+            metrics = self._endpoint(endpoint)
+            metrics.requests += 1
+            metrics.statuses[outcome] += 1
+            metrics.latency.observe(seconds)
+            metrics.bytes_received += size
+
+    def record_bytes(self, endpoint: str, size: int) -> None:
+        """
+        Record bytes of a body read after its request was recorded, when streamed.
+        :param endpoint: The endpoint template of the request.
+        :param size: The number of bytes read.
+        """
+        with self._lock:
+            self._endpoint(endpoint).bytes_received += size
+
+    def record_cache_hit(self, endpoint: str) -> None:
+        """
+        Record a response served from the cache without any request.
+        :param endpoint: The endpoint template of the request.
+        """
+        with self._lock:
+            self._endpoint(endpoint).cache_hits += 1
+
+    def record_validation(self, endpoint: str, items: int, seconds: float) -> None:
+        """
+        Record the parsing of a response into models.
+        :param endpoint: The endpoint template of the request.
+        :param items: The number of models parsed.
+        :param seconds: The time spent decoding and validating them.
+        """
+        with self._lock:
+            metrics = self._endpoint(endpoint)
+            metrics.items += items
+            metrics.validation.observe(seconds)
+
+    def stats(self) -> dict[str, dict]:
+        """
+        Take a snapshot of the metrics.
+        :return: The metrics of each endpoint template, as plain values.
+        """
+        with self._lock:
+            return {
+                endpoint: metrics.snapshot()
+                for endpoint, metrics in sorted(self._endpoints.items())
+            }
+
+    def reset(self) -> None:
+        """Forget every recorded metric."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus(self, prefix: str = "data360") -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+        :param prefix: The prefix of the metric names.
+        :return: The metrics, ready to be served on a /metrics endpoint.
+        """
+        stats = self.stats()
+        lines: list[str] = []
+
+        def header(name: str, kind: str, description: str) -> str:
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            return f"{prefix}_{name}"
+
+        name = header("requests_total", "counter", "HTTP requests sent.")
+        for endpoint, metrics in stats.items():
+            for status, count in metrics["statuses"].items():
+                labels = _labels(endpoint=endpoint, status=status)
+                lines.append(f"{name}{labels} {count}")
+        for key, kind, description in (
+            ("latency", "request_duration_seconds", "Time until the HTTP responses."),
+            ("validation", "validation_duration_seconds", "Time parsing models."),
+        ):
+            name = header(kind, "histogram", description)
+            for endpoint, metrics in stats.items():
+                histogram = metrics[key]
+                for bound, count in histogram["buckets"].items():
+                    labels = _labels(endpoint=endpoint, le=_format_bound(bound))
+                    lines.append(f"{name}_bucket{labels} {count}")
+                labels = _labels(endpoint=endpoint)
+                lines.append(f"{name}_sum{labels} {histogram['sum']}")
+                lines.append(f"{name}_count{labels} {histogram['count']}")
+        for key, kind, description in (
+            ("bytes_received", "response_bytes_total", "Bytes of body received."),
+            ("cache_hits", "cache_hits_total", "Responses served from the cache."),
+            ("items", "items_total", "Models parsed from the responses."),
+        ):
+            name = header(kind, "counter", description)
+            for endpoint, metrics in stats.items():
+                lines.append(f"{name}{_labels(endpoint=endpoint)} {metrics[key]}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: object) -> str:
+    """Render Prometheus labels, escaping their values."""
+    rendered = ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n"),
+        )
+        for name, value in labels.items()
+    )
+    return "{" + rendered + "}"
+
+
+def _format_bound(bound: float) -> str:
+    """Render the upper bound of a bucket as Prometheus expects it."""
+    return "+Inf" if math.isinf(bound) else repr(bound)
@@ -1,6 +1,20 @@
+import sys
 from enum import Enum
+from typing import Annotated, Any, Generic, Self, TypeVar, get_args
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    Tag,
+    TypeAdapter,
+    field_serializer,
+    model_validator,
+)
+
+T = TypeVar("T")
 
 
 def to_camel(string: str) -> str:
@@ -10,6 +24,13 @@ def to_camel(string: str) -> str:
     return "".join(word.capitalize() for word in string.split("_"))
 
 
+# A str of few distinct values, interned when validated so that the objects share one copy
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# The sets of fields set shared by the validated objects, by their content
+FIELDS_SETS: dict[frozenset[str], set[str]] = {}
+
+
 class PascalCaseObject(BaseModel):
     model_config = ConfigDict(
         alias_generator=to_camel,  # Automatically generates the alias for attributes in CamelCase to comply with the API convention.  Used in serialization/deserialization into json.
@@ -17,6 +38,16 @@ class PascalCaseObject(BaseModel):
         frozen=True,  # Make all classes immutable (Functional programming rocks!)
     )
 
+    @model_validator(mode="after")
+    def _share_fields_set(self) -> Self:
+        # The API sends every key of an object, so the objects of a class have the same
+        # fields set: share one set rather than keeping a copy per object. It is never
+        # mutated, the objects being frozen and model_copy copying it before any update.
+        fields_set = self.__pydantic_fields_set__
+        shared = FIELDS_SETS.setdefault(frozenset(fields_set), fields_set)
+        object.__setattr__(self, "__pydantic_fields_set__", shared)
+        return self
+
 
 class AssetClass(PascalCaseObject):
     """
@@ -52,6 +83,18 @@ class AssetClass(PascalCaseObject):
         )
 
 
+# The AssetClass instances shared by the asset types, by their values
+ASSET_CLASSES: dict[tuple, AssetClass] = {}
+
+
+def shared_asset_class(asset_class: AssetClass) -> AssetClass:
+    """
+    Returns the instance shared by the asset types of the same class, the asset classes
+    being few and embedded in every asset type.
+    """
+    return ASSET_CLASSES.setdefault(tuple(asset_class.__dict__.values()), asset_class)
+
+
 # Assets
 class AssetClassName(Enum):
     """
@@ -83,7 +126,9 @@ class AssetType(PascalCaseObject):
     id: int | None = Field(alias="ID", default=None)
     uid: str = Field(alias="uid")
     name: str
-    asset_class: AssetClass = Field(alias="Class")
+    asset_class: Annotated[AssetClass, AfterValidator(shared_asset_class)] = Field(
+        alias="Class"
+    )
     description: str
     auto_display_description: bool | None = None
     hierarchical: bool | None = None
@@ -122,10 +167,10 @@ class Asset(PascalCaseObject):
     asset_uid: str
     xref_id: str | None = None
     asset_type_id: int
-    asset_type_uid: str
+    asset_type_uid: InternedStr
     updated_on: str | None = None
     created_on: str
-    color: str | None = None
+    color: InternedStr | None = None
     path: str | None = None
     display_path: str | None = None
     name: str | None = None
@@ -134,16 +179,23 @@ class Asset(PascalCaseObject):
     business_term_definition: str | None = None
     data_point_definition: str | None = None
     key: str | None = None
-    data_privacy_type: str | None = None
-    integrity: str | None = None
-    confidentiality: str | None = None
-    qlty_score: str | None = None
-    critical: str | None = None
-    governance_score: str | None = None
-    suggested_critical: str | None = None
-    data_classified_by: str | None = None
+    data_privacy_type: InternedStr | None = None
+    integrity: InternedStr | None = None
+    confidentiality: InternedStr | None = None
+    qlty_score: InternedStr | None = None
+    critical: InternedStr | None = None
+    governance_score: InternedStr | None = None
+    suggested_critical: InternedStr | None = None
+    data_classified_by: InternedStr | None = None
+
+    def __eq__(self, other):
+        if not isinstance(other, Asset):
+            return NotImplemented
+        # Assets are identified by their uid
+        return self.asset_uid == other.asset_uid
 
     def __hash__(self):
+        # Hash only the fields used in __eq__, the hash of a str is cached by Python
         return hash(self.asset_uid)
 
 
@@ -174,6 +226,15 @@ class Predicate(PascalCaseObject):
     is_system: bool
     is_in_use: bool
 
+    def __eq__(self, other):
+        if not isinstance(other, Predicate):
+            return NotImplemented
+        # Predicates are identified by their uid
+        return self.uid == other.uid
+
+    def __hash__(self):
+        return hash(self.uid)
+
 
 class RelationshipType(PascalCaseObject):
     """
@@ -190,6 +251,15 @@ class RelationshipType(PascalCaseObject):
     object: AssetType
     object_cardinality: Cardinality
 
+    def __eq__(self, other):
+        if not isinstance(other, RelationshipType):
+            return NotImplemented
+        # Relationship types are identified by their uid
+        return self.uid == other.uid
+
+    def __hash__(self):
+        return hash(self.uid)
+
 
 class Relationship(PascalCaseObject):
     """
@@ -773,6 +843,96 @@ class SystemFieldType(PascalCaseObject):
     system: SystemFieldTypeAttributes
 
 
+# The wrapper models of the field types, each holding the attributes under the key of its type
+FIELD_TYPE_WRAPPERS: tuple[type[PascalCaseObject], ...] = (
+    BooleanFieldType,
+    ComputedOwnershipLookupFieldType,
+    ComputedRelationshipFieldType,
+    ComputedRelationshipLookupFieldType,
+    ComputedRelationshipReferenceListFieldType,
+    ReferenceListFieldType,
+    CounterFieldType,
+    DateFieldType,
+    DateTimeFieldType,
+    DecimalFieldType,
+    HtmlFieldType,
+    JsonFieldType,
+    JsonElementFieldType,
+    LinkFieldType,
+    LookupFieldType,
+    NumberFieldType,
+    PathFieldType,
+    RelationshipFieldType,
+    TextFieldType,
+    TagFieldType,
+    ScoreFieldType,
+    SystemFieldType,
+)
+# The type key of each wrapper, by alias and by attribute name
+FIELD_TYPE_TAGS: dict[str, str] = {
+    key: field.alias or name
+    for wrapper in FIELD_TYPE_WRAPPERS
+    for name, field in wrapper.model_fields.items()
+    for key in (name, field.alias or name)
+}
+
+
+def field_type_tag(value: object) -> str | None:
+    """
+    Discriminates the type of a field on the single key of its payload (ex: "Boolean").
+    The payloads without any known key are search field types.
+    :param value: The payload, or an instance of one of the field types.
+    :return: The tag of the type, None when the value is neither a dict nor a field type.
+    """
+    if isinstance(value, dict):
+        keys = value
+    elif isinstance(value, PascalCaseObject):
+        keys = type(value).model_fields
+    else:
+        return None
+    for key in keys:
+        tag = FIELD_TYPE_TAGS.get(key)
+        if tag is not None:
+            return tag
+    return "Search"
+
+
+# Validation dispatches on the type key, rather than trying every member of the union
+FieldType = Annotated[
+    (
+        Annotated[SearchFieldType, Tag("Search")]
+        | Annotated[BooleanFieldType, Tag("Boolean")]
+        | Annotated[ComputedOwnershipLookupFieldType, Tag("ComputedOwnershipLookup")]
+        | Annotated[ComputedRelationshipFieldType, Tag("ComputedRelationship")]
+        | Annotated[
+            ComputedRelationshipLookupFieldType, Tag("ComputedRelationshipLookup")
+        ]
+        | Annotated[
+            ComputedRelationshipReferenceListFieldType,
+            Tag("ComputedRelationshipReferenceList"),
+        ]
+        | Annotated[ReferenceListFieldType, Tag("ReferenceList")]
+        | Annotated[CounterFieldType, Tag("Counter")]
+        | Annotated[DateFieldType, Tag("Date")]
+        | Annotated[DateTimeFieldType, Tag("DateTime")]
+        | Annotated[DecimalFieldType, Tag("Decimal")]
+        | Annotated[HtmlFieldType, Tag("Html")]
+        | Annotated[JsonFieldType, Tag("Json")]
+        | Annotated[JsonElementFieldType, Tag("JsonElement")]
+        | Annotated[LinkFieldType, Tag("Link")]
+        | Annotated[LookupFieldType, Tag("Lookup")]
+        | Annotated[NumberFieldType, Tag("Number")]
+        | Annotated[PathFieldType, Tag("Path")]
+        | Annotated[RelationshipFieldType, Tag("Relationship")]
+        | Annotated[TextFieldType, Tag("Text")]
+        | Annotated[TagFieldType, Tag("Tag")]
+        | Annotated[ScoreFieldType, Tag("Score")]
+        | Annotated[SystemFieldType, Tag("System")]
+    ),
+    Discriminator(field_type_tag),
+]
+
+
 class FieldAsset(PascalCaseObject):
     """
     Represents a field in the Data360 system.
@@ -780,34 +940,66 @@ class FieldAsset(PascalCaseObject):
 
     name: str
     friendly_name: str
-    category: str
-    action_type_uid: str | None = None
-    asset_type_uid: str
-    relationship_type_uid: str | None = None
+    category: InternedStr
+    action_type_uid: InternedStr | None = None
+    asset_type_uid: InternedStr
+    relationship_type_uid: InternedStr | None = None
     id: int | None = None
-    type: (
-        SearchFieldType
-        | BooleanFieldType
-        | ComputedOwnershipLookupFieldType
-        | ComputedRelationshipFieldType
-        | ComputedRelationshipLookupFieldType
-        | ComputedRelationshipReferenceListFieldType
-        | ReferenceListFieldType
-        | CounterFieldType
-        | DateFieldType
-        | DateTimeFieldType
-        | DecimalFieldType
-        | HtmlFieldType
-        | JsonFieldType
-        | JsonElementFieldType
-        | LinkFieldType
-        | LookupFieldType
-        | NumberFieldType
-        | PathFieldType
-        | RelationshipFieldType
-        | TextFieldType
-        | TagFieldType
-        | ScoreFieldType
-        | SystemFieldType
-        | None
-    )
+    type: FieldType | None
+
+    def __eq__(self, other):
+        if not isinstance(other, FieldAsset):
+            return NotImplemented
+        # Fields are identified by their name within their asset type
+        return self.name == other.name and self.asset_type_uid == other.asset_type_uid
+
+    def __hash__(self):
+        return hash((self.asset_type_uid, self.name))
+
+
+FIELD_TYPE_ADAPTER: TypeAdapter[Any] = TypeAdapter(FieldType | None)
+# The classes of the members of FieldType, unwrapped from their Annotated and Tag
+FIELD_TYPE_CLASSES: tuple[type[PascalCaseObject], ...] = tuple(
+    get_args(member)[0] for member in get_args(get_args(FieldType)[0])
+)
+
+
+class LazyFieldAsset(FieldAsset):
+    """
+    A field whose type is kept as its raw payload when validated, and only validated
+    into its field type on first access. The scalar attributes are validated as usual,
+    and it is equal to the FieldAsset of the same name and asset type.
+    """
+
+    type: Any  # The raw payload until accessed, then the field type
+
+    def _field_type(self) -> FieldType | None:
+        value = self.__dict__["type"]
+        if value is not None and not isinstance(value, FIELD_TYPE_CLASSES):
+            # every other payload is validated, so that the invalid ones raise like FieldAsset
+            value = FIELD_TYPE_ADAPTER.validate_python(value)
+            # cache the field type in place of the payload, like a cached_property
+            self.__dict__["type"] = value
+        return value
+
+    @field_serializer("type")
+    def _serialize_type(self, value: Any) -> FieldType | None:
+        return self._field_type()
+
+
+# Set after the class is built, so that pydantic keeps "type" as a field
+LazyFieldAsset.type = property(LazyFieldAsset._field_type)  # type: ignore[assignment,method-assign]
+
+
+class Page(BaseModel, Generic[T]):
+    """
+    Represents a page returned by a list method of the Data360 API.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    # The envelope of the pages is in camelCase, unlike the objects it contains
+    items: list[T] = []
+    page_size: int | None = Field(alias="pageSize", default=None)
+    page_num: int | None = Field(alias="pageNum", default=None)
+    total: int | None = None
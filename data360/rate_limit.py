@@ -0,0 +1,86 @@
+import threading
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """
+    Token bucket limiting the request rate, safe to share between threads.
+    Tokens are reserved under the lock and waited for outside of it,
+    so the callers are served in order without holding each other up.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize a full bucket.
+        :param rate: The number of tokens added per second.
+        :param capacity: The maximum number of tokens, i.e. the burst size, defaults to the rate, at least 1.
+        :param clock: The monotonic clock the tokens are refilled with.
+        :param sleep: The function waiting for the tokens.
+        """
+        if rate <= 0:
+            raise ValueError("The rate of a token bucket must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, waiting until they are available.
+        :param tokens: The number of tokens to take.
+        :return: The time waited, in seconds.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            # the tokens may go negative: it reserves the next ones for this caller
+            self._tokens -= tokens
+            wait = max(0.0, -self._tokens / self.rate)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def shared_token_bucket(
+    base_url: str, rate: float, capacity: float | None = None
+) -> TokenBucket:
+    """
+    Get the token bucket shared by every instance pointing at the same base URL.
+    The first call for a base URL sets the rate and capacity of its bucket.
+    :param base_url: The base URL of the Data360 instance.
+    :param rate: The number of requests allowed per second.
+    :param capacity: The burst size, defaults to the rate, at least 1.
+    :return: The token bucket of the base URL.
+    :raise ValueError: When the bucket of the base URL has another rate or capacity.
+    """
+    key = base_url.rstrip("/").lower()
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = _buckets[key] = TokenBucket(rate, capacity)
+            return bucket
+    if capacity is None:
+        capacity = max(1.0, rate)
+    if (bucket.rate, bucket.capacity) != (rate, capacity):
+        raise ValueError(
+            f"The token bucket of {base_url} is shared with rate={bucket.rate} and "
+            f"capacity={bucket.capacity}, not rate={rate} and capacity={capacity}"
+        )
+    return bucket
@@ -0,0 +1,113 @@
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+
+import requests
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Represents how failed idempotent requests to Data360 are retried.
+    """
+
+    max_attempts: int = 5  # 1 disables the retries
+    backoff_factor: float = 0.5  # Seconds, doubled after each attempt
+    max_backoff: float = 30.0  # Upper bound of a single wait, in seconds
+    max_retry_time: float = 120.0  # Total time budget of the retries, in seconds
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    retry_methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    def is_retryable(self, method: str, status_code: int | None = None) -> bool:
+        """
+        Tell whether a request can be retried.
+        :param method: The HTTP method of the request.
+        :param status_code: The status code received, None for a connection error or timeout.
+        :return: True when the request is idempotent and the failure is transient.
+        """
+        if method.upper() not in self.retry_methods:
+            return False
+        return status_code is None or status_code in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Compute the wait before the next attempt, exponential with full jitter.
+        :param attempt: The number of the attempt that failed, starting at 1.
+        :return: The wait in seconds.
+        """
+        ceiling = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def delay(self, attempt: int, response: requests.Response | None = None) -> float:
+        """
+        Compute the wait before the next attempt, honouring the Retry-After header.
+        :param attempt: The number of the attempt that failed, starting at 1.
+        :param response: The failed response, None for a connection error or timeout.
+        :return: The wait in seconds.
+        """
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+        return self.backoff(attempt)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header, given either in seconds or as an HTTP date.
+    :param value: The value of the header.
+    :return: The wait in seconds, None when the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_date.timestamp() - time.time())
+
+
+@dataclass
+class RetryStats:
+    """
+    Counts the attempts made by a Data360 instance, shared by its threads.
+    """
+
+    attempts: int = 0
+    retries: int = 0
+    exhausted: int = 0
+    wait_seconds: float = 0.0
+    outcomes: Counter = field(default_factory=Counter)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record_attempt(self, outcome: int | str) -> None:
+        """
+        Record one attempt.
+        :param outcome: The status code received, or the name of the exception raised.
+        """
+        with self._lock:
+            self.attempts += 1
+            self.outcomes[outcome] += 1
+
+    def record_retry(self, wait: float) -> None:
+        """
+        Record a retry about to be made.
+        :param wait: The wait before the retry, in seconds.
+        """
+        with self._lock:
+            self.retries += 1
+            self.wait_seconds += wait
+
+    def record_exhausted(self) -> None:
+        """Record a request given up after its retries."""
+        with self._lock:
+            self.exhausted += 1
@@ -0,0 +1,149 @@
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from itertools import chain, islice
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from data360.arrow import (
+    TableT,
+    arrow_schema,
+    from_record_batch,
+    import_pyarrow,
+    to_record_batch,
+)
+from data360.client import Data360Instance, filter_asset_types_with_assets
+from data360.meta_model import MetaModel
+from data360.table import (
+    AssetTable,
+    AssetTypeTable,
+    ColumnarTable,
+    FieldTable,
+    ModelT,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# The number of rows per record batch, and per row group of the Parquet files
+RECORD_BATCH_SIZE = 65_536
+
+# The files of a snapshot, in its directory
+ASSET_TYPES_FILE = "asset_types.parquet"
+ASSETS_FILE = "assets.parquet"
+FIELDS_FILE = "fields.parquet"
+
+
+def record_batches(
+    table_class: type[ColumnarTable[ModelT]],
+    objects: Iterable[ModelT],
+    batch_size: int = RECORD_BATCH_SIZE,
+) -> Iterator["pa.RecordBatch"]:
+    """
+    Convert objects into Arrow record batches, through a table per batch of them, so that
+    only a batch of objects is held at a time when they come from an iterator.
+    :param table_class: The kind of table of the objects, ex: AssetTable.
+    :param objects: The objects, ex: an iterator over the pages of a list API method.
+    :param batch_size: The number of rows per record batch.
+    :return: An iterator of record batches.
+    """
+    objects = iter(objects)
+    while len(table := table_class.from_objects(islice(objects, batch_size))):
+        yield to_record_batch(table)
+
+
+def write_parquet(
+    path: str | Path,
+    table_class: type[ColumnarTable[ModelT]],
+    objects: Iterable[ModelT],
+    batch_size: int = RECORD_BATCH_SIZE,
+) -> int:
+    """
+    Write objects into a Parquet file, a row group per batch of them.
+    :param path: The path of the file.
+    :param table_class: The kind of table of the objects, ex: AssetTable.
+    :param objects: The objects, consumed a batch at a time.
+    :param batch_size: The number of rows per row group.
+    :return: The number of rows written.
+    """
+    pa = import_pyarrow()
+    rows = 0
+    with pa.parquet.ParquetWriter(str(path), arrow_schema(table_class)) as writer:
+        for batch in record_batches(table_class, objects, batch_size):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def read_parquet(path: str | Path, table_class: type[TableT]) -> TableT:
+    """
+    Read a Parquet file written by write_parquet into a table.
+    :param path: The path of the file, memory-mapped while decoded.
+    :param table_class: The kind of table of the file, ex: AssetTable.
+    :return: The table of the rows of the file.
+    """
+    pa = import_pyarrow()
+    return from_record_batch(
+        table_class, pa.parquet.read_table(str(path), memory_map=True)
+    )
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    Represents the asset types, assets and fields of a Data360 instance, crawled into
+    Parquet files and loaded back into tables to work offline.
+    """
+
+    asset_types: AssetTypeTable
+    assets: AssetTable
+    fields: FieldTable
+
+    def meta_model(self) -> MetaModel:
+        """
+        Return the meta model of the snapshot, to diff it with another one.
+        :return: The meta model of the asset types, the assets staying in their table.
+        """
+        return MetaModel(asset_types=list(self.asset_types))
+
+
+def write_snapshot(
+    instance: Data360Instance,
+    directory: str | Path,
+    batch_size: int = RECORD_BATCH_SIZE,
+) -> None:
+    """
+    Crawl the asset types, assets and fields of an instance into Parquet files. The assets
+    and fields are written as their pages come, so only a batch of them is held at a time.
+    :param instance: The Data360 instance.
+    :param directory: The directory of the files, created if needed.
+    :param batch_size: The number of rows per row group.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    asset_types = instance.asset_types
+    write_parquet(directory / ASSET_TYPES_FILE, AssetTypeTable, asset_types, batch_size)
+    with instance.hooks.span("data360.assets"):
+        assets = chain.from_iterable(
+            instance.iter_assets_by_type_uid(asset_type.uid)
+            for asset_type in filter_asset_types_with_assets(asset_types)
+        )
+        write_parquet(directory / ASSETS_FILE, AssetTable, assets, batch_size)
+    with instance.hooks.span("data360.fields"):
+        fields = chain.from_iterable(
+            instance.iter_fields(asset_type.uid) for asset_type in asset_types
+        )
+        write_parquet(directory / FIELDS_FILE, FieldTable, fields, batch_size)
+
+
+def load_snapshot(directory: str | Path) -> Snapshot:
+    """
+    Load a snapshot written by write_snapshot.
+    :param directory: The directory of the files.
+    :return: The snapshot, its objects in tables.
+    """
+    directory = Path(directory)
+    return Snapshot(
+        asset_types=read_parquet(directory / ASSET_TYPES_FILE, AssetTypeTable),
+        assets=read_parquet(directory / ASSETS_FILE, AssetTable),
+        fields=read_parquet(directory / FIELDS_FILE, FieldTable),
+    )
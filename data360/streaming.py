@@ -0,0 +1,134 @@
+import json
+import re
+from collections.abc import Iterable, Iterator
+
+# Structural characters outside of the JSON strings
+_TOKENS = re.compile(rb'["{}\[\]:,]')
+# Characters ending a JSON string, or escaping the next one
+_STRING_END = re.compile(rb'["\\]')
+
+
+class StreamedJsonArray:
+    """
+    Incremental reader of the objects of a JSON array, from a stream of byte chunks.
+    The array is either the top-level value, or the value of a key of the top-level
+    object (ex: the "items" of a page). Each object is yielded as raw bytes as soon
+    as it is complete, so only one object is held in memory at a time.
+    The scalar values of the top-level object (ex: "total") are kept in metadata.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], key: str | None = "items"):
+        """
+        Initialize the reader.
+        :param chunks: The chunks of the JSON document.
+        :param key: The key of the array in the top-level object, None for a top-level array.
+        """
+        self.chunks = chunks
+        self.key = key.encode() if key is not None else None
+        self.metadata: dict = {}
+
+    def __iter__(self) -> Iterator[bytes]:
+        buffer = bytearray()
+        position = 0
+        depth = 0
+        in_string = False
+        string_start: int | None = None  # start of the top-level key being read
+        expect_key = False
+        current_key: bytes | None = None
+        value_start: int | None = None  # start of the top-level scalar being read
+        array_depth: int | None = None  # depth of the items, once in the array
+        item_start: int | None = None
+
+        for chunk in self.chunks:
+            buffer += chunk
+            while True:
+                if in_string:
+                    match = _STRING_END.search(buffer, position)
+                    if match is None:
+                        position = len(buffer)
+                        break
+                    if match.group() == b"\\":
+                        if match.end() >= len(buffer):
+                            # the escaped character is in the next chunk
+                            position = match.start()
+                            break
+                        position = match.end() + 1
+                        continue
+                    in_string = False
+                    position = match.end()
+                    if string_start is not None:
+                        current_key = bytes(buffer[string_start : match.start()])
+                        string_start = None
+                    continue
+
+                match = _TOKENS.search(buffer, position)
+                if match is None:
+                    position = len(buffer)
+                    break
+                token = match.group()
+                position = match.end()
+                if token == b'"':
+                    in_string = True
+                    if depth == 1 and expect_key:
+                        string_start = position
+                elif token in b"{[":
+                    if array_depth is not None and depth == array_depth:
+                        item_start = match.start()
+                    elif (
+                        token == b"["
+                        and array_depth is None
+                        and (
+                            (self.key is None and depth == 0)
+                            or (depth == 1 and current_key == self.key)
+                        )
+                    ):
+                        array_depth = depth + 1
+                    if depth == 1:
+                        value_start = None
+                    depth += 1
+                    expect_key = depth == 1 and token == b"{"
+                elif token in b"}]":
+                    depth -= 1
+                    if array_depth is not None:
+                        if depth == array_depth - 1:
+                            array_depth = -1  # the array is over
+                        elif depth == array_depth and item_start is not None:
+                            yield bytes(buffer[item_start : match.end()])
+                            item_start = None
+                    if depth == 0 and token == b"}":
+                        self._store_metadata(current_key, buffer, value_start, match)
+                        value_start = None
+                elif token == b":":
+                    if depth == 1:
+                        expect_key = False
+                        value_start = position
+                elif token == b"," and depth == 1:
+                    self._store_metadata(current_key, buffer, value_start, match)
+                    expect_key = True
+                    value_start = None
+
+            # drop the bytes that were read, keeping the object or value in progress
+            starts = [
+                start
+                for start in (item_start, string_start, value_start)
+                if start is not None
+            ]
+            cut = min([position, *starts])
+            if cut:
+                del buffer[:cut]
+                position -= cut
+                item_start = item_start - cut if item_start is not None else None
+                string_start = string_start - cut if string_start is not None else None
+                value_start = value_start - cut if value_start is not None else None
+
+    def _store_metadata(
+        self,
+        key: bytes | None,
+        buffer: bytearray,
+        value_start: int | None,
+        end: re.Match,
+    ) -> None:
+        """Store a scalar value of the top-level object, read up to the end token."""
+        if key is None or value_start is None:
+            return
+        self.metadata[key.decode()] = json.loads(buffer[value_start : end.start()])
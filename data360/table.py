@@ -0,0 +1,540 @@
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import UTC, datetime
+from itertools import compress, islice
+from operator import itemgetter
+from types import NoneType, UnionType
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    ClassVar,
+    Generic,
+    Self,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import TypeAdapter
+from pydantic.fields import FieldInfo
+
+from data360.arrow import to_arrow, to_record_batch
+from data360.columns import (
+    BooleanColumn,
+    Column,
+    DictionaryColumn,
+    FloatColumn,
+    IntegerColumn,
+    JsonColumn,
+    NumericColumn,
+    StringColumn,
+)
+from data360.model import (
+    FIELD_TYPE_ADAPTER,
+    FIELD_TYPE_TAGS,
+    FIELD_TYPE_WRAPPERS,
+    FIELDS_SETS,
+    Asset,
+    AssetType,
+    FieldAsset,
+    PascalCaseObject,
+    SearchFieldType,
+    field_type_tag,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
+ModelT = TypeVar("ModelT", bound=PascalCaseObject)
+
+# The number of objects added to, or built from, the columns at once
+BATCH_SIZE = 1024
+
+
+# The columns of the attributes of a scalar type
+SCALAR_COLUMNS: dict[type, type[NumericColumn | StringColumn]] = {
+    bool: BooleanColumn,
+    int: IntegerColumn,
+    float: FloatColumn,
+    str: StringColumn,
+}
+
+
+def pandas_array(column: Column) -> Any:
+    """
+    Convert a column into a pandas array, sharing the buffers of the column: the
+    dictionary-encoded columns as Categoricals, whose codes are -1 for the nulls too, the
+    nullable numbers as masked arrays, and the strings as Arrow strings. The strings are
+    decoded into objects when pyarrow is not installed.
+    :param column: The column, of a table that is not a view.
+    :return: The array, a numpy array or a pandas extension array.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(column, DictionaryColumn):
+        codes = np.frombuffer(column.codes, dtype=np.int32)
+        return pd.Categorical.from_codes(codes, categories=column.values)
+    if isinstance(column, StringColumn):
+        try:
+            # the strings stay in the buffers of the column, wrapped in an Arrow array
+            return pd.arrays.ArrowStringArray(to_arrow(column))
+        except ImportError:
+            values = np.empty(len(column), dtype=object)
+            # the JSON columns are kept as their text, as in the Arrow arrays
+            values[:] = StringColumn.slice(column, 0, len(column))
+            return values
+    values = np.frombuffer(column.values, dtype=column.values.typecode)
+    if isinstance(column, BooleanColumn):
+        values = values.view(np.bool_)
+    if column.validity is None:
+        return values
+    mask = np.frombuffer(column.validity, dtype=np.bool_) == 0
+    if isinstance(column, BooleanColumn):
+        return pd.arrays.BooleanArray(values, mask)
+    if isinstance(column, FloatColumn):
+        return pd.arrays.FloatingArray(values, mask)
+    return pd.arrays.IntegerArray(values, mask)
+
+
+def scalar_type(annotation: Any) -> type | None:
+    """
+    Return the scalar type of an annotation, ex: str for InternedStr | None.
+    :return: The type, None when the annotation is not a scalar or a union of scalars of
+        the same type.
+    """
+    if get_origin(annotation) in (Union, UnionType):
+        types = {
+            scalar_type(member)
+            for member in get_args(annotation)
+            if member is not NoneType
+        }
+        return types.pop() if len(types) == 1 else None
+    if get_origin(annotation) is Annotated:
+        return scalar_type(get_args(annotation)[0])
+    return annotation if annotation in SCALAR_COLUMNS else None
+
+
+def is_nullable(field: FieldInfo) -> bool:
+    """Return whether the values of an attribute can be None."""
+    return not field.is_required() or NoneType in get_args(field.annotation)
+
+
+def new_column(field: FieldInfo, dictionary: bool = False) -> Column:
+    """
+    Create the column of an attribute, from its annotation.
+    :param field: The attribute.
+    :param dictionary: Whether the attribute is a string of few distinct values.
+    :return: The column, a string column holding JSON when the attribute is not a scalar.
+    """
+    nullable = is_nullable(field)
+    if dictionary:
+        return DictionaryColumn(nullable)
+    column_type = SCALAR_COLUMNS.get(scalar_type(field.annotation))  # type: ignore[arg-type]
+    if column_type is not None:
+        return column_type(nullable)
+    annotation = field.annotation
+    if field.metadata:
+        # the validators of the attribute, ex: the sharing of the asset classes
+        annotation = Annotated[annotation, *field.metadata]  # type: ignore[valid-type]
+    return JsonColumn(nullable, TypeAdapter(annotation))
+
+
+class ColumnarTable(Generic[ModelT]):
+    """
+    A collection of objects stored column by column rather than as a list of pydantic
+    objects: integer arrays, string buffers and dictionary-encoded strings. The rows are
+    only built into objects when accessed.
+    The filters return views of the table, holding the selected rows rather than copies
+    of the columns, and compact() copies a view into a table of its own.
+    """
+
+    model: ClassVar[type[PascalCaseObject]]
+    # The string columns of few distinct values, encoded with a dictionary
+    dictionary_columns: ClassVar[frozenset[str]] = frozenset()
+
+    def __init__(self):
+        names = self.model.model_fields.keys()
+        self.fields_set = FIELDS_SETS.setdefault(frozenset(names), set(names))
+        # The rows of the columns in the table, all of them when None
+        self.selection: array | None = None
+        self.columns: dict[str, Column] = self.new_columns()
+
+    @classmethod
+    def new_columns(cls) -> dict[str, Column]:
+        """Create the empty columns of the table, one per attribute of the model."""
+        return {
+            name: new_column(field, name in cls.dictionary_columns)
+            for name, field in cls.model.model_fields.items()
+        }
+
+    @classmethod
+    def from_objects(cls, objects: Iterable[ModelT]) -> Self:
+        """
+        Build a table from objects, consumed one at a time.
+        :param objects: The objects, ex: an iterator over the pages of a list API method.
+        :return: The table of the objects.
+        """
+        table = cls()
+        table.extend(objects)
+        return table
+
+    @classmethod
+    def concat(cls, tables: Iterable[Self]) -> Self:
+        """
+        Concatenate tables into a new one.
+        :param tables: The tables, in order.
+        :return: The table of the rows of all the tables.
+        """
+        table = cls()
+        for other in tables:
+            columns = other.compact().columns
+            for name, column in table.columns.items():
+                column.extend_column(columns[name])  # type: ignore[arg-type]
+        return table
+
+    def __len__(self) -> int:
+        if self.selection is not None:
+            return len(self.selection)
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, row: int) -> ModelT:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("table row out of range")
+        if self.selection is not None:
+            row = self.selection[row]
+        return self._build({name: column[row] for name, column in self.columns.items()})
+
+    def __iter__(self) -> Iterator[ModelT]:
+        # the rows are built a batch at a time, column by column
+        names = list(self.columns)
+        for start in range(0, len(self), BATCH_SIZE):
+            values = [
+                self._values(column, start, start + BATCH_SIZE)
+                for column in self.columns.values()
+            ]
+            for row in zip(*values, strict=True):
+                yield self._build(dict(zip(names, row, strict=True)))
+
+    def _values(self, column: Column, start: int, stop: int) -> list:
+        if self.selection is None:
+            return column.slice(start, stop)
+        return column.gather(self.selection[start:stop])
+
+    def _row(self, item: ModelT) -> dict:
+        """Return the values of the columns for an object, by the name of their column."""
+        return item.__dict__
+
+    def _build(self, values: dict) -> ModelT:
+        # built as pydantic builds the validated objects, the values being already valid
+        item = self.model.__new__(self.model)
+        object.__setattr__(item, "__dict__", values)
+        object.__setattr__(item, "__pydantic_fields_set__", self.fields_set)
+        object.__setattr__(item, "__pydantic_extra__", None)
+        object.__setattr__(item, "__pydantic_private__", None)
+        return item  # type: ignore[return-value]
+
+    def append(self, item: ModelT) -> None:
+        self.extend([item])
+
+    def extend(self, objects: Iterable[ModelT]) -> None:
+        """
+        Add objects to the table, column by column for each batch of them, so that only
+        a batch of objects is held at a time when they come from an iterator.
+        :param objects: The objects added.
+        :raise ValueError: When the table is a view, its columns being shared.
+        """
+        if self.selection is not None:
+            raise ValueError("Cannot add rows to a view of a table, compact it first")
+        objects = iter(objects)
+        while batch := list(map(self._row, islice(objects, BATCH_SIZE))):
+            for name, column in self.columns.items():
+                column.extend(list(map(itemgetter(name), batch)))
+
+    def column(self, name: str) -> list:
+        """
+        Return the values of a column.
+        :param name: The name of the attribute of the column.
+        :return: The values of the rows, None for the nulls.
+        """
+        return self._values(self.columns[name], 0, len(self))
+
+    def view(self, rows: Sequence[int]) -> Self:
+        """
+        Return a view of some of the rows, sharing the columns of this table.
+        :param rows: The indices of the rows in the table, in the order of the view.
+        :return: The view of the rows.
+        """
+        if self.selection is not None:
+            return self._with_selection(
+                array("q", map(self.selection.__getitem__, rows))
+            )
+        return self._with_selection(array("q", rows))
+
+    def _with_selection(self, selection: array | None) -> Self:
+        table = type(self).__new__(type(self))
+        table.fields_set = self.fields_set
+        table.columns = self.columns
+        table.selection = selection
+        return table
+
+    def compact(self) -> Self:
+        """
+        Copy a view into a table of its own, the other tables being returned as they are.
+        :return: The table of the rows of the view.
+        """
+        if self.selection is None:
+            return self
+        table = self._with_selection(None)
+        table.columns = {
+            name: column.take(self.selection) for name, column in self.columns.items()
+        }
+        return table
+
+    def select(self, name: str, predicate: Callable[[str | None], bool]) -> Self:
+        """
+        Filter the rows on the value of a dictionary-encoded column.
+        :param name: The name of the column.
+        :param predicate: The predicate the values of the rows kept satisfy, evaluated
+            once per distinct value, and called with None for the nulls.
+        :return: The view of the rows kept.
+        :raise TypeError: When the column is not dictionary-encoded.
+        """
+        column = self.columns[name]
+        if not isinstance(column, DictionaryColumn):
+            raise TypeError(f"{name} is not a dictionary-encoded column")
+        return self._with_selection(column.select(predicate, self.selection))
+
+    def where(self, name: str, predicate: Callable[[Any], bool]) -> Self:
+        """
+        Filter the rows on the value of any column, the predicate being evaluated once per
+        row rather than once per distinct value as with select().
+        :param name: The name of the column.
+        :param predicate: The predicate the values of the rows kept satisfy, called with
+            None for the nulls.
+        :return: The view of the rows kept.
+        """
+        rows = self.selection if self.selection is not None else range(len(self))
+        matches = map(predicate, self.column(name))
+        return self._with_selection(array("q", compress(rows, matches)))
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """
+        Build a pandas DataFrame of the table, from its columns rather than from a dict per
+        object. The buffers of the columns are shared with the table, so it cannot grow
+        while the frame is alive; only the validity masks are copied, and the strings too
+        when pyarrow is not installed. The dictionary-encoded columns are categorical.
+        :return: The frame, a column per column of the table, a view being compacted first.
+        """
+        try:
+            import pandas as pd
+        except ImportError as error:
+            raise ImportError("to_pandas requires the pandas package") from error
+        columns = self.compact().columns
+        return pd.DataFrame(
+            {name: pandas_array(column) for name, column in columns.items()}, copy=False
+        )
+
+    def to_polars(self) -> "pl.DataFrame":
+        """
+        Build a polars DataFrame of the table, through the Arrow record batch of the table,
+        which shares its buffers. The dictionary-encoded columns are categorical.
+        :return: The frame, a column per column of the table, a view being compacted first.
+        """
+        try:
+            import polars as pl
+        except ImportError as error:
+            raise ImportError("to_polars requires the polars package") from error
+        return pl.from_arrow(to_record_batch(self))  # type: ignore[return-value]
+
+
+def as_utc(date: datetime) -> datetime:
+    """Return a date made aware, the naive dates being in UTC."""
+    return date if date.tzinfo is not None else date.replace(tzinfo=UTC)
+
+
+def parse_date(value: str | None) -> datetime | None:
+    """
+    Parse an ISO 8601 date of the API, the naive ones being in UTC.
+    :return: The date, None when the value is null or not a date.
+    """
+    if value is None:
+        return None
+    try:
+        return as_utc(datetime.fromisoformat(value))
+    except ValueError:
+        return None
+
+
+class AssetTable(ColumnarTable[Asset]):
+    """
+    A collection of assets stored column by column, about a fifth of the memory of a
+    list of Asset objects. The uids, paths, names and dates are stored in string buffers,
+    the asset type uids and scores are dictionary-encoded, and the rows are built into
+    Asset objects when accessed.
+    """
+
+    model = Asset
+    dictionary_columns = frozenset(
+        {
+            "asset_type_uid",
+            "color",
+            "data_privacy_type",
+            "integrity",
+            "confidentiality",
+            "qlty_score",
+            "critical",
+            "governance_score",
+            "suggested_critical",
+            "data_classified_by",
+        }
+    )
+
+    def filter_asset_types(self, *asset_types: AssetType | str) -> Self:
+        """
+        Filter the assets of some asset types.
+        :param asset_types: The asset types, or their uids.
+        :return: The view of the assets of the asset types.
+        """
+        uids = {
+            asset_type.uid if isinstance(asset_type, AssetType) else asset_type
+            for asset_type in asset_types
+        }
+        return self.select("asset_type_uid", uids.__contains__)
+
+    def filter_critical(self, *values: str | None) -> Self:
+        """
+        Filter the assets on their criticality.
+        :param values: The values of the critical attribute kept, None for the assets without.
+        :return: The view of the assets with one of the values.
+        """
+        return self.select("critical", set(values).__contains__)
+
+    def filter_dates(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        column: str = "created_on",
+    ) -> Self:
+        """
+        Filter the assets on a date range, start included and end excluded. The dates
+        being almost unique per asset, they are parsed once per row.
+        :param start: The start of the range, unbounded when None. Naive dates are in UTC.
+        :param end: The end of the range, unbounded when None. Naive dates are in UTC.
+        :param column: The date attribute filtered, created_on or updated_on.
+        :return: The view of the assets whose date is in the range, the ones without excluded.
+        """
+        lower = as_utc(start) if start is not None else None
+        upper = as_utc(end) if end is not None else None
+
+        def in_range(value: str | None) -> bool:
+            date = parse_date(value)
+            return (
+                date is not None
+                and (lower is None or lower <= date)
+                and (upper is None or date < upper)
+            )
+
+        return self.where(column, in_range)
+
+
+class AssetTypeTable(ColumnarTable[AssetType]):
+    """
+    A collection of asset types stored column by column, their classes and icon styles
+    stored as JSON.
+    """
+
+    model = AssetType
+
+
+# The prefix of the columns of the attributes of the field types (ex: "type_is_editable")
+TYPE_PREFIX = "type_"
+
+# The attributes of the field types, by the tag of their type (ex: "Boolean")
+FIELD_TYPE_ATTRIBUTES: dict[str, dict[str, FieldInfo]] = {
+    "Search": SearchFieldType.model_fields,
+    **{
+        FIELD_TYPE_TAGS[name]: field.annotation.model_fields  # type: ignore[union-attr]
+        for wrapper in FIELD_TYPE_WRAPPERS
+        for name, field in wrapper.model_fields.items()
+    },
+}
+
+
+def field_type_columns() -> dict[str, Column]:
+    """
+    Create the columns of the attributes of the field types, one per attribute name
+    across the types, nullable for the fields of the other types. The attributes of a
+    different type from one field type to another are stored as JSON.
+    """
+    types: dict[str, set[type | None]] = {}
+    for attributes in FIELD_TYPE_ATTRIBUTES.values():
+        for name, field in attributes.items():
+            types.setdefault(name, set()).add(scalar_type(field.annotation))
+    return {
+        TYPE_PREFIX + name: (
+            SCALAR_COLUMNS[scalar](True)
+            if len(scalars) == 1 and (scalar := next(iter(scalars))) is not None
+            else JsonColumn(True)
+        )
+        for name, scalars in types.items()
+    }
+
+
+class FieldTable(ColumnarTable[FieldAsset]):
+    """
+    A collection of fields stored column by column. The union of the field types is
+    flattened into a "type" column holding the tag of the type of each field (ex:
+    "Boolean"), and a column per attribute of the types, prefixed with "type_" (ex:
+    "type_is_editable"), null for the fields of the types without the attribute. The
+    attributes nested in the types are stored as JSON.
+    """
+
+    model = FieldAsset
+    dictionary_columns = frozenset(
+        {
+            "category",
+            "action_type_uid",
+            "asset_type_uid",
+            "relationship_type_uid",
+            "type",
+        }
+    )
+
+    @classmethod
+    def new_columns(cls) -> dict[str, Column]:
+        return {**super().new_columns(), **field_type_columns()}
+
+    def _row(self, item: FieldAsset) -> dict:
+        row = dict.fromkeys(self.columns)
+        row.update(item.__dict__)
+        field_type = item.type  # validated on access for the lazy fields
+        row["type"] = tag = field_type_tag(field_type)
+        if tag is not None:
+            attributes = (
+                field_type
+                if tag == "Search"
+                else next(iter(field_type.__dict__.values()))
+            )
+            for name, value in attributes.__dict__.items():
+                row[TYPE_PREFIX + name] = value
+        return row
+
+    def _build(self, values: dict) -> FieldAsset:
+        tag = values["type"]
+        attributes = {
+            name[len(TYPE_PREFIX) :]: values.pop(name)
+            for name in list(values)
+            if name.startswith(TYPE_PREFIX)
+        }
+        if tag is not None:
+            payload = {name: attributes[name] for name in FIELD_TYPE_ATTRIBUTES[tag]}
+            values["type"] = FIELD_TYPE_ADAPTER.validate_python(
+                payload if tag == "Search" else {tag: payload}
+            )
+        return super()._build(values)
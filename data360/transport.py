@@ -0,0 +1,295 @@
+import base64
+import json
+import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from data360.cache import CACHED_HEADERS, build_response
+
+Timeout = float | tuple[float, float] | None
+# A canned payload, or a function building it from the query and path parameters
+Route = object | Callable[..., object]
+
+
+class Transport(ABC):
+    """
+    Sends the GET requests of a Data360 instance and returns their responses.
+    Subclasses may be called from several threads at the same time.
+    """
+
+    @abstractmethod
+    def send(
+        self,
+        url: str,
+        headers: dict,
+        params: dict,
+        timeout: Timeout = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Send a GET request.
+        :param url: The full URL of the request, without its query.
+        :param headers: The headers of the request.
+        :param params: The query parameters of the request.
+        :param timeout: The timeout (seconds, or a (connect, read) tuple) of the request.
+        :param stream: Whether the body may be read lazily.
+        :return: The response, whatever its status code.
+        """
+
+    def close(self) -> None:
+        """Release the resources of the transport."""
+
+
+class HTTPTransport(Transport):
+    """
+    Sends the requests over the network, through a pooled requests.Session.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+    ):
+        """
+        Initialize the transport and its session.
+        :param pool_connections: The number of host connection pools to cache.
+        :param pool_maxsize: The maximum number of connections kept per host.
+        :param keep_alive: Whether connections are kept open between requests.
+        """
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def send(
+        self,
+        url: str,
+        headers: dict,
+        params: dict,
+        timeout: Timeout = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        return self.session.get(
+            url, headers=headers, params=params, timeout=timeout, stream=stream
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class InMemoryTransport(Transport):
+    """
+    Serves canned or generated payloads without any network, for tests and benchmarks.
+    The routes are endpoint templates (ex: "/assets/{uid}") relative to the API base path.
+    A route is either a payload, or a function called with the query parameters and the
+    path parameters as keyword arguments, returning a payload or a requests.Response.
+    The literal routes are matched before the templated ones (ex: "/assets/types" before
+    "/assets/{uid}"), whatever their order. Payloads other than bytes are encoded as JSON.
+    Unknown routes answer 404.
+    """
+
+    def __init__(
+        self,
+        routes: Mapping[str, Route] | None = None,
+        latency: float | Callable[[], float] = 0.0,
+        base_path: str = "/api/v2",
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the transport.
+        :param routes: The payloads served per endpoint template.
+        :param latency: The simulated latency of each request, in seconds, or a function drawing it.
+        :param base_path: The path of the API, removed from the URLs before matching the routes.
+        :param sleep: The function simulating the latency.
+        """
+        self.routes: dict[str, Route] = dict(routes or {})
+        self.latency = latency
+        self.base_path = base_path
+        self._sleep = sleep
+        self._patterns: dict[str, re.Pattern] = {}
+        self._lock = threading.Lock()
+        self._sorted_routes = self._sort_routes()
+        # the (path, params) of every request received, in order
+        self.requests: list[tuple[str, dict]] = []
+
+    def route(self, endpoint: str, payload: Route) -> None:
+        """
+        Add or replace a route.
+        :param endpoint: The endpoint template (ex: "/assets/{uid}").
+        :param payload: The payload, or the function building it.
+        """
+        with self._lock:
+            self.routes[endpoint] = payload
+            self._sorted_routes = self._sort_routes()
+
+    def _sort_routes(self) -> tuple[tuple[str, Route], ...]:
+        """Sort the routes in their matching order."""
+        # the routes with fewer parameters are more specific, the sort keeps the order of the others
+        return tuple(sorted(self.routes.items(), key=lambda item: item[0].count("{")))
+
+    def send(
+        self,
+        url: str,
+        headers: dict,
+        params: dict,
+        timeout: Timeout = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        path = urlsplit(url).path.removeprefix(self.base_path)
+        with self._lock:
+            self.requests.append((path, dict(params)))
+        latency = self.latency() if callable(self.latency) else self.latency
+        if latency:
+            self._sleep(latency)
+        full_url = requests.Request("GET", url, params=params).prepare().url or url
+        # route() replaces the tuple rather than mutating it, so this reference is a snapshot
+        for endpoint, route in self._sorted_routes:
+            match = self._pattern(endpoint).fullmatch(path)
+            if match is None:
+                continue
+            payload = (
+                route(dict(params), **match.groupdict()) if callable(route) else route
+            )
+            if isinstance(payload, requests.Response):
+                return payload
+            return json_response(full_url, payload)
+        return json_response(full_url, {"message": "Not Found"}, status_code=404)
+
+    def _pattern(self, endpoint: str) -> re.Pattern:
+        """Compile an endpoint template into a regular expression of its path."""
+        pattern = self._patterns.get(endpoint)
+        if pattern is None:
+            parts = re.split(r"\{(\w+)\}", endpoint)
+            regex = "".join(
+                f"(?P<{part}>[^/]+)" if index % 2 else re.escape(part)
+                for index, part in enumerate(parts)
+            )
+            pattern = self._patterns[endpoint] = re.compile(regex)
+        return pattern
+
+
+class RecordReplayTransport(Transport):
+    """
+    Records the responses of another transport into a JSON file, or replays them offline.
+    Only the URL, query, status code, body and the headers kept by the cache
+    (CACHED_HEADERS) are stored, never the request headers nor the session ones (ex:
+    Set-Cookie), so the recordings carry no credentials. The bodies that are not UTF-8
+    text are stored base64-encoded.
+    """
+
+    def __init__(self, path: str, transport: Transport | None = None):
+        """
+        Initialize the transport, loading the existing recordings.
+        :param path: The JSON file of the recordings.
+        :param transport: The transport recorded, None to replay the recordings.
+        """
+        self.path = path
+        self.transport = transport
+        self._lock = threading.Lock()
+        self._recordings: dict[str, dict] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                for recording in json.load(file):
+                    self._recordings[recording["url"]] = recording
+
+    @property
+    def recording(self) -> bool:
+        """Whether the responses are recorded, rather than replayed."""
+        return self.transport is not None
+
+    def send(
+        self,
+        url: str,
+        headers: dict,
+        params: dict,
+        timeout: Timeout = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        key = recording_key(url, params)
+        if self.transport is None:
+            with self._lock:
+                recording = self._recordings.get(key)
+            if recording is None:
+                raise LookupError(f"No recorded response for GET {key}")
+            if "content_base64" in recording:
+                content = base64.b64decode(recording["content_base64"])
+            else:
+                content = recording["content"].encode()
+            return build_response(
+                key, recording["status_code"], recording["headers"], content
+            )
+        response = self.transport.send(url, headers, params, timeout, stream)
+        recording = {
+            "url": key,
+            "status_code": response.status_code,
+            "headers": {
+                header: response.headers[header]
+                for header in CACHED_HEADERS
+                if header in response.headers
+            },
+        }
+        try:
+            recording["content"] = response.content.decode("utf-8")
+        except UnicodeDecodeError:
+            recording["content_base64"] = base64.b64encode(response.content).decode()
+        with self._lock:
+            self._recordings[key] = recording
+        return response
+
+    def save(self) -> None:
+        """Write the recordings to their file."""
+        with self._lock:
+            recordings = sorted(self._recordings.values(), key=lambda r: r["url"])
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(recordings, file, indent=2)
+
+    def close(self) -> None:
+        """Save the recordings, then close the recorded transport."""
+        if self.transport is not None:
+            self.save()
+            self.transport.close()
+
+
+def recording_key(url: str, params: dict) -> str:
+    """
+    Build the URL identifying a request, its query parameters sorted.
+    :param url: The URL of the request, without its query.
+    :param params: The query parameters of the request.
+    :return: The full URL.
+    """
+    prepared = requests.Request("GET", url, params=sorted(params.items())).prepare()
+    return prepared.url or url
+
+
+def json_response(
+    url: str, payload: object, status_code: int = 200
+) -> requests.Response:
+    """
+    Build an in-memory response from a payload.
+    :param url: The URL of the response.
+    :param payload: The body, encoded as JSON unless already bytes.
+    :param status_code: The status code of the response.
+    :return: The response.
+    """
+    content = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    response = build_response(
+        url, status_code, {"Content-Type": "application/json"}, content
+    )
+    response.reason = HTTPStatus(status_code).phrase
+    return response
@@ -1,20 +1,45 @@
 from config import AppConfig
 from data360.client import Data360Instance
+from data360.log import configure_logging
 
 if __name__ == "__main__":
     # Load configuration
     config = AppConfig()
+    logs = configure_logging(
+        filename=config.LOG_FILE,
+        level=config.LOG_LEVEL,
+        request_sample_rate=config.LOG_REQUEST_SAMPLE_RATE,
+    )
+    cache = config.build_response_cache()
 
     # Create the Data360 instance to work on a final environment
     source = Data360Instance(
         url=config.SOURCE_URL,
         api_key=config.SOURCE_API_KEY.get_secret_value(),
         api_secret=config.SOURCE_API_SECRET.get_secret_value(),
+        pool_connections=config.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=config.HTTP_POOL_MAXSIZE,
+        keep_alive=config.HTTP_KEEP_ALIVE,
+        timeout=config.HTTP_TIMEOUT,
+        max_workers=config.HTTP_MAX_WORKERS,
+        retry_policy=config.retry_policy,
+        rate_limit=config.HTTP_RATE_LIMIT,
+        rate_limit_burst=config.HTTP_RATE_LIMIT_BURST,
+        cache=cache,
     )
     destination = Data360Instance(
         url=config.DESTINATION_URL,
         api_key=config.DESTINATION_API_KEY.get_secret_value(),
         api_secret=config.DESTINATION_API_SECRET.get_secret_value(),
+        pool_connections=config.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=config.HTTP_POOL_MAXSIZE,
+        keep_alive=config.HTTP_KEEP_ALIVE,
+        timeout=config.HTTP_TIMEOUT,
+        max_workers=config.HTTP_MAX_WORKERS,
+        retry_policy=config.retry_policy,
+        rate_limit=config.HTTP_RATE_LIMIT,
+        rate_limit_burst=config.HTTP_RATE_LIMIT_BURST,
+        cache=cache,
     )
 
     print("")
@@ -45,3 +70,9 @@ if __name__ == "__main__":
     print([asset.name for asset in asset_types_not_in_dest])
 
     # print(source.fields)
+
+    source.close()
+    destination.close()
+    if cache is not None:
+        cache.close()
+    logs.stop()
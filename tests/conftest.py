@@ -1,7 +1,10 @@
+import json
+
 import pytest
 import requests
 
 from data360.client import Data360Instance
+from data360.transport import InMemoryTransport
 
 
 @pytest.fixture(autouse=True)
@@ -11,43 +14,115 @@ def no_requests(monkeypatch):
 
 
 @pytest.fixture
-def testing_d360(monkeypatch) -> None:
-    """Mock the Data360 instance."""
+def fake_api() -> InMemoryTransport:
+    """In-memory Data360 API, the mock responses are added as routes."""
+    return InMemoryTransport()
+
+
+@pytest.fixture
+def testing_d360(fake_api) -> Data360Instance:
+    """Mock the Data360 instance, served by the in-memory API."""
     return Data360Instance(
         url="https://mock-url.com",
         api_key="mock_auth_key",
         api_secret="mock_auth_secret",
+        transport=fake_api,
     )
 
 
 # custom class to be the mock return value
-# will override the requests.Response returned from requests.get
+# will override the requests.Response returned from requests.Session.get
 class MockResponse:
-    def __init__(self, json_response: str, status_code: int = 200):
+    def __init__(
+        self, json_response: str, status_code: int = 200, headers: dict | None = None
+    ):
         self.json_response = json_response
         self.status_code = status_code
+        self.headers = headers if headers is not None else {}
+        self.closed = False
 
     # mock json() method always returns a specific testing dictionary
     def json(self):
         return self.json_response
 
+    @property
+    def content(self) -> bytes:
+        """Mock the raw body of the response, encoding the testing dictionary."""
+        return json.dumps(self.json_response).encode()
+
     def raise_for_status(self) -> None:
-        """Mock raise_for_status() to do nothing."""
-        pass
+        """Mock raise_for_status() to raise on error status codes only."""
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+
+    def close(self) -> None:
+        """Mock close() to record that the connection was released."""
+        self.closed = True
+
+
+def paged_assets(params: dict, uid: str) -> dict:
+    """Serve 5 assets of the requested asset type, page by page."""
+    start = (params["pageNum"] - 1) * params["pageSize"]
+    items = [
+        {
+            "AssetId": index,
+            "AssetUid": f"{uid}-asset-{index}",
+            "AssetTypeId": 1,
+            "AssetTypeUid": uid,
+            "CreatedOn": "2025-02-06T16:25:44.717Z",
+        }
+        for index in range(start, min(start + params["pageSize"], 5))
+    ]
+    return {"items": items, "pageSize": params["pageSize"], "total": 5}
+
+
+def paged_assets_get(requested_params):
+    """Build a mocked requests.Session.get serving 5 assets, page by page."""
+
+    def mock_get(session, url, headers=None, params=None, timeout=None, stream=False):
+        requested_params.append(params)
+        start = (params["pageNum"] - 1) * params["pageSize"]
+        items = [
+            {
+                "AssetId": index,
+                "AssetUid": f"asset-{index}",
+                "AssetTypeId": 1,
+                "AssetTypeUid": "type",
+                "CreatedOn": "2025-02-06T16:25:44.717Z",
+            }
+            for index in range(start, min(start + params["pageSize"], 5))
+        ]
+        return MockResponse(
+            json_response={
+                "items": items,
+                "pageSize": params["pageSize"],
+                "pageNum": params["pageNum"],
+                "total": 5,
+            }
+        )
+
+    return mock_get
+
+
+def mock_get_sequence(monkeypatch, responses):
+    """Mock requests.Session.get to return the responses, or raise the exceptions, in order."""
 
+    def mock_get(session, url, headers=None, params=None, timeout=None, stream=False):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
 
-# monkeypatched requests.get moved to a fixture
-def mock_response(monkeypatch, json_response) -> None:
-    """Requests.get() mocked to return {'mock_key':'mock_response'}."""
+    monkeypatch.setattr(requests.Session, "get", mock_get)
 
-    def mock_get(*args, **kwargs):
-        return MockResponse(json_response)
 
-    monkeypatch.setattr(requests, "get", mock_get)
+def mock_response(fake_api, endpoint, json_response) -> None:
+    """Serve a mocked response on an endpoint template of the in-memory API."""
+    fake_api.route(endpoint, json_response)
 
 
 @pytest.fixture
-def mock_get_asset_classes_response(monkeypatch) -> None:
+def mock_get_asset_classes_response(fake_api) -> None:
     """Mock the response for get_asset_class."""
     json_response = [
         {
@@ -149,11 +224,11 @@ def mock_get_asset_classes_response(monkeypatch) -> None:
             "AllowCommentsOnAsset": True,
         },
     ]
-    mock_response(monkeypatch, json_response)
+    mock_response(fake_api, "/assets/classes", json_response)
 
 
 @pytest.fixture
-def mock_get_asset_types_response(monkeypatch) -> None:
+def mock_get_asset_types_response(fake_api) -> None:
     """Mock the response for get_asset_types."""
     json_response = [
         {
@@ -205,11 +280,11 @@ def mock_get_asset_types_response(monkeypatch) -> None:
             "UpdatedByName": "string",
         }
     ]
-    mock_response(monkeypatch, json_response)
+    mock_response(fake_api, "/assets/types", json_response)
 
 
 @pytest.fixture
-def mock_get_assets_response(monkeypatch) -> None:
+def mock_get_assets_response(fake_api) -> None:
     """Mock the response for get_asset_types."""
     json_response = {
         "items": [
@@ -236,11 +311,11 @@ def mock_get_assets_response(monkeypatch) -> None:
         "pageNum": 1,
         "total": 1,
     }
-    mock_response(monkeypatch, json_response)
+    mock_response(fake_api, "/assets/{uid}", json_response)
 
 
 @pytest.fixture
-def mock_get_fields_response(monkeypatch) -> None:
+def mock_get_fields_response(fake_api) -> None:
     """Mock the response for get_fields."""
     json_response = {
         "pageSize": 0,
@@ -720,4 +795,4 @@ def mock_get_fields_response(monkeypatch) -> None:
             }
         ],
     }
-    mock_response(monkeypatch, json_response)
+    mock_response(fake_api, "/fields", json_response)
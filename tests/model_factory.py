@@ -696,3 +696,29 @@ class SystemFieldTypeFactory(Factory):
         model = model.SystemFieldType
 
     system = SystemFieldTypeAttributesFactory.build()
+
+
+def asset(index: int, **values) -> model.Asset:
+    """Validate the asset of an index, spread over 3 asset types, with some values replaced."""
+    return model.Asset.model_validate(
+        {
+            "AssetId": index,
+            "AssetUid": f"asset-{index}",
+            "AssetTypeId": index % 3,
+            "AssetTypeUid": f"type-{index % 3}",
+            "CreatedOn": f"2025-01-{index + 1:02d}T12:00:00Z",
+            **values,
+        }
+    )
+
+
+def field(index: int, field_type) -> model.FieldAsset:
+    """Build the field of an index of a field type, spread over 2 asset types."""
+    return model.FieldAsset(
+        name=f"field-{index}",
+        friendly_name=f"Field {index}",
+        category="Custom",
+        asset_type_uid=f"type-{index % 2}",
+        id=index,
+        type=field_type,
+    )
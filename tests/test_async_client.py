@@ -0,0 +1,135 @@
+import asyncio
+
+import httpx
+
+from data360.async_client import AsyncData360Instance
+from data360.model import Asset, AssetClass, AssetType
+
+ASSET_TYPE_COUNT = 12
+
+
+def asset_type_payload(index: int, class_name: str = "Business Asset") -> dict:
+    return {
+        "uid": f"type-{index}",
+        "ID": index,
+        "Name": f"Type {index}",
+        "Class": {
+            "ID": index,
+            "Value": class_name,
+            "Name": class_name,
+            "Description": class_name,
+            "AllowCommentsOnAsset": True,
+        },
+        "Description": "string",
+    }
+
+
+def asset_payload(asset_type_uid: str) -> dict:
+    return {
+        "AssetId": 1,
+        "AssetUid": asset_type_uid + "-asset",
+        "AssetTypeId": 1,
+        "AssetTypeUid": asset_type_uid,
+        "CreatedOn": "2025-02-06T16:25:44.717Z",
+    }
+
+
+class FakeApi:
+    """Async handler of an httpx.MockTransport, tracking the requests in flight."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests: list[httpx.Request] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        path = request.url.path
+        try:
+            if path == "/api/v2/assets/types":
+                asset_types = [asset_type_payload(i) for i in range(ASSET_TYPE_COUNT)]
+                asset_types.append(asset_type_payload(ASSET_TYPE_COUNT, "User"))
+                return httpx.Response(200, json=asset_types)
+            if path == "/api/v2/assets/classes":
+                return httpx.Response(200, json=[asset_type_payload(0)["Class"]])
+            asset_type_uid = path.removeprefix("/api/v2/assets/")
+            # Later asset types answer first to shuffle the completion order
+            await asyncio.sleep((ASSET_TYPE_COUNT - int(asset_type_uid[5:])) / 1000)
+            return httpx.Response(200, json={"items": [asset_payload(asset_type_uid)]})
+        finally:
+            self.in_flight -= 1
+
+
+def test_get_asset_class_parsing():
+    async def scenario():
+        async with AsyncData360Instance(
+            "https://mock-url.com", "key", "secret", transport=httpx.MockTransport(api)
+        ) as d360:
+            return await d360.get_asset_class()
+
+    api = FakeApi()
+    asset_classes = asyncio.run(scenario())
+
+    assert all(isinstance(asset_class, AssetClass) for asset_class in asset_classes)
+    assert api.requests[0].headers["Authorization"] == "key;secret"
+
+
+def test_assets_are_fetched_concurrently_in_asset_types_order():
+    async def scenario():
+        async with AsyncData360Instance(
+            "https://mock-url.com",
+            "key",
+            "secret",
+            max_concurrency=4,
+            transport=httpx.MockTransport(api),
+        ) as d360:
+            return await d360.asset_types(), await d360.assets()
+
+    api = FakeApi()
+    asset_types, assets = asyncio.run(scenario())
+
+    assert all(isinstance(asset_type, AssetType) for asset_type in asset_types)
+    assert all(isinstance(asset, Asset) for asset in assets)
+    # The USER asset type is filtered out, as in the synchronous client
+    assert [asset.asset_type_uid for asset in assets] == [
+        f"type-{i}" for i in range(ASSET_TYPE_COUNT)
+    ]
+    assert api.max_in_flight == 4
+
+
+def test_assets_and_fields_are_fetched_page_by_page():
+    def api(request: httpx.Request) -> httpx.Response:
+        page_size = int(request.url.params["pageSize"])
+        start = (int(request.url.params["pageNum"]) - 1) * page_size
+        indices = range(start, min(start + page_size, 5))
+        items: list[dict]
+        if request.url.path == "/api/v2/fields":
+            items = [
+                {
+                    "Name": f"field-{index}",
+                    "FriendlyName": f"Field {index}",
+                    "Category": "Custom",
+                    "AssetTypeUid": request.url.params["AssetTypeUid"],
+                    "Type": None,
+                }
+                for index in indices
+            ]
+        else:
+            items = [{**asset_payload("type-1"), "AssetId": index} for index in indices]
+        return httpx.Response(200, json={"items": items, "pageSize": page_size})
+
+    async def scenario():
+        async with AsyncData360Instance(
+            "https://mock-url.com", "key", "secret", transport=httpx.MockTransport(api)
+        ) as d360:
+            return (
+                await d360.get_asset_by_types_uid("type-1", page_size=2),
+                await d360.get_fields_by_asset_type_uid("type-1", page_size=2),
+            )
+
+    assets, fields = asyncio.run(scenario())
+
+    assert [asset.asset_id for asset in assets] == [0, 1, 2, 3, 4]
+    assert [field.name for field in fields] == [f"field-{i}" for i in range(5)]
@@ -0,0 +1,151 @@
+import json
+
+import requests
+
+from data360.cache import ParsedResponseMemo, ResponseCache, build_response
+from data360.client import Data360Instance
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def json_response(payload) -> requests.Response:
+    return build_response(
+        "https://example.com/api/v2/assets/types",
+        200,
+        {"Content-Type": "application/json"},
+        json.dumps(payload).encode(),
+    )
+
+
+def test_entries_expire_after_the_ttl_of_their_endpoint(tmp_path):
+    clock = FakeClock()
+    cache = ResponseCache(
+        str(tmp_path), default_ttl=60, ttls={"/assets/{uid}": 10}, clock=clock
+    )
+    cache.set("types", "/assets/types", json_response([1]))
+    cache.set("assets", "/assets/{uid}", json_response({"items": []}))
+
+    clock.now += 30
+
+    assert cache.get("types", "/assets/types").json() == [1]
+    assert cache.get("assets", "/assets/{uid}") is None
+
+
+def test_least_recently_used_entries_are_evicted_above_the_max_size(tmp_path):
+    clock = FakeClock()
+    cache = ResponseCache(str(tmp_path), max_size=30, clock=clock)
+    for key in ["a", "b"]:
+        cache.set(key, "/fields", json_response({"items": key}))  # 14 bytes each
+        clock.now += 1
+    cache.get("a", "/fields")
+    clock.now += 1
+
+    cache.set("c", "/fields", json_response({"items": "c"}))
+
+    assert cache.get("a", "/fields") is not None
+    assert cache.get("b", "/fields") is None
+    assert cache.get("c", "/fields") is not None
+
+
+def test_cache_persists_across_instances(tmp_path):
+    ResponseCache(str(tmp_path)).set("types", "/assets/types", json_response([1]))
+
+    assert ResponseCache(str(tmp_path)).get("types", "/assets/types").json() == [1]
+
+
+def test_http_request_is_served_from_the_cache_unless_refreshed(monkeypatch, tmp_path):
+    calls = []
+
+    def mock_get(session, url, headers=None, params=None, timeout=None, stream=False):
+        calls.append(params)
+        return json_response([len(calls)])
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+    client = Data360Instance(
+        "https://example.com", "key", "secret", cache=ResponseCache(str(tmp_path))
+    )
+
+    assert client.http_request("/assets/types").json() == [1]
+    assert client.http_request("/assets/types").json() == [1]
+    assert client.http_request("/assets/types", params={"Class": "Rule"}).json() == [2]
+    assert client.http_request("/assets/types", refresh=True).json() == [3]
+    assert client.http_request("/assets/types").json() == [3]
+    assert len(calls) == 3
+
+
+def test_expired_responses_are_revalidated_with_their_etag(monkeypatch, tmp_path):
+    clock = FakeClock()
+    calls = []
+    asset_types = [
+        {
+            "uid": "type",
+            "Name": "Type",
+            "Description": "string",
+            "Class": {
+                "ID": 1,
+                "Value": "Rule",
+                "Name": "Rule",
+                "Description": "string",
+                "AllowCommentsOnAsset": True,
+            },
+        }
+    ]
+
+    def mock_get(session, url, headers=None, params=None, timeout=None, stream=False):
+        calls.append(dict(headers))
+        if headers.get("If-None-Match") == '"v1"':
+            return build_response(url, 304, {"ETag": '"v1"'}, b"")
+        return build_response(
+            url, 200, {"ETag": '"v1"'}, json.dumps(asset_types).encode()
+        )
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+    client = Data360Instance(
+        "https://example.com",
+        "key",
+        "secret",
+        cache=ResponseCache(str(tmp_path), default_ttl=60, clock=clock),
+    )
+
+    first = client.get_asset_types()
+    clock.now += 120
+    second = client.get_asset_types()
+    # the entry was renewed by the 304, no request is needed within its TTL
+    third = client.get_asset_types()
+
+    assert len(calls) == 2
+    assert "If-None-Match" not in calls[0]
+    assert calls[1]["If-None-Match"] == '"v1"'
+    # the models validated from the first response are reused, in a list of their own
+    assert second == first
+    assert second is not first
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    assert third[0] is first[0]
+
+
+def test_parsed_responses_memo_is_bounded_by_its_items():
+    memo = ParsedResponseMemo(max_items=5)
+
+    def parser(response):
+        return [response.url] * int(response.url[-1])
+
+    def response(url: str):
+        return build_response(url, 200, {"ETag": '"v1"'}, b"")
+
+    first = memo.parse(response("https://example.com/3"), parser)
+    first.append("mutated")
+    again = memo.parse(response("https://example.com/3"), parser)
+    memo.parse(response("https://example.com/2"), parser)
+    memo.parse(response("https://example.com/9"), parser)
+    memo.parse(response("https://example.com/4"), parser)
+
+    # the callers get lists of their own
+    assert again == ["https://example.com/3"] * 3
+    # larger than the memo, the 9 items are not kept, and the 4 evict the 3 and the 2
+    assert memo.items == 4
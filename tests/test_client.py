@@ -1,9 +1,18 @@
+import time
+
 # import requests for the purposes of monkeypatching
 import requests
 
 from data360.client import Data360Instance as d360
-from data360.model import Asset, AssetClass, AssetClassName, AssetType, FieldAsset
-from tests.conftest import MockResponse
+from data360.model import (
+    Asset,
+    AssetClass,
+    AssetClassName,
+    AssetType,
+    FieldAsset,
+    LazyFieldAsset,
+)
+from tests.conftest import MockResponse, paged_assets_get
 from tests.model_factory import AssetTypeFactory
 
 
@@ -16,13 +25,13 @@ def test_initialization():
 def test_requests_includes_authorization_header(monkeypatch):
     call_args = []
 
-    # Mock the requests.get method
-    def mock_get(url, headers=None, params=None):
+    # Mock the requests.Session.get method
+    def mock_get(session, url, headers=None, params=None, timeout=None, stream=False):
         call_args.append(headers)
         call_args.append(params)
         return MockResponse(json_response={"mock_key": "mock_response"})
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
 
     client = d360("https://example.com", "api_key", "api_secret")
     client.http_request("/test")
@@ -31,6 +40,50 @@ def test_requests_includes_authorization_header(monkeypatch):
     assert "Authorization" in call_args[0]
 
 
+def test_requests_reuse_the_instance_session(monkeypatch):
+    sessions = []
+
+    def mock_get(session, url, headers=None, params=None, timeout=None, stream=False):
+        sessions.append((session, timeout))
+        return MockResponse(json_response={"mock_key": "mock_response"})
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+
+    client = d360("https://example.com", "api_key", "api_secret", timeout=5.0)
+    client.http_request("/first")
+    client.http_request("/second")
+
+    assert sessions == [(client.session, 5.0), (client.session, 5.0)]
+
+
+def test_session_pool_configuration():
+    client = d360(
+        "https://example.com",
+        "api_key",
+        "api_secret",
+        pool_connections=2,
+        pool_maxsize=32,
+        keep_alive=False,
+    )
+    adapter = client.session.get_adapter("https://example.com")
+
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 32
+    assert client.session.headers["Connection"] == "close"
+
+
+def test_context_manager_closes_the_session(monkeypatch):
+    closed = []
+    monkeypatch.setattr(
+        requests.Session, "close", lambda session: closed.append(session)
+    )
+
+    with d360("https://example.com", "api_key", "api_secret") as client:
+        pass
+
+    assert closed == [client.session]
+
+
 def test_get_asset_class_parsing(testing_d360, mock_get_asset_classes_response):
     asset_classes = testing_d360.get_asset_class()
 
@@ -73,3 +126,77 @@ def test_get_fields_by_asset_types(testing_d360, mock_get_fields_response):
 
     assert len(fields) >= 1
     assert all(isinstance(field, FieldAsset) for field in fields)
+
+
+def test_lazy_fields_validate_their_type_on_access(
+    testing_d360, mock_get_fields_response
+):
+    asset_type = AssetTypeFactory.build()
+    fields = testing_d360.get_fields_by_asset_type(asset_type)
+
+    lazy_fields = testing_d360.get_fields_by_asset_type(asset_type, lazy=True)
+
+    assert all(isinstance(field, LazyFieldAsset) for field in lazy_fields)
+    assert all(isinstance(field.__dict__["type"], dict) for field in lazy_fields)
+    assert [field.type for field in lazy_fields] == [field.type for field in fields]
+    assert [field.model_dump() for field in lazy_fields] == [
+        field.model_dump() for field in fields
+    ]
+
+
+def test_concurrent_fields_keep_asset_types_order(monkeypatch):
+    asset_types = [AssetTypeFactory.build(uid=f"type-{i}") for i in range(20)]
+
+    def mock_get(session, url, headers=None, params=None, timeout=None, stream=False):
+        uid = params["AssetTypeUid"]
+        # Later asset types answer first to shuffle the completion order
+        time.sleep((20 - int(uid.split("-")[1])) / 1000)
+        return MockResponse(
+            json_response={
+                "items": [
+                    {
+                        "Name": uid,
+                        "FriendlyName": uid,
+                        "Category": "string",
+                        "AssetTypeUid": uid,
+                        "Type": None,
+                    }
+                ]
+            }
+        )
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+
+    client = d360("https://example.com", "api_key", "api_secret", max_workers=8)
+    client.asset_types = asset_types
+
+    assert [field.asset_type_uid for field in client.fields] == [
+        asset_type.uid for asset_type in asset_types
+    ]
+
+
+def test_iter_assets_follows_the_pages(monkeypatch):
+    requested_params = []
+    monkeypatch.setattr(requests.Session, "get", paged_assets_get(requested_params))
+
+    client = d360("https://example.com", "api_key", "api_secret")
+    assets = list(client.iter_assets_by_type_uid("type", page_size=2))
+
+    assert [asset.asset_id for asset in assets] == [0, 1, 2, 3, 4]
+    assert [params["pageNum"] for params in requested_params] == [1, 2, 3]
+
+
+def test_iter_assets_prefetches_the_next_page(monkeypatch):
+    requested_params = []
+    monkeypatch.setattr(requests.Session, "get", paged_assets_get(requested_params))
+
+    client = d360("https://example.com", "api_key", "api_secret")
+    assets = client.iter_assets_by_type_uid("type", page_size=2, prefetch=True)
+    first_asset = next(assets)
+    # the second page is requested while the first one is being consumed
+    while len(requested_params) < 2:
+        time.sleep(0.001)
+
+    assert first_asset.asset_id == 0
+    assert [asset.asset_id for asset in assets] == [1, 2, 3, 4]
+    assert len(requested_params) == 3
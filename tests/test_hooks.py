@@ -0,0 +1,132 @@
+import contextlib
+import contextvars
+import threading
+
+import pytest
+import requests
+
+from data360.client import Data360Instance
+from data360.hooks import Hooks, OpenTelemetryHooks, RequestInfo
+from tests.conftest import MockResponse, mock_get_sequence
+from tests.model_factory import AssetTypeFactory
+
+current_span: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+class RecordingHooks(Hooks):
+    def __init__(self):
+        self.events: list[tuple] = []
+        self.spans: list[tuple[str, str | None, dict | None]] = []
+        self._lock = threading.Lock()
+
+    def on_request(self, request: RequestInfo) -> None:
+        self.events.append(("request", request.endpoint, request.attempt))
+
+    def on_response(self, request, response, seconds) -> None:
+        self.events.append(("response", request.endpoint, response.status_code))
+
+    def on_error(self, request, error, seconds) -> None:
+        self.events.append(("error", request.endpoint, type(error).__name__))
+
+    def on_validate(self, endpoint, items, seconds) -> None:
+        self.events.append(("validate", endpoint, items))
+
+    @contextlib.contextmanager
+    def span(self, name, attributes=None):
+        with self._lock:
+            self.spans.append((name, current_span.get(), attributes))
+        token = current_span.set(name + str(len(self.spans)))
+        try:
+            yield
+        finally:
+            current_span.reset(token)
+
+
+def test_hooks_are_called_around_each_attempt(monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda wait: None)
+    mock_get_sequence(
+        monkeypatch,
+        [
+            requests.ConnectionError("reset"),
+            MockResponse({}, status_code=503),
+            MockResponse([]),
+        ],
+    )
+    hooks = RecordingHooks()
+
+    client = Data360Instance("https://example.com", "key", "secret", hooks=[hooks])
+    client.get_asset_types()
+
+    assert hooks.events == [
+        ("request", "/assets/types", 1),
+        ("error", "/assets/types", "ConnectionError"),
+        ("request", "/assets/types", 2),
+        ("response", "/assets/types", 503),
+        ("request", "/assets/types", 3),
+        ("response", "/assets/types", 200),
+        ("validate", "/assets/types", 0),
+    ]
+    assert [span[0] for span in hooks.spans] == ["GET /assets/types"]
+
+
+def test_request_spans_nest_under_the_asset_types_of_the_aggregation(monkeypatch):
+    def mock_get(session, url, headers=None, params=None, timeout=None, stream=False):
+        return MockResponse({"items": []})
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+    hooks = RecordingHooks()
+    client = Data360Instance(
+        "https://example.com", "key", "secret", max_workers=4, hooks=[hooks]
+    )
+    client.asset_types = [
+        AssetTypeFactory.build(uid=f"type-{i}", name=f"Type {i}") for i in range(8)
+    ]
+
+    assert client.fields == []
+
+    fields_span = ("data360.fields", None, None)
+    assert hooks.spans[0] == fields_span
+    asset_type_spans = [span for span in hooks.spans if span[0] == "data360.asset_type"]
+    assert len(asset_type_spans) == 8
+    assert {span[1] for span in asset_type_spans} == {"data360.fields1"}
+    assert {span[2]["data360.asset_type.uid"] for span in asset_type_spans} == {
+        f"type-{i}" for i in range(8)
+    }
+    request_spans = [span for span in hooks.spans if span[0] == "GET /fields"]
+    assert len(request_spans) == 8
+    assert all(span[1].startswith("data360.asset_type") for span in request_spans)
+
+
+def test_opentelemetry_spans_nest_under_the_aggregation(monkeypatch):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    def mock_get(session, url, headers=None, params=None, timeout=None, stream=False):
+        return MockResponse({"items": []})
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    hooks = OpenTelemetryHooks(provider.get_tracer("tests"))
+    client = Data360Instance(
+        "https://example.com", "key", "secret", max_workers=2, hooks=[hooks]
+    )
+    client.asset_types = [AssetTypeFactory.build(uid="type-1")]
+
+    assert client.fields == []
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    request = spans["GET /fields"]
+    assert request.attributes["http.response.status_code"] == 200
+    assert request.parent.span_id == spans["data360.asset_type"].context.span_id
+    assert (
+        spans["data360.asset_type"].parent.span_id
+        == spans["data360.fields"].context.span_id
+    )
@@ -0,0 +1,89 @@
+import itertools
+import logging
+import threading
+
+import data360.client  # noqa: F401
+from data360.log import (
+    REQUEST_LOGGER_NAME,
+    BackgroundLogging,
+    SamplingFilter,
+    configure_logging,
+)
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+        self.threads: set[str] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+
+def make_record(name: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 0, "message", None, None)
+
+
+def test_import_configures_no_handler():
+    root = logging.getLogger()
+
+    assert not any(
+        getattr(handler, "baseFilename", "").endswith("log.txt")
+        for handler in root.handlers
+    )
+    assert all(
+        isinstance(handler, logging.NullHandler)
+        for handler in logging.getLogger("data360").handlers
+    )
+
+
+def test_sampling_filter_keeps_a_fraction_of_the_request_messages():
+    draws = itertools.cycle([0.1, 0.3, 0.6, 0.9])
+    sampling = SamplingFilter(0.5, random=lambda: next(draws))
+
+    kept = [sampling.filter(make_record(REQUEST_LOGGER_NAME)) for _ in range(8)]
+
+    assert kept == [True, True, False, False] * 2
+
+
+def test_sampling_filter_keeps_warnings_and_other_loggers():
+    sampling = SamplingFilter(0.0)
+
+    assert sampling.filter(make_record(REQUEST_LOGGER_NAME, logging.WARNING))
+    assert sampling.filter(make_record("data360.client"))
+    assert not sampling.filter(make_record(REQUEST_LOGGER_NAME + ".retries"))
+
+
+def test_records_are_written_from_a_background_thread():
+    handler = RecordingHandler()
+
+    with BackgroundLogging(handler, level=logging.INFO) as logs:
+        logging.getLogger("data360.client").info("crawl started")
+        logging.getLogger("urllib3.connectionpool").info("not ours")
+
+    assert [record.getMessage() for record in handler.records] == ["crawl started"]
+    assert threading.current_thread().name not in handler.threads
+    assert logs.queue_handler not in logging.getLogger("data360").handlers
+
+
+def test_request_messages_are_sampled(fake_api, testing_d360):
+    fake_api.route("/assets/types", [])
+    handler = RecordingHandler()
+
+    with BackgroundLogging(handler, request_sample_rate=0.0):
+        testing_d360.http_request("/assets/types")
+
+    assert handler.records == []
+
+
+def test_configure_logging_appends_to_the_file(tmp_path):
+    path = tmp_path / "data360.log"
+
+    logs = configure_logging(filename=str(path), level="DEBUG")
+    logging.getLogger(REQUEST_LOGGER_NAME).debug("Make HTTP Call: GET %s", "/fields")
+    logs.stop()
+
+    assert "DEBUG data360.requests" in path.read_text(encoding="utf-8")
+    assert "GET /fields" in path.read_text(encoding="utf-8")
@@ -0,0 +1,116 @@
+import json
+import math
+
+import requests
+from pydantic import BaseModel
+
+from data360.cache import ResponseCache, build_response
+from data360.client import Data360Instance
+from data360.metrics import Histogram, MetricsRegistry
+from data360.retry import RetryPolicy
+from tests.conftest import paged_assets_get
+
+
+class ThingModel(BaseModel):
+    name: str = ""
+
+
+def test_histogram_counts_cumulative_buckets():
+    histogram = Histogram(bounds=(0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {0.1: 2, 1.0: 3, math.inf: 4}
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == 3.65
+
+
+def test_stats_are_recorded_per_endpoint_template(monkeypatch):
+    monkeypatch.setattr(requests.Session, "get", paged_assets_get([]))
+    client = Data360Instance("https://example.com", "api_key", "api_secret")
+
+    list(client.iter_assets_by_type_uid("type-1", page_size=2))
+    list(client.iter_assets_by_type_uid("type-2", page_size=5))
+
+    stats = client.stats()
+    assert list(stats) == ["/assets/{uid}"]
+    assets = stats["/assets/{uid}"]
+    assert assets["requests"] == 4
+    assert assets["statuses"] == {200: 4}
+    assert assets["latency"]["count"] == 4
+    assert assets["bytes_received"] > 0
+    assert assets["items"] == 10
+    assert assets["validation"]["count"] == 4
+
+
+def test_stats_record_failed_attempts_and_cache_hits(monkeypatch, tmp_path):
+    statuses = iter([503, 200])
+
+    def mock_get(session, url, headers=None, params=None, timeout=None, stream=False):
+        return build_response(url, next(statuses), {}, b"[]")
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+    cache = ResponseCache(str(tmp_path))
+    client = Data360Instance(
+        "https://example.com",
+        "api_key",
+        "api_secret",
+        retry_policy=RetryPolicy(backoff_factor=0),
+        cache=cache,
+    )
+
+    client.get_asset_types()
+    client.get_asset_types()
+
+    stats = client.stats()["/assets/types"]
+    assert stats["statuses"] == {503: 1, 200: 1}
+    assert stats["bytes_received"] == 4
+    assert stats["cache_hits"] == 1
+    cache.close()
+
+
+def test_streamed_pages_count_their_bytes_and_items(monkeypatch):
+    body = json.dumps({"items": [{}, {}], "total": 2}).encode()
+
+    def mock_get(session, url, headers=None, params=None, timeout=None, stream=False):
+        return build_response(url, 200, {}, body)
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+    client = Data360Instance("https://example.com", "api_key", "api_secret")
+
+    list(client.iter_streamed_items("/things", ThingModel))
+
+    stats = client.stats()["/things"]
+    assert stats["bytes_received"] == len(body)
+    assert stats["items"] == 2
+    assert stats["validation"]["count"] == 1
+
+
+def test_prometheus_text_exposition():
+    registry = MetricsRegistry()
+    registry.record_request("/assets/{uid}", 200, 0.02, size=10)
+    registry.record_request("/assets/{uid}", "ConnectionError", 1.5)
+    registry.record_validation("/assets/{uid}", 5, 0.003)
+
+    text = registry.to_prometheus()
+
+    assert "# TYPE data360_requests_total counter" in text
+    assert 'data360_requests_total{endpoint="/assets/{uid}",status="200"} 1' in text
+    assert (
+        'data360_requests_total{endpoint="/assets/{uid}",status="ConnectionError"} 1'
+        in text
+    )
+    assert (
+        'data360_request_duration_seconds_bucket{endpoint="/assets/{uid}",le="0.025"} 1'
+        in text
+    )
+    assert (
+        'data360_request_duration_seconds_bucket{endpoint="/assets/{uid}",le="+Inf"} 2'
+        in text
+    )
+    assert 'data360_request_duration_seconds_count{endpoint="/assets/{uid}"} 2' in text
+    assert 'data360_response_bytes_total{endpoint="/assets/{uid}"} 10' in text
+    assert 'data360_items_total{endpoint="/assets/{uid}"} 5' in text
+    assert text.endswith("\n")
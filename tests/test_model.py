@@ -1,4 +1,30 @@
-from tests.model_factory import AssetTypeFactory
+import pytest
+from pydantic import ValidationError
+
+from data360.model import Asset, AssetType, FieldAsset, LazyFieldAsset, SearchFieldType
+from tests import model_factory
+from tests.model_factory import (
+    AssetFactory,
+    AssetTypeFactory,
+    PredicateFactory,
+    RelationshipTypeFactory,
+)
+
+FIELD_TYPE_FACTORIES = [
+    factory
+    for name, factory in vars(model_factory).items()
+    if name.endswith("FieldTypeFactory") and name != "DefinitionFieldTypeFactory"
+]
+
+
+def field_payload(field_type: object) -> dict:
+    return {
+        "Name": "field",
+        "FriendlyName": "Field",
+        "Category": "Custom",
+        "AssetTypeUid": "asset-type",
+        "Type": field_type,
+    }
 
 
 def test_asset_types_are_equals_when_their_name_is_equal():
@@ -21,3 +47,132 @@ def test_asset_types_are_not_equals_when_their_name_is_not_equal():
     assert not {type1} == {type2}
     assert not [type1] == [type2]
     assert not set([type1]) == set([type2])
+
+
+@pytest.mark.parametrize(
+    "factory, key, attribute",
+    [
+        (AssetFactory, "asset_uid", "name"),
+        (PredicateFactory, "uid", "name"),
+        (RelationshipTypeFactory, "uid", "state"),
+    ],
+)
+def test_models_are_equal_when_their_key_is_equal(factory, key, attribute):
+    model1 = factory.build(**{key: "uid", attribute: "A"})
+    model2 = factory.build(**{key: "uid", attribute: "B"})
+    other = factory.build(**{key: "other", attribute: "A"})
+
+    assert model1 == model2
+    assert hash(model1) == hash(model2)
+    assert {model1} == {model2}
+    assert model1 != other
+    assert {model1} - {model2, other} == set()
+
+
+def test_fields_are_equal_when_their_name_and_asset_type_are_equal():
+    field_type = model_factory.TextFieldTypeFactory.build()
+    payload = field_payload(field_type.model_dump(mode="json", by_alias=True))
+    field = FieldAsset.model_validate(payload)
+
+    renamed = FieldAsset.model_validate({**payload, "FriendlyName": "Renamed"})
+    other_asset_type = FieldAsset.model_validate({**payload, "AssetTypeUid": "other"})
+
+    assert field == renamed
+    assert {field} == {renamed}
+    assert field != other_asset_type
+    assert LazyFieldAsset.model_validate(payload) == field
+    assert hash(LazyFieldAsset.model_validate(payload)) == hash(field)
+
+
+@pytest.mark.parametrize("factory", FIELD_TYPE_FACTORIES)
+def test_field_types_are_validated_from_their_type_key(factory):
+    field_type = factory.build()
+    payload = field_payload(field_type.model_dump(mode="json", by_alias=True))
+
+    field = FieldAsset.model_validate(payload)
+
+    assert type(field.type) is type(field_type)
+    assert field.type == field_type
+    round_trip = FieldAsset.model_validate_json(field.model_dump_json(by_alias=True))
+    assert round_trip.model_dump() == field.model_dump()
+
+
+def test_field_types_without_a_known_key_are_search_field_types():
+    field = FieldAsset.model_validate(field_payload({"Unknown": {}}))
+
+    assert field.type == SearchFieldType()
+    assert FieldAsset.model_validate(field_payload(None)).type is None
+
+
+def test_field_types_are_not_degraded_to_search_field_types_when_invalid():
+    with pytest.raises(ValidationError):
+        FieldAsset.model_validate(field_payload({"Boolean": {"ColumnOrder": 1}}))
+
+
+def test_lazy_fields_validate_their_type_on_first_access_only():
+    field_type = model_factory.TextFieldTypeFactory.build()
+    payload = field_payload(field_type.model_dump(mode="json", by_alias=True))
+
+    field = LazyFieldAsset.model_validate(payload)
+
+    assert field.__dict__["type"] == payload["Type"]
+    assert field.type == field_type
+    assert field.type is field.type
+    assert field.model_dump() == FieldAsset.model_validate(payload).model_dump()
+
+
+def test_lazy_fields_raise_on_access_when_their_type_is_invalid():
+    field = LazyFieldAsset.model_validate(field_payload({"Boolean": {}}))
+
+    assert field.name == "field"
+    with pytest.raises(ValidationError):
+        field.type  # noqa: B018
+
+
+def test_lazy_fields_raise_on_access_when_their_type_is_not_a_payload():
+    payload = field_payload("garbage")
+    with pytest.raises(ValidationError):
+        FieldAsset.model_validate(payload)
+
+    field = LazyFieldAsset.model_validate(payload)
+
+    with pytest.raises(ValidationError):
+        field.type  # noqa: B018
+
+
+def test_validated_objects_share_their_fields_set_and_interned_strings():
+    def payload() -> dict:
+        # new str objects on each call, as when decoded from distinct pages
+        return {
+            "AssetId": 1,
+            "AssetUid": "asset",
+            "AssetTypeId": 1,
+            "AssetTypeUid": "".join(["asset-", "type"]),  # noqa: FLY002
+            "CreatedOn": "2025-01-01T00:00:00Z",
+            "Critical": "".join(["Y", "es"]),  # noqa: FLY002
+        }
+
+    asset1 = Asset.model_validate(payload())
+    asset2 = Asset.model_validate(payload())
+    copied = asset1.model_copy(update={"color": "Red"})
+
+    assert asset1.model_fields_set is asset2.model_fields_set
+    assert asset1.asset_type_uid is asset2.asset_type_uid
+    assert asset1.critical is asset2.critical
+    assert "color" in copied.model_fields_set
+    assert "color" not in asset2.model_fields_set
+
+
+def test_asset_types_share_their_asset_class():
+    payload = AssetTypeFactory.build().model_dump(by_alias=True)
+
+    asset_type1 = AssetType.model_validate(payload)
+    asset_type2 = AssetType.model_validate_json(
+        asset_type1.model_dump_json(by_alias=True)
+    )
+    other = AssetType.model_validate(
+        {**payload, "Class": {**payload["Class"], "ID": "other"}}
+    )
+
+    assert asset_type1.asset_class is asset_type2.asset_class
+    assert other.asset_class is not asset_type1.asset_class
@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+
+from data360.client import Data360Instance
+from data360.rate_limit import TokenBucket, shared_token_bucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.now += seconds
+
+
+def test_burst_is_served_without_waiting():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, capacity=5, clock=clock, sleep=clock.sleep)
+
+    assert [bucket.acquire() for _ in range(5)] == [0.0] * 5
+    assert bucket.acquire() == 0.1
+
+
+def test_requests_after_the_burst_are_paced_at_the_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=4, capacity=1, clock=clock, sleep=lambda seconds: None)
+
+    waits = [bucket.acquire() for _ in range(5)]
+
+    # each caller reserves the next token, so the waits grow by 1 / rate
+    assert waits == [0.0, 0.25, 0.5, 0.75, 1.0]
+
+
+def test_bucket_is_shared_across_threads():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100, capacity=10, clock=clock, sleep=lambda seconds: None)
+    waits = []
+
+    def worker():
+        for _ in range(25):
+            waits.append(bucket.acquire())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 10 tokens in the burst, then the 90 others are reserved one after the other
+    assert max(waits) == 0.9
+    assert len(set(waits)) == 91
+
+
+def test_instances_on_the_same_url_share_their_bucket():
+    first = Data360Instance("https://shared.example.com", "key", "secret", rate_limit=5)
+    second = Data360Instance(
+        "https://shared.example.com", "key", "secret", rate_limit=5
+    )
+    other = Data360Instance("https://other.example.com", "key", "secret", rate_limit=5)
+
+    assert first.rate_limiter is second.rate_limiter
+    assert first.rate_limiter is shared_token_bucket(first.url, 5)
+    assert other.rate_limiter is not first.rate_limiter
+    assert Data360Instance("https://x.com", "key", "secret").rate_limiter is None
+
+
+def test_instances_on_the_same_url_cannot_change_the_shared_bucket():
+    Data360Instance("https://limited.example.com", "key", "secret", rate_limit=5)
+
+    same = Data360Instance(
+        "https://limited.example.com", "key", "secret", rate_limit=5, rate_limit_burst=5
+    )
+    assert same.rate_limiter is shared_token_bucket(same.url, 5.0)
+    with pytest.raises(ValueError):
+        Data360Instance("https://limited.example.com", "key", "secret", rate_limit=10)
+    with pytest.raises(ValueError):
+        shared_token_bucket(same.url, 5, capacity=20)
@@ -0,0 +1,90 @@
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from data360.client import Data360Instance
+from data360.retry import RetryPolicy, parse_retry_after
+from tests.conftest import MockResponse, mock_get_sequence
+
+
+def test_backoff_is_exponential_and_capped():
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0)
+
+    for attempt, ceiling in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 5.0), (10, 5.0)]:
+        assert all(0 <= policy.backoff(attempt) <= ceiling for _ in range(50))
+
+
+def test_only_idempotent_methods_and_transient_statuses_are_retryable():
+    policy = RetryPolicy()
+
+    assert policy.is_retryable("GET", 503)
+    assert policy.is_retryable("get", None)
+    assert not policy.is_retryable("GET", 404)
+    assert not policy.is_retryable("POST", 503)
+
+
+def test_parse_retry_after():
+    in_a_minute = datetime.now(UTC) + timedelta(seconds=60)
+
+    assert parse_retry_after("3") == 3.0
+    assert 55 < parse_retry_after(format_datetime(in_a_minute, usegmt=True)) <= 60
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_http_request_retries_honouring_retry_after(monkeypatch):
+    waits = []
+    monkeypatch.setattr("time.sleep", waits.append)
+    throttled = MockResponse({}, status_code=429, headers={"Retry-After": "2"})
+    mock_get_sequence(
+        monkeypatch,
+        [throttled, requests.ConnectionError("reset"), MockResponse({"items": []})],
+    )
+
+    client = Data360Instance("https://example.com", "api_key", "api_secret")
+    response = client.http_request("/assets/types")
+
+    assert response.json() == {"items": []}
+    assert waits[0] == 2.0
+    assert throttled.closed
+    assert not response.closed
+    assert client.retry_stats.attempts == 3
+    assert client.retry_stats.retries == 2
+    assert client.retry_stats.outcomes == {429: 1, "ConnectionError": 1, 200: 1}
+
+
+def test_http_request_gives_up_after_max_attempts(monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda wait: None)
+    mock_get_sequence(monkeypatch, [MockResponse({}, status_code=503)] * 3)
+
+    client = Data360Instance(
+        "https://example.com",
+        "api_key",
+        "api_secret",
+        retry_policy=RetryPolicy(max_attempts=3),
+    )
+
+    with pytest.raises(requests.HTTPError):
+        client.http_request("/assets/types")
+    assert client.retry_stats.attempts == 3
+    assert client.retry_stats.exhausted == 1
+
+
+def test_http_request_gives_up_when_retry_after_exceeds_the_budget(monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda wait: None)
+    mock_get_sequence(
+        monkeypatch, [MockResponse({}, status_code=429, headers={"Retry-After": "60"})]
+    )
+
+    client = Data360Instance(
+        "https://example.com",
+        "api_key",
+        "api_secret",
+        retry_policy=RetryPolicy(max_retry_time=10.0),
+    )
+
+    with pytest.raises(requests.HTTPError):
+        client.http_request("/assets/types")
+    assert client.retry_stats.retries == 0
@@ -0,0 +1,115 @@
+import pytest
+
+from data360.arrow import from_record_batch, to_record_batch
+from data360.client import Data360Instance
+from data360.meta_model import MetaModel
+from data360.model import Asset
+from data360.operations import calculate_meta_model_difference
+from data360.snapshot import (
+    ASSETS_FILE,
+    load_snapshot,
+    read_parquet,
+    record_batches,
+    write_parquet,
+    write_snapshot,
+)
+from data360.table import AssetTable, FieldTable
+from data360.transport import InMemoryTransport
+from tests.conftest import paged_assets
+from tests.model_factory import (
+    AssetTypeFactory,
+    BooleanFieldTypeFactory,
+    SearchFieldTypeFactory,
+    asset,
+    field,
+)
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def test_tables_are_converted_to_and_from_record_batches():
+    assets = [
+        asset(0, Name="Hôtel €", Critical="Yes"),
+        asset(1, Path="/assets/1"),
+        asset(2, Color="Red"),
+    ]
+    table = AssetTable.from_objects(assets)
+
+    batch = to_record_batch(table)
+    sliced = from_record_batch(AssetTable, batch.slice(1))
+
+    assert batch.schema.field("asset_id").type == pa.int64()
+    assert batch.schema.field("name").type == pa.large_string()
+    assert pa.types.is_dictionary(batch.schema.field("asset_type_uid").type)
+    assert batch.column("critical").to_pylist() == ["Yes", None, None]
+    assert batch.column("path").to_pylist() == [None, "/assets/1", None]
+    assert [row.model_dump() for row in from_record_batch(AssetTable, batch)] == [
+        a.model_dump() for a in assets
+    ]
+    assert [row.model_dump() for row in sliced] == [a.model_dump() for a in assets[1:]]
+    assert to_record_batch(table.view([2, 0])).column("asset_id").to_pylist() == [2, 0]
+
+
+def test_objects_are_written_to_parquet_a_batch_at_a_time(tmp_path):
+    fields = [
+        field(index, BooleanFieldTypeFactory.build() if index % 2 else None)
+        for index in range(9)
+    ] + [field(9, SearchFieldTypeFactory.build())]
+    path = tmp_path / "fields.parquet"
+
+    batches = list(record_batches(FieldTable, iter(fields), batch_size=4))
+    rows = write_parquet(path, FieldTable, iter(fields), batch_size=4)
+    table = read_parquet(path, FieldTable)
+
+    assert [batch.num_rows for batch in batches] == [4, 4, 2]
+    assert rows == 10
+    assert pq.ParquetFile(path).metadata.num_row_groups == 3
+    assert pq.read_schema(path).field("type_is_editable").type == pa.bool_()
+    assert [row.model_dump() for row in table] == [f.model_dump() for f in fields]
+    assert table.column("asset_type_uid") == [f"type-{i % 2}" for i in range(10)]
+
+
+def test_snapshots_are_diffed_offline(tmp_path):
+    asset_types = [AssetTypeFactory.build(uid=f"type-{i}") for i in range(3)]
+    api = InMemoryTransport(
+        {
+            "/assets/types": [
+                asset_type.model_dump(mode="json", by_alias=True)
+                for asset_type in asset_types
+            ],
+            "/assets/{uid}": paged_assets,
+            "/fields": lambda params: {
+                "items": [
+                    field(0, BooleanFieldTypeFactory.build())
+                    .model_copy(update={"asset_type_uid": params["AssetTypeUid"]})
+                    .model_dump(mode="json", by_alias=True)
+                ]
+            },
+        }
+    )
+
+    with Data360Instance(
+        "https://example.com", "key", "secret", transport=api
+    ) as client:
+        write_snapshot(client, tmp_path, batch_size=4)
+        assets = client.assets
+        fields = client.fields
+    snapshot = load_snapshot(tmp_path)
+    difference = calculate_meta_model_difference(
+        snapshot.meta_model(), MetaModel(asset_types=asset_types[1:])
+    )
+
+    assert pq.ParquetFile(tmp_path / ASSETS_FILE).metadata.num_row_groups == 4
+    assert [row.model_dump() for row in snapshot.asset_types] == [
+        a.model_dump() for a in asset_types
+    ]
+    assert [row.model_dump() for row in snapshot.assets] == [
+        a.model_dump() for a in assets
+    ]
+    assert isinstance(snapshot.assets[0], Asset)
+    assert [row.model_dump() for row in snapshot.fields] == [
+        f.model_dump() for f in fields
+    ]
+    assert difference.asset_types_to_be_added == [asset_types[0]]
+    assert difference.asset_types_to_be_deleted == []
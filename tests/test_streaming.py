@@ -0,0 +1,100 @@
+import json
+
+import pytest
+import requests
+
+from data360.cache import build_response
+from data360.client import Data360Instance
+from data360.retry import RetryPolicy
+from data360.streaming import StreamedJsonArray
+from tests.conftest import MockResponse
+
+PAGE = {
+    "pageSize": 3,
+    "links": {"next": [1, {"cursor": "}]"}]},
+    "items": [
+        {"Name": 'quote " and brace }', "Values": [1, {"Nested": "]"}]},
+        {"Name": "escaped \\ backslash, comma"},
+        {},
+    ],
+    "name": 'comma, and "quotes"',
+    "total": 42,
+}
+
+
+def chunked(content: bytes, size: int) -> list[bytes]:
+    return [content[i : i + size] for i in range(0, len(content), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+def test_items_are_read_whatever_the_chunk_boundaries(chunk_size):
+    content = json.dumps(PAGE).encode()
+    array = StreamedJsonArray(chunked(content, chunk_size))
+
+    assert [json.loads(item) for item in array] == PAGE["items"]
+    assert array.metadata == {
+        "pageSize": 3,
+        "name": 'comma, and "quotes"',
+        "total": 42,
+    }
+
+
+def test_top_level_array_items_are_read():
+    content = json.dumps([{"a": 1}, {"b": [2, 3]}]).encode()
+
+    assert list(StreamedJsonArray(chunked(content, 2), key=None)) == [
+        b'{"a": 1}',
+        b'{"b": [2, 3]}',
+    ]
+
+
+def test_iter_assets_streams_every_page(monkeypatch):
+    requested = []
+
+    def mock_get(session, url, headers=None, params=None, timeout=None, stream=False):
+        requested.append((params["pageNum"], stream))
+        start = (params["pageNum"] - 1) * params["pageSize"]
+        items = [
+            {
+                "AssetId": index,
+                "AssetUid": f"asset-{index}",
+                "AssetTypeId": 1,
+                "AssetTypeUid": "type",
+                "CreatedOn": "2025-02-06T16:25:44.717Z",
+            }
+            for index in range(start, min(start + params["pageSize"], 5))
+        ]
+        # the total comes after the items, as the envelope may be in any order
+        body = json.dumps({"items": items, "total": 5}).encode()
+        return build_response(url, 200, {}, body)
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+
+    client = Data360Instance("https://example.com", "api_key", "api_secret")
+    assets = client.iter_assets_by_type_uid("type", page_size=2, stream=True)
+
+    assert [asset.asset_id for asset in assets] == [0, 1, 2, 3, 4]
+    assert requested == [(1, True), (2, True), (3, True)]
+
+
+@pytest.mark.parametrize("status_code", [404, 503])
+def test_streamed_error_responses_are_closed(monkeypatch, status_code):
+    responses = []
+
+    def mock_get(session, url, headers=None, params=None, timeout=None, stream=False):
+        responses.append(MockResponse({"message": "Error"}, status_code))
+        assert stream
+        return responses[-1]
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+
+    client = Data360Instance(
+        "https://example.com",
+        "api_key",
+        "api_secret",
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+    with pytest.raises(requests.HTTPError):
+        list(client.iter_assets_by_type_uid("type", stream=True))
+
+    assert [response.closed for response in responses] == [True]
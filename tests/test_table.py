@@ -0,0 +1,295 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from data360.client import Data360Instance
+from data360.model import LazyFieldAsset
+from data360.table import AssetTable, AssetTypeTable, FieldTable
+from data360.transport import InMemoryTransport
+from tests.conftest import paged_assets
+from tests.model_factory import (
+    AssetFactory,
+    AssetTypeFactory,
+    BooleanFieldTypeFactory,
+    DecimalFieldTypeFactory,
+    LookupFieldTypeFactory,
+    SearchFieldTypeFactory,
+    asset,
+    field,
+)
+
+
+def test_rows_are_the_assets_added():
+    assets = [
+        AssetFactory.build(),
+        AssetFactory.build(name="Hôtel €", path=None, critical=None),
+        asset(2),
+    ]
+
+    table = AssetTable.from_objects(assets)
+
+    assert len(table) == 3
+    assert list(table) == assets
+    assert [row.model_dump() for row in table] == [a.model_dump() for a in assets]
+    assert table[1].model_dump() == assets[1].model_dump()
+    assert table[-1].model_dump() == assets[2].model_dump()
+    assert table.column("name") == [a.name for a in assets]
+    with pytest.raises(IndexError):
+        table[3]
+
+
+def test_tables_are_concatenated_with_their_dictionaries():
+    first = AssetTable.from_objects(asset(index) for index in range(4))
+    second = AssetTable.from_objects(
+        asset(index, Critical="Yes") for index in range(4, 10)
+    )
+
+    table = AssetTable.concat([first, second])
+
+    assert [row.asset_id for row in table] == list(range(10))
+    assert table.column("asset_type_uid") == [f"type-{i % 3}" for i in range(10)]
+    assert table.column("critical") == [None] * 4 + ["Yes"] * 6
+    assert [row.model_dump() for row in table] == [
+        row.model_dump() for t in (first, second) for row in t
+    ]
+
+
+def test_views_share_the_columns_until_compacted():
+    table = AssetTable.from_objects(asset(index) for index in range(10))
+
+    view = table.view([9, 0, 5, 7]).view([3, 0, 2])
+    compacted = view.compact()
+
+    assert [row.asset_id for row in view] == [7, 9, 5]
+    assert view[-1].model_dump() == table[5].model_dump()
+    assert view.column("asset_uid") == ["asset-7", "asset-9", "asset-5"]
+    assert compacted.selection is None
+    assert [row.model_dump() for row in compacted] == [row.model_dump() for row in view]
+    assert [row.asset_id for row in AssetTable.concat([view, table.view([1])])] == [
+        7,
+        9,
+        5,
+        1,
+    ]
+    with pytest.raises(ValueError):
+        view.append(asset(10))
+    compacted.append(asset(10))
+    assert len(compacted) == 4
+    assert len(table) == 10
+
+
+def test_assets_are_filtered_by_asset_type_criticality_and_dates():
+    table = AssetTable.from_objects(
+        asset(index, Critical="Yes" if index % 2 else None) for index in range(10)
+    )
+    asset_type = AssetTypeFactory.build(uid="type-1")
+
+    by_type = table.filter_asset_types(asset_type, "type-2")
+    critical = table.filter_critical("Yes")
+    not_critical = table.filter_critical(None)
+    created = table.filter_dates(
+        datetime(2025, 1, 3, 12, tzinfo=UTC), datetime(2025, 1, 6, 12)
+    )
+    chained = by_type.filter_critical("Yes").filter_dates(
+        end=datetime(2025, 1, 6, 13, 30, tzinfo=timezone(timedelta(hours=2)))
+    )
+
+    assert [row.asset_id for row in by_type] == [1, 2, 4, 5, 7, 8]
+    assert [row.asset_id for row in critical] == [1, 3, 5, 7, 9]
+    assert [row.asset_id for row in not_critical] == [0, 2, 4, 6, 8]
+    assert [row.asset_id for row in created] == [2, 3, 4]
+    # 11:30 in UTC, before the creation of the asset 5
+    assert [row.asset_id for row in chained] == [1]
+    assert len(table.filter_dates(column="updated_on")) == 0
+
+
+def test_only_dictionary_columns_are_selected():
+    table = AssetTable.from_objects([asset(0)])
+
+    with pytest.raises(TypeError):
+        table.select("asset_uid", lambda value: True)
+
+
+def test_any_column_is_filtered_row_by_row():
+    table = AssetTable.from_objects(asset(index) for index in range(10))
+
+    view = table.view([9, 4, 3, 0]).where(
+        "asset_uid", {"asset-3", "asset-9"}.__contains__
+    )
+
+    assert [row.asset_id for row in view] == [9, 3]
+
+
+def test_asset_table_holds_the_assets_of_the_crawl():
+    asset_types = [AssetTypeFactory.build(uid=f"type-{i}") for i in range(4)]
+    api = InMemoryTransport(
+        {
+            "/assets/types": [
+                asset_type.model_dump(mode="json", by_alias=True)
+                for asset_type in asset_types
+            ],
+            "/assets/{uid}": paged_assets,
+        }
+    )
+
+    with Data360Instance(
+        "https://example.com", "key", "secret", max_workers=4, transport=api
+    ) as client:
+        table = client.asset_table
+        assets = client.assets
+
+    assert [row.model_dump() for row in table] == [
+        asset.model_dump() for asset in assets
+    ]
+    assert len(table.filter_asset_types(assets[0].asset_type_uid)) == 5
+
+
+def test_field_table_holds_the_fields_of_the_crawl():
+    asset_types = [AssetTypeFactory.build(uid=f"type-{i}") for i in range(3)]
+    api = InMemoryTransport(
+        {
+            "/assets/types": [
+                asset_type.model_dump(mode="json", by_alias=True)
+                for asset_type in asset_types
+            ],
+            "/fields": lambda params: {
+                "items": [
+                    {
+                        "Name": f"field-{index}",
+                        "FriendlyName": f"Field {index}",
+                        "Category": "Custom",
+                        "AssetTypeUid": params["AssetTypeUid"],
+                        "Type": {"Prefix": "#"},
+                    }
+                    for index in range(2)
+                ]
+            },
+        }
+    )
+
+    with Data360Instance(
+        "https://example.com", "key", "secret", max_workers=2, transport=api
+    ) as client:
+        table = client.field_table
+        fields = client.fields
+
+    assert [row.model_dump() for row in table] == [
+        field.model_dump() for field in fields
+    ]
+    assert table.column("type") == ["Search"] * 6
+
+
+def test_field_types_are_flattened_into_columns():
+    fields = [
+        field(0, BooleanFieldTypeFactory.build()),
+        field(1, DecimalFieldTypeFactory.build()),
+        field(2, LookupFieldTypeFactory.build()),
+        field(3, SearchFieldTypeFactory.build(prefix="#")),
+        field(4, None),
+    ]
+    lazy = LazyFieldAsset.model_validate(
+        field(5, BooleanFieldTypeFactory.build()).model_dump(by_alias=True)
+    )
+
+    table = FieldTable.from_objects([*fields, lazy])
+
+    assert table.column("type") == [
+        "Boolean",
+        "Decimal",
+        "Lookup",
+        "Search",
+        None,
+        "Boolean",
+    ]
+    assert table.column("type_increment")[:2] == [
+        None,
+        fields[1].type.decimal.increment,
+    ]
+    assert table.column("type_prefix")[3:5] == ["#", None]
+    # the nested attributes are read as their JSON, and validated when the rows are built
+    assert table.column("type_validation")[0] == fields[
+        0
+    ].type.boolean.validation.model_dump(mode="json", by_alias=True)
+    assert [row.model_dump() for row in table] == [
+        item.model_dump() for item in [*fields, lazy]
+    ]
+    assert table[2].type == fields[2].type
+
+
+def test_asset_types_keep_their_class_and_icon_style():
+    asset_types = [
+        AssetTypeFactory.build(icon_style={"Color": "#fff"}),
+        AssetTypeFactory.build(icon_style=None),
+    ]
+
+    table = AssetTypeTable.from_objects(asset_types)
+
+    assert [row.model_dump() for row in table] == [
+        asset_type.model_dump() for asset_type in asset_types
+    ]
+    assert table.column("icon_style") == [{"Color": "#fff"}, None]
+
+
+def test_tables_are_converted_to_pandas_frames(monkeypatch):
+    pytest.importorskip("pandas")
+    import numpy as np
+
+    import data360.arrow
+
+    table = AssetTable.from_objects(
+        asset(index, Critical="Yes" if index % 2 else None, Name=f"Asset {index}")
+        for index in range(6)
+    )
+    fields = FieldTable.from_objects(
+        [
+            field(0, BooleanFieldTypeFactory.build()),
+            field(1, DecimalFieldTypeFactory.build()),
+        ]
+    )
+
+    frame = table.to_pandas()
+    view = table.filter_critical("Yes").to_pandas()
+    field_frame = fields.to_pandas()
+
+    assert list(frame.columns) == list(table.columns)
+    assert frame["asset_type_uid"].dtype == "category"
+    assert list(frame["asset_type_uid"].cat.categories) == [
+        "type-0",
+        "type-1",
+        "type-2",
+    ]
+    assert frame["critical"].isna().tolist() == [True, False] * 3
+    assert frame["name"].tolist() == [f"Asset {index}" for index in range(6)]
+    # the numbers are shared with the table rather than copied
+    assert np.shares_memory(
+        frame["asset_id"].to_numpy(), np.frombuffer(table.columns["asset_id"].values)
+    )
+    assert view["asset_id"].tolist() == [1, 3, 5]
+    assert field_frame["type"].tolist() == ["Boolean", "Decimal"]
+    assert field_frame["type_increment"].dtype == "Float64"
+    assert field_frame["type_is_editable"].dtype == "boolean"
+    assert field_frame["type_increment"].isna().tolist() == [True, False]
+    assert isinstance(field_frame["type_validation"][0], str)
+
+    def no_pyarrow():
+        raise ImportError("no pyarrow")
+
+    # without pyarrow, the strings are decoded into objects
+    monkeypatch.setattr(data360.arrow, "import_pyarrow", no_pyarrow)
+    assert table.to_pandas()["name"].tolist() == frame["name"].tolist()
+
+
+def test_tables_are_converted_to_polars_frames():
+    pl = pytest.importorskip("polars")
+    pytest.importorskip("pyarrow")
+    table = AssetTable.from_objects(
+        asset(index, Critical="Yes" if index % 2 else None) for index in range(6)
+    )
+
+    frame = table.filter_critical("Yes").to_polars()
+
+    assert frame.columns == list(table.columns)
+    assert frame.schema["asset_type_uid"] == pl.Categorical
+    assert frame["asset_id"].to_list() == [1, 3, 5]
+    assert frame["critical"].to_list() == ["Yes"] * 3
+    assert frame["path"].null_count() == 3
@@ -0,0 +1,155 @@
+import json
+import time
+
+import pytest
+import requests
+
+from data360.cache import build_response
+from data360.client import Data360Instance
+from data360.transport import InMemoryTransport, RecordReplayTransport, Transport
+from tests.conftest import paged_assets
+from tests.model_factory import AssetTypeFactory
+
+
+def test_routes_match_the_endpoint_templates():
+    api = InMemoryTransport({"/assets/types": [], "/assets/{uid}": paged_assets})
+
+    response = api.send(
+        "https://example.com/api/v2/assets/type-1",
+        {},
+        {"pageSize": 2, "pageNum": 3},
+    )
+
+    assert response.json()["items"][0]["AssetUid"] == "type-1-asset-4"
+    assert (
+        response.url == "https://example.com/api/v2/assets/type-1?pageSize=2&pageNum=3"
+    )
+    assert api.send("https://example.com/api/v2/assets/types", {}, {}).json() == []
+    assert api.requests == [
+        ("/assets/type-1", {"pageSize": 2, "pageNum": 3}),
+        ("/assets/types", {}),
+    ]
+
+
+def test_unknown_routes_answer_not_found(testing_d360):
+    with pytest.raises(requests.HTTPError, match="404 Client Error: Not Found"):
+        testing_d360.http_request("/unknown")
+
+
+def test_latency_is_simulated_for_each_request():
+    waits = []
+    api = InMemoryTransport(
+        {"/fields": {"items": []}}, latency=0.25, sleep=waits.append
+    )
+
+    client = Data360Instance("https://example.com", "key", "secret", transport=api)
+    client.get_fields_by_asset_type_uid("type-1")
+    client.get_fields_by_asset_type_uid("type-2")
+
+    assert waits == [0.25, 0.25]
+
+
+def test_full_client_stack_runs_concurrently_in_memory():
+    api = InMemoryTransport({"/assets/{uid}": paged_assets}, latency=0.01)
+    asset_types = [AssetTypeFactory.build(uid=f"type-{i}") for i in range(8)]
+
+    with Data360Instance(
+        "https://example.com", "key", "secret", max_workers=8, transport=api
+    ) as client:
+        started = time.perf_counter()
+        assets_by_type = client.map_asset_types(
+            lambda asset_type: list(
+                client.iter_assets_by_type_uid(asset_type.uid, page_size=2)
+            ),
+            asset_types,
+        )
+        elapsed = time.perf_counter() - started
+
+    assert [assets[0].asset_type_uid for assets in assets_by_type] == [
+        asset_type.uid for asset_type in asset_types
+    ]
+    assert sum(len(assets) for assets in assets_by_type) == 40
+    assert client.stats()["/assets/{uid}"]["requests"] == 24
+    # 3 sequential pages per asset type, the asset types in parallel
+    assert elapsed < 24 * 0.01
+
+
+def test_literal_routes_are_matched_before_templated_ones():
+    api = InMemoryTransport(
+        {
+            "/assets/{uid}": lambda params, uid: {"uid": uid},
+            "/assets/types": [{"uid": "type-1"}],
+            "/assets/classes": [],
+        }
+    )
+
+    def get(path: str) -> object:
+        return api.send("https://example.com/api/v2" + path, {}, {}).json()
+
+    assert get("/assets/types") == [{"uid": "type-1"}]
+    assert get("/assets/classes") == []
+    assert get("/assets/type-1") == {"uid": "type-1"}
+
+
+def test_routes_added_later_keep_the_matching_order():
+    api = InMemoryTransport({"/assets/{uid}": lambda params, uid: {"uid": uid}})
+    api.route("/assets/types", [{"uid": "type-1"}])
+
+    response = api.send("https://example.com/api/v2/assets/types", {}, {})
+
+    assert response.json() == [{"uid": "type-1"}]
+
+
+def test_transports_without_send_cannot_be_created():
+    class IncompleteTransport(Transport):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteTransport()
+
+
+def test_recordings_keep_the_cached_headers_and_binary_bodies(tmp_path):
+    path = str(tmp_path / "recordings.json")
+    body = b"\xff\xfe binary"
+    headers = {"ETag": '"v1"', "Set-Cookie": "session=secret", "X-Session": "secret"}
+    recorder = RecordReplayTransport(
+        path,
+        InMemoryTransport(
+            {"/export": lambda params: build_response("", 200, headers, body)}
+        ),
+    )
+    recorder.send("https://example.com/api/v2/export", {}, {})
+    recorder.close()
+
+    replayed = RecordReplayTransport(path).send(
+        "https://example.com/api/v2/export", {}, {}
+    )
+
+    assert replayed.content == body
+    assert dict(replayed.headers) == {"ETag": '"v1"'}
+    with open(path, encoding="utf-8") as file:
+        assert "secret" not in file.read()
+
+
+def test_recorded_responses_are_replayed_offline(tmp_path):
+    path = str(tmp_path / "recordings.json")
+    recorder = RecordReplayTransport(
+        path, InMemoryTransport({"/assets/{uid}": paged_assets})
+    )
+    with Data360Instance(
+        "https://example.com", "key", "secret", transport=recorder
+    ) as client:
+        recorded = client.get_asset_by_types_uid("type-1")
+
+    replayer = RecordReplayTransport(path)
+    client = Data360Instance("https://example.com", "key", "secret", transport=replayer)
+
+    assert [a.model_dump() for a in client.get_asset_by_types_uid("type-1")] == [
+        a.model_dump() for a in recorded
+    ]
+    with pytest.raises(LookupError):
+        client.get_asset_by_types_uid("type-2")
+    with open(path, encoding="utf-8") as file:
+        recordings = json.load(file)
+    assert len(recordings) == 1
+    assert "secret" not in json.dumps(recordings)